@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'LINKEDIN.settings')
 
 application = get_asgi_application()
+
+# Pick up tasks that were still queued or running when the server last stopped
+from PROJECT.views import task_queue  # noqa: E402
+
+task_queue.resume()
@@ -10,11 +10,17 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from dotenv import load_dotenv
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The toggles below read the environment, so .env has to be loaded first
+load_dotenv(BASE_DIR / ".env")
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -41,6 +47,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "PROJECT.middleware.server_timing_middleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -124,3 +131,134 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Shared on-disk LinkedIn profile cache, readable by every worker on the host.
+# Profiles are fresh for TTL seconds and served stale (while refreshing in the
+# background) until STALE_TTL.
+PROFILE_CACHE = {
+    "PATH": BASE_DIR / "profile_cache.sqlite3",
+    "MAX_BYTES": 64 * 1024 * 1024,
+    "TTL": 3600,
+    "STALE_TTL": 7 * 24 * 3600,
+}
+
+# Content-addressed cache of LLM responses (analysis, recommendations, ATS
+# resumes). Set LLM_CACHE_ENABLED=0 to always call the APIs.
+LLM_CACHE = {
+    "ENABLED": os.getenv("LLM_CACHE_ENABLED", "1") == "1",
+    "PATH": BASE_DIR / "llm_cache.sqlite3",
+    "MAX_BYTES": 128 * 1024 * 1024,
+    "TTL": 24 * 3600,
+}
+
+# Local task queue for slow work (LinkedIn fetches, LLM calls, job scraping,
+# PDF rendering). WORKERS bounds the worker threads per task type.
+TASK_QUEUE = {
+    "PATH": BASE_DIR / "tasks.sqlite3",
+    # Finished tasks (payloads and results included) are deleted after this
+    "RETENTION": 24 * 3600,
+    "WORKERS": {
+        "fetch_profile": 2,
+        "ai_analysis": 4,
+        "job_listings": 2,
+        "ats_pdf": 2,
+        "bulk_analysis": 1,
+    },
+}
+
+# Bulk profile analysis (manage.py analyze_profiles, api/bulk-analysis/).
+# WORKERS profiles run at once; each upstream gets at most CONCURRENCY calls
+# in flight and PER_MINUTE calls started a minute (0 = unlimited).
+BULK_ANALYSIS = {
+    # api/bulk-analysis/ is off unless enabled, and then staff-only
+    "API_ENABLED": os.getenv("BULK_ANALYSIS_API", "0") == "1",
+    "DIR": BASE_DIR / "bulk_analysis",
+    "MAX_URLS": 2000,
+    "WORKERS": 8,
+    "LEASE": 12 * 3600,
+    "UPSTREAMS": {
+        "linkedin": {"CONCURRENCY": int(os.getenv("LINKEDIN_POOL_SIZE", "2")), "PER_MINUTE": 30},
+        "openai": {"CONCURRENCY": 4, "PER_MINUTE": 120},
+        "gemini": {"CONCURRENCY": 4, "PER_MINUTE": 120},
+    },
+}
+
+# Blob store for large session payloads. Sessions keep only references, so
+# the session table stays small and is rewritten only when a value changes.
+SESSION_PAYLOADS = {
+    "PATH": BASE_DIR / "session_payloads.sqlite3",
+    "MAX_BYTES": 256 * 1024 * 1024,
+    "TTL": 14 * 24 * 3600,
+}
+
+# ATS resume PDF rendering: on-disk cache of rendered PDFs keyed by HTML hash
+# and a capped pool of WeasyPrint render threads.
+PDF_RENDERING = {
+    "CACHE_DIR": BASE_DIR / "pdf_cache",
+    "MAX_BYTES": 256 * 1024 * 1024,
+    "WORKERS": 2,
+    "TIMEOUT": 60,
+}
+
+# Local store of scraped job postings. Searches scraped within MAX_AGE
+# seconds are answered from it; older ones only scrape newer postings.
+JOB_STORE = {
+    "PATH": BASE_DIR / "jobs.sqlite3",
+    "MAX_AGE": 6 * 3600,
+}
+
+# Job search fan-out over the recommended titles x locations. CONCURRENCY
+# searches run at once (each scrapes its boards in parallel), and whatever
+# finished within DEADLINE seconds is ranked and returned PAGE_SIZE at a time.
+# With PREFETCH the searches start as soon as Gemini has streamed the job
+# titles and locations, while it is still writing the rest of its answer.
+# MATCH_WEIGHT is the share of the profile match in the order of a listing;
+# the rest is the search ranking (search rank, related domains, recency).
+JOB_SEARCH = {
+    "MAX_TITLES": 3,
+    "MAX_LOCATIONS": 2,
+    "CONCURRENCY": 3,
+    "DEADLINE": 30,
+    "PAGE_SIZE": 20,
+    "PREFETCH": os.getenv("JOB_PREFETCH", "1") == "1",
+    "MATCH_WEIGHT": float(os.getenv("JOB_MATCH_WEIGHT", "0.6")),
+}
+
+# Optional export of every scrape: "off", "jsonl", "parquet" or "csv". Files
+# are written in the background under DIR/date=YYYY-MM-DD/, one per scrape.
+JOB_EXPORT = {
+    "FORMAT": os.getenv("JOB_EXPORT_FORMAT", "off"),
+    "DIR": BASE_DIR / "job_exports",
+}
+
+# ATS resume chat: turns kept verbatim in the session, older ones are summarized
+ATS_CHAT = {
+    "MAX_TURNS": int(os.getenv("ATS_CHAT_MAX_TURNS", "10")),
+}
+
+# Speculative analysis: once a profile is loaded, run the AI analysis,
+# recommendations and first job searches in the background, kept for TTL
+# seconds per session. Off by default since it spends LLM calls on users
+# who may never open the analysis page.
+SPECULATION = {
+    "ENABLED": os.getenv("SPECULATIVE_ANALYSIS", "0") == "1",
+    "TTL": int(os.getenv("SPECULATIVE_ANALYSIS_TTL", "600")),
+    "WORKERS": 4,
+}
+
+# Database sessions with load/save instrumented (see INSTRUMENTATION)
+SESSION_ENGINE = "PROJECT.session_backend"
+
+# Hot-path spans, latency histograms (api/metrics/) and Server-Timing headers.
+# Off by default; SAMPLE_RATE is the fraction of requests traced when on.
+INSTRUMENTATION = {
+    "ENABLED": os.getenv("INSTRUMENTATION_ENABLED", "0") == "1",
+    "SAMPLE_RATE": float(os.getenv("INSTRUMENTATION_SAMPLE_RATE", "1.0")),
+    "KEEP_TRACES": 50,
+}
+
+# api/metrics/ and api/linkedin-pool-stats/ answer staff users and these
+# client addresses only (comma-separated METRICS_ALLOWED_IPS); others get 404
+INTERNAL_IPS = [
+    ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",") if ip.strip()
+]
@@ -4,3 +4,22 @@ from django.apps import AppConfig
 class ProjectConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'PROJECT'
+
+    def ready(self):
+        from django.conf import settings
+        from django.core.exceptions import ImproperlyConfigured
+
+        from .instrumentation import tracer
+        from .job_export import FORMATS
+
+        # Checked here so a typo fails at startup, not inside every job search
+        if settings.JOB_EXPORT["FORMAT"] not in FORMATS:
+            raise ImproperlyConfigured(
+                f"JOB_EXPORT_FORMAT={settings.JOB_EXPORT['FORMAT']!r}, expected one of {FORMATS}"
+            )
+
+        tracer.configure(
+            settings.INSTRUMENTATION["ENABLED"],
+            sample_rate=settings.INSTRUMENTATION["SAMPLE_RATE"],
+            keep_traces=settings.INSTRUMENTATION["KEEP_TRACES"],
+        )
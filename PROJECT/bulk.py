@@ -0,0 +1,232 @@
+import contextlib
+import csv
+import io
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .concurrency import Throttle
+
+logger = logging.getLogger(__name__)
+
+# Column (CSV) or field (JSONL) names that hold the profile URL
+URL_FIELDS = ("linkedin_url", "profile_url", "url")
+
+
+def parse_urls(text: str, fmt: str = "csv") -> List[str]:
+    """
+    LinkedIn URLs from CSV or JSONL text.
+
+    CSV uses the first of URL_FIELDS found in the header row, or else the
+    first column. JSONL lines are objects with one of URL_FIELDS, or plain
+    JSON strings.
+    """
+    urls = []
+    if fmt == "jsonl":
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if isinstance(item, dict):
+                item = next((item[name] for name in URL_FIELDS if item.get(name)), "")
+            urls.append(str(item))
+    else:
+        rows = [row for row in csv.reader(io.StringIO(text)) if row]
+        if not rows:
+            return []
+        header = [cell.strip().lower() for cell in rows[0]]
+        column = next((header.index(name) for name in URL_FIELDS if name in header), None)
+        if column is None:
+            # No known header: first column, skipping a header row that isn't a URL
+            column = 0
+            if "/" not in rows[0][0]:
+                rows = rows[1:]
+        else:
+            rows = rows[1:]
+        urls = [row[column] for row in rows if len(row) > column]
+    return [url.strip() for url in urls if url.strip()]
+
+
+def read_urls(path: str) -> List[str]:
+    """parse_urls for a file; ``.jsonl``/``.json`` files are JSONL, anything else CSV"""
+    fmt = "jsonl" if path.lower().endswith((".jsonl", ".json")) else "csv"
+    with open(path, encoding="utf-8-sig") as f:
+        return parse_urls(f.read(), fmt)
+
+
+def completed_urls(output_path: str) -> Set[str]:
+    """URLs the results file (which doubles as the checkpoint) has a final record for"""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash; that URL runs again
+                continue
+            # Failed URLs run again; invalid ones would only fail the same way
+            if record.get("status") in ("ok", "invalid"):
+                done.add(record["url"])
+    return done
+
+
+class BulkAnalyzer:
+    """
+    Run many LinkedIn URLs through the web flow's pipeline: extract the
+    username, fetch the profile, then the AI analysis and job recommendations.
+
+    ``workers`` profiles are processed at once. Each upstream call goes
+    through its Throttle in ``throttles`` ("linkedin", "openai", "gemini"),
+    except calls the profile or LLM cache answers. Results are appended to a
+    JSONL file one record per URL as they finish; rerunning with the same
+    file skips the URLs that already succeeded.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        throttles: Dict[str, Throttle],
+        workers: int = 8,
+        profile_cached: Optional[Callable[[str], bool]] = None,
+        thread_initializer: Optional[Callable[[], Any]] = None,
+    ):
+        self.service = service
+        self.throttles = throttles
+        self.workers = workers
+        self.profile_cached = profile_cached or (lambda username: False)
+        self.thread_initializer = thread_initializer
+
+    def _throttled(self, upstream: str, cached: bool):
+        return contextlib.nullcontext() if cached else self.throttles[upstream]
+
+    def _llm(self, upstream: str, fn: Callable, linkedin_data: Dict[str, Any]) -> Any:
+        """Call a cached LLM function, only taking an upstream slot on a cache miss"""
+        value = fn.lookup(linkedin_data)
+        if value is not None:
+            return value
+        with self.throttles[upstream]:
+            value = fn(linkedin_data, bypass_cache=True)
+        fn.save(value, linkedin_data)
+        return value
+
+    def analyze(self, url: str) -> Dict[str, Any]:
+        """One results record for ``url``; failures are recorded, not raised"""
+        started = time.monotonic()
+        record: Dict[str, Any] = {"url": url, "username": None, "status": "error"}
+        try:
+            username = self.service.extract_linkedin_username(url)
+            if not username:
+                record.update(status="invalid", error="Invalid LinkedIn URL")
+                return record
+            record["username"] = username
+
+            with self._throttled("linkedin", self.profile_cached(username)):
+                linkedin_data = self.service.fetch_linkedin_profile(username)
+            profile = linkedin_data.get("profile", {})
+            record["name"] = " ".join(
+                filter(None, [profile.get("firstName"), profile.get("lastName")])
+            )
+            record["headline"] = profile.get("headline")
+
+            analysis = self._llm("openai", self.service.generate_ai_analysis, linkedin_data)
+            recommendations = self._llm(
+                "gemini", self.service.generate_job_recommendations, linkedin_data
+            )
+            record["analysis"] = analysis["analysis"]
+            record["job_recommendations"] = recommendations
+
+            errors = []
+            if not analysis["success"]:
+                errors.append(analysis["analysis"])
+            if recommendations is None:
+                errors.append("Job recommendations failed")
+            if errors:
+                record["error"] = "; ".join(errors)
+            else:
+                record["status"] = "ok"
+        except Exception as e:
+            logger.error(f"Bulk analysis failed for {url}: {str(e)}")
+            record["error"] = str(e)
+        record["seconds"] = round(time.monotonic() - started, 2)
+        return record
+
+    def run(
+        self,
+        urls: Iterable[str],
+        output_path: str,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Analyze ``urls`` into ``output_path``, resuming from what it already
+        holds. ``progress`` gets a summary every ``progress_every`` profiles.
+        Returns the final summary.
+        """
+        urls = list(dict.fromkeys(urls))
+        done = completed_urls(output_path)
+        todo = [url for url in urls if url not in done]
+        logger.info(f"Bulk analysis: {len(todo)} to do, {len(urls) - len(todo)} already done")
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        counts = {"ok": 0, "failed": 0}
+        lock = threading.Lock()
+        started = time.monotonic()
+
+        def summary() -> Dict[str, Any]:
+            elapsed = time.monotonic() - started
+            processed = counts["ok"] + counts["failed"]
+            return {
+                "total": len(urls),
+                "skipped": len(urls) - len(todo),
+                "processed": processed,
+                "remaining": len(todo) - processed,
+                "ok": counts["ok"],
+                "failed": counts["failed"],
+                "elapsed_s": round(elapsed, 1),
+                "profiles_per_min": round(processed / elapsed * 60, 1) if elapsed else 0.0,
+                "throttles": {name: t.stats() for name, t in self.throttles.items()},
+            }
+
+        with open(output_path, "a+", encoding="utf-8") as out:
+            # Finish a line a crash cut short, so the next record starts clean
+            if out.tell():
+                out.seek(out.tell() - 1)
+                if out.read(1) != "\n":
+                    out.write("\n")
+
+            executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="bulk",
+                initializer=self.thread_initializer,
+            )
+            try:
+                futures = [executor.submit(self.analyze, url) for url in todo]
+                for future in as_completed(futures):
+                    record = future.result()
+                    with lock:
+                        out.write(json.dumps(record, default=str) + "\n")
+                        out.flush()
+                        os.fsync(out.fileno())
+                        counts["ok" if record["status"] == "ok" else "failed"] += 1
+                        processed = counts["ok"] + counts["failed"]
+                    if progress and processed % progress_every == 0:
+                        progress(summary())
+            finally:
+                # On an interrupt, drop what hasn't started; the checkpoint has the rest
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        result = summary()
+        logger.info(
+            f"Bulk analysis done: {result['ok']} ok, {result['failed']} failed, "
+            f"{result['profiles_per_min']} profiles/min"
+        )
+        return result
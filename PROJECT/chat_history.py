@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+# Folded requests named in the summary entry, and how much of each is kept
+SUMMARY_REQUESTS = 5
+SUMMARY_REQUEST_CHARS = 80
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
+
+
+def add_turn(
+    history: List[Dict[str, Any]], user_message: str, reply: str, max_turns: int
+) -> List[Dict[str, Any]]:
+    """
+    Append a user/ai turn, keeping at most ``max_turns`` turns verbatim.
+
+    Older turns are folded into one leading ``{"type": "summary"}`` entry that
+    counts them and names the most recent few requests, so the history (and
+    the session payload holding it) stays bounded however long the chat runs.
+    Returns a new list.
+    """
+    summary = None
+    entries = list(history)
+    if entries and entries[0].get("type") == "summary":
+        summary = dict(entries.pop(0))
+    entries += [
+        {"type": "user", "message": user_message},
+        {"type": "ai", "message": reply},
+    ]
+
+    while len(entries) > 2 * max_turns:
+        folded, entries = entries[:2], entries[2:]
+        summary = summary or {"type": "summary", "turns": 0, "requests": []}
+        summary["turns"] += 1
+        request = next((e["message"] for e in folded if e.get("type") == "user"), "")
+        summary["requests"] = (
+            summary["requests"] + [_shorten(request, SUMMARY_REQUEST_CHARS)]
+        )[-SUMMARY_REQUESTS:]
+        summary["message"] = (
+            f"{summary['turns']} earlier edit{'s' if summary['turns'] != 1 else ''}, "
+            f"most recently: {'; '.join(summary['requests'])}"
+        )
+
+    return ([summary] if summary else []) + entries
@@ -0,0 +1,194 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def result_or_default(
+    future: Future,
+    timeout: float,
+    default: Any,
+    label: str,
+    started: Optional[float] = None,
+) -> Any:
+    """
+    Wait for a future, falling back to ``default`` if it times out or raises.
+
+    When ``started`` (a ``time.monotonic()`` value) is given, the timeout counts
+    from then rather than from this call, so sibling futures share a start time.
+    """
+    if started is not None:
+        timeout = max(0.0, timeout - (time.monotonic() - started))
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        logger.error(f"{label} timed out after {timeout}s")
+    except Exception as e:
+        logger.error(f"{label} failed: {str(e)}")
+    return default
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """``executor.submit`` that runs ``fn`` in a copy of the caller's contextvars (the request trace)"""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+async def run_blocking(executor: Executor, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on ``executor`` so it doesn't hold the event loop"""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+async def aresult_or_default(
+    awaitable: Awaitable, timeout: float, default: Any, label: str
+) -> Any:
+    """Async counterpart of ``result_or_default`` for coroutines"""
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{label} timed out after {timeout}s")
+    except Exception as e:
+        logger.error(f"{label} failed: {str(e)}")
+    return default
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller for a key runs the function; everybody who arrives while
+    it is still running waits and gets the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.followers += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "in_flight": len(self._calls),
+            }
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``per_minute`` acquisitions a minute, in bursts of
+    up to ``burst``. ``per_minute`` of 0 means unlimited.
+    """
+
+    def __init__(self, per_minute: float, burst: int = 1):
+        self.per_minute = per_minute
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until it is due; returns the seconds slept"""
+        if self.per_minute <= 0:
+            return 0.0
+        rate = self.per_minute / 60.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # Going negative reserves a future slot, so waiters are served in order
+            self._tokens -= 1
+            delay = -self._tokens / rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class Throttle:
+    """
+    Limits for one upstream: at most ``concurrency`` calls at once and
+    ``per_minute`` calls started a minute. Use as a context manager around
+    each call.
+    """
+
+    def __init__(self, concurrency: int, per_minute: float = 0, burst: int = 1):
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(per_minute, burst)
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.wait_time = 0.0
+
+    def __enter__(self):
+        started = time.monotonic()
+        self._slots.acquire()
+        try:
+            self.limiter.acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.calls += 1
+            self.wait_time += time.monotonic() - started
+        return self
+
+    def __exit__(self, *exc_info):
+        self._slots.release()
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "per_minute": self.limiter.per_minute,
+                "calls": self.calls,
+                "wait_time_total": round(self.wait_time, 3),
+            }
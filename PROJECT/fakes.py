@@ -0,0 +1,358 @@
+"""
+Offline stand-ins for the upstream clients used by the views.
+
+These are deterministic doubles meant for local benchmarks and for
+exercising the pooling/caching layers without touching real services.
+"""
+
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from .prompts import estimate_tokens
+
+FIXTURES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOBS_CSV = os.path.join(FIXTURES_DIR, "jobs_software_engg_JAIPUR_IN.csv")
+RECOMMENDATIONS_JSON = os.path.join(
+    FIXTURES_DIR, "job_recommendations_20250629_163029.json"
+)
+
+ANALYSIS_MARKDOWN = """## Profile Strength Assessment
+
+**Score: 78/100.** Clear backend focus with solid Python and Django experience.
+
+## Key Strengths
+
+- Production REST APIs with Django and PostgreSQL
+- Data pipeline work with pandas
+
+## Areas for Improvement
+
+- Quantify impact in each experience entry
+- Add a headline that names a target role
+"""
+
+ATS_RESUME_HTML = """<h1>Jane Doe</h1>
+<h2>Summary</h2>
+<p>Backend engineer building Python and Django services.</p>
+<h2>Experience</h2>
+<h3>Software Engineer, Example Corp</h3>
+<ul><li>Built REST APIs with Django and PostgreSQL</li></ul>
+<h3>Intern, Startup Labs</h3>
+<ul><li>Worked on data pipelines with pandas</li></ul>
+<h2>Skills</h2>
+<p>Python, Django, SQL, Docker</p>
+<h2>Education</h2>
+<p>B.Tech Computer Science, Rajasthan Technical University</p>
+"""
+
+
+class FakeLinkedin:
+    """Drop-in replacement for ``linkedin_api.Linkedin``"""
+
+    # Shared across instances so callers can count logins and upstream calls
+    login_count = 0
+    call_count = 0
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        username: str = "",
+        password: str = "",
+        login_latency: float = 0.0,
+        call_latency: float = 0.0,
+        fail_on: tuple = (),
+    ):
+        self.username = username
+        self.login_latency = login_latency
+        self.call_latency = call_latency
+        self.fail_on = set(fail_on)
+        time.sleep(login_latency)
+        with FakeLinkedin._lock:
+            FakeLinkedin.login_count += 1
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls.login_count = 0
+            cls.call_count = 0
+
+    def _call(self, public_id: str):
+        with FakeLinkedin._lock:
+            FakeLinkedin.call_count += 1
+        time.sleep(self.call_latency)
+        if public_id in self.fail_on:
+            raise Exception(f"Fake LinkedIn failure for {public_id}")
+
+    def get_profile(self, public_id: str) -> Dict[str, Any]:
+        self._call(public_id)
+        return {
+            "public_id": public_id,
+            "firstName": public_id.split("-")[0].title(),
+            "lastName": "Doe",
+            "headline": "Software Engineer at Example Corp",
+            "locationName": "Jaipur, Rajasthan, India",
+            "industryName": "Software Development",
+            "summary": "Backend engineer working on Python and Django services.",
+            "experience": [
+                {
+                    "title": "Software Engineer",
+                    "companyName": "Example Corp",
+                    "description": "Built REST APIs with Django and PostgreSQL.",
+                    "timePeriod": {"startDate": {"month": 1, "year": 2022}},
+                },
+                {
+                    "title": "Intern",
+                    "companyName": "Startup Labs",
+                    "description": "Worked on data pipelines with pandas.",
+                    "timePeriod": {
+                        "startDate": {"month": 6, "year": 2021},
+                        "endDate": {"month": 12, "year": 2021},
+                    },
+                },
+            ],
+            "education": [
+                {
+                    "schoolName": "Rajasthan Technical University",
+                    "degreeName": "B.Tech",
+                    "fieldOfStudy": "Computer Science",
+                }
+            ],
+            "skills": [
+                {"name": "Python"},
+                {"name": "Django"},
+                {"name": "SQL"},
+                {"name": "Docker"},
+            ],
+        }
+
+    def get_profile_contact_info(self, public_id: str) -> Dict[str, Any]:
+        self._call(public_id)
+        return {
+            "email_address": f"{public_id}@example.com",
+            "websites": [],
+            "twitter": [],
+            "phone_numbers": [],
+        }
+
+
+class FakeJobBoards:
+    """
+    Stand-in for ``jobspy.scrape_jobs`` backed by the checked-in Jaipur CSV.
+
+    Each board has its own simulated latency and can be made to fail. Called
+    with several ``site_name`` values it behaves like JobSpy: it waits for the
+    slowest board and any failing board fails the whole call.
+    """
+
+    def __init__(
+        self,
+        latencies: Optional[Dict[str, float]] = None,
+        failing: tuple = (),
+        csv_path: str = JOBS_CSV,
+    ):
+        import pandas as pd
+
+        self.latencies = latencies or {"indeed": 0.0, "linkedin": 0.0, "naukri": 0.0}
+        self.failing = set(failing)
+        self.rows = pd.read_csv(csv_path)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, site_name, results_wanted: int = 10, **kwargs):
+        import pandas as pd
+
+        sites = [site_name] if isinstance(site_name, str) else list(site_name)
+        with self._lock:
+            self.calls += 1
+        time.sleep(max(self.latencies.get(site, 0.0) for site in sites))
+
+        frames = []
+        for site in sites:
+            if site in self.failing:
+                raise Exception(f"Fake {site} scrape failed")
+            frame = self.rows.head(results_wanted).copy()
+            frame["site"] = site
+            frame["id"] = [f"{site[:2]}-{i}" for i in range(len(frame))]
+            frame["job_url"] = [f"https://{site}.example/jobs/{i}" for i in range(len(frame))]
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True)
+
+
+def recorded_recommendations(path: str = RECOMMENDATIONS_JSON) -> Dict[str, Any]:
+    """The recorded Gemini recommendations, in the response schema the views request"""
+    with open(path) as f:
+        data = json.load(f)
+    titles = data.get("recommended_job_titles", [])
+    priority = {"high": 90, "medium": 70, "low": 50}
+    return {
+        "JOB_TITLES": [t["title"] for t in titles],
+        "LOCATIONS": [l["location"] for l in data.get("target_locations", [])],
+        "RELATED_DOMAINS": [
+            {"domain": s["skill"], "relevance_score": priority.get(s.get("priority"), 50)}
+            for s in data.get("skills_to_learn", [])
+        ],
+        "RECOMMENDATIONS": data.get("action_plan", {}).get("immediate_actions", []),
+        "ATS_SCORE": round(sum(t["match_percentage"] for t in titles) / max(1, len(titles))),
+        "SKILLS_TO_DEVELOP": data.get("current_skills_strength", {}).get("skill_gaps", []),
+    }
+
+
+def _completion(text: str):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+def _completion_chunks(text: str):
+    return [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word))])
+        for word in text.split(" ")
+    ]
+
+
+class FakeOpenAI:
+    """Stand-in for ``openai.OpenAI`` chat completions (streamed or not)"""
+
+    def __init__(self, latency: float = 0.0, text: str = ANALYSIS_MARKDOWN):
+        self.latency = latency
+        self.text = text
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=self)
+
+    def _words(self):
+        chunks = _completion_chunks(self.text)
+        for chunk in chunks[:-1]:
+            chunk.choices[0].delta.content += " "
+        return chunks
+
+    def create(self, stream: bool = False, **kwargs):
+        self.calls += 1
+        if stream:
+            return self._stream()
+        time.sleep(self.latency)
+        return _completion(self.text)
+
+    def _stream(self):
+        chunks = self._words()
+        for chunk in chunks:
+            time.sleep(self.latency / len(chunks))
+            yield chunk
+
+
+class FakeAsyncOpenAI(FakeOpenAI):
+    """Stand-in for ``openai.AsyncOpenAI`` chat completions"""
+
+    async def create(self, stream: bool = False, **kwargs):
+        self.calls += 1
+        if stream:
+            return self._astream()
+        await asyncio.sleep(self.latency)
+        return _completion(self.text)
+
+    async def _astream(self):
+        chunks = self._words()
+        for chunk in chunks:
+            await asyncio.sleep(self.latency / len(chunks))
+            yield chunk
+
+
+SECTION_RE = re.compile(r'<section id="([^"]+)">\n(.*?)\n</section>', re.DOTALL)
+
+
+def _prompt_text(contents) -> str:
+    return "".join(part.text or "" for content in contents or [] for part in content.parts)
+
+
+class FakeGemini:
+    """
+    Stand-in for ``genai.Client`` (use ``.models`` like the real client).
+
+    Streamed calls return the recorded recommendations JSON in small chunks
+    (or ``resume_html`` when not asked for JSON). Plain calls return
+    ``resume_html``, or, when asked for JSON, a section patch echoing each
+    ``<section id=...>`` of the prompt with a line added.
+    ``token_latency`` adds seconds per output token on top of ``latency``, and
+    responses carry ``usage_metadata`` (from ``estimate_tokens``).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        recommendations: Optional[Dict[str, Any]] = None,
+        resume_html: str = ATS_RESUME_HTML,
+        chunk_size: int = 40,
+        token_latency: float = 0.0,
+    ):
+        self.latency = latency
+        self.recommendations = recommendations or recorded_recommendations()
+        self.resume_html = resume_html
+        self.chunk_size = chunk_size
+        self.token_latency = token_latency
+        self.calls = 0
+        self.models = self
+
+    def _response(self, contents, config):
+        prompt = _prompt_text(contents)
+        if getattr(config, "response_mime_type", None) == "application/json":
+            text = json.dumps(
+                {
+                    "SECTIONS": [
+                        {"id": section_id, "html": f"{html}\n<p>Edited as requested.</p>"}
+                        for section_id, html in SECTION_RE.findall(prompt)
+                    ]
+                }
+            )
+        else:
+            text = self.resume_html
+        usage = SimpleNamespace(
+            prompt_token_count=estimate_tokens(prompt), candidates_token_count=estimate_tokens(text)
+        )
+        delay = self.latency + self.token_latency * usage.candidates_token_count
+        return SimpleNamespace(text=text, usage_metadata=usage), delay
+
+    def _chunks(self, config=None):
+        if getattr(config, "response_mime_type", None) == "application/json":
+            text = json.dumps(self.recommendations)
+        else:
+            text = self.resume_html
+        return [
+            SimpleNamespace(text=text[i : i + self.chunk_size])
+            for i in range(0, len(text), self.chunk_size)
+        ]
+
+    def generate_content_stream(self, config=None, **kwargs):
+        self.calls += 1
+        chunks = self._chunks(config)
+        for chunk in chunks:
+            time.sleep(self.latency / len(chunks))
+            yield chunk
+
+    def generate_content(self, contents=None, config=None, **kwargs):
+        self.calls += 1
+        response, delay = self._response(contents, config)
+        time.sleep(delay)
+        return response
+
+
+class FakeAsyncGemini(FakeGemini):
+    """Stand-in for ``genai.Client(...).aio``"""
+
+    async def generate_content_stream(self, config=None, **kwargs):
+        self.calls += 1
+        return self._astream(config)
+
+    async def _astream(self, config=None):
+        chunks = self._chunks(config)
+        for chunk in chunks:
+            await asyncio.sleep(self.latency / len(chunks))
+            yield chunk
+
+    async def generate_content(self, contents=None, config=None, **kwargs):
+        self.calls += 1
+        response, delay = self._response(contents, config)
+        await asyncio.sleep(delay)
+        return response
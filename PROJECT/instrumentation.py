@@ -0,0 +1,338 @@
+import bisect
+import contextvars
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is +Inf)
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; cheap to update, good enough for p50/p95/p99"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS + (self.max_ms,), self.counts):
+            seen += count
+            if seen >= rank:
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in BUCKETS_MS] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class Span:
+    __slots__ = ("name", "start", "duration_ms", "attrs", "parent")
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attrs):
+        self.name = name
+        self.start = time.perf_counter()
+        self.duration_ms = None
+        self.attrs = attrs
+        self.parent = parent
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def as_dict(self, origin: float) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "offset_ms": round((self.start - origin) * 1000, 2),
+            "duration_ms": round(self.duration_ms or 0.0, 2),
+            "parent": self.parent.name if self.parent else None,
+            **self.attrs,
+        }
+
+
+class Trace:
+    """Spans recorded for one sampled request (or one sampled background call)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value: total ms per span name, in first-seen order"""
+        totals: Dict[str, List[float]] = {}
+        with self._lock:
+            for span in self.spans:
+                entry = totals.setdefault(span.name, [0.0, 0])
+                entry[0] += span.duration_ms or 0.0
+                entry[1] += 1
+        parts = []
+        for name, (ms, count) in totals.items():
+            metric = name.replace(" ", "_").replace(";", "_").replace(",", "_")
+            desc = f';desc="x{count}"' if count > 1 else ""
+            parts.append(f"{metric};dur={ms:.1f}{desc}")
+        return ", ".join(parts)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = [span.as_dict(self.start) for span in self.spans]
+        return {"name": self.name, "spans": spans}
+
+
+class _NoopSpan:
+    """Returned when tracing is off or the request isn't sampled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _ActiveSpan:
+    def __init__(self, tracer: "Tracer", trace: Optional[Trace], name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.trace = trace
+        self.span = Span(name, tracer._span.get(), **attrs)
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = self.tracer._span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.span.attrs["error"] = exc_type.__name__
+        self.tracer._span.reset(self.token)
+        self.tracer._finish(self.span, self.trace)
+        return False
+
+
+class Tracer:
+    """
+    Spans around the hot path, latency histograms and per-request traces.
+
+    Disabled, ``span()`` returns a shared no-op and ``traced`` functions call
+    straight through. Enabled, a ``sample_rate`` fraction of requests is
+    traced: their spans feed the histograms, the ``Server-Timing`` header and
+    a ring of recent traces. Spans outside a request (background tasks) are
+    sampled one by one at the same rate.
+    """
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 1.0, keep_traces: int = 50):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._trace: contextvars.ContextVar = contextvars.ContextVar("trace", default=None)
+        self._span: contextvars.ContextVar = contextvars.ContextVar("span", default=None)
+        self._histograms: Dict[str, Histogram] = {}
+        self._recent: deque = deque(maxlen=keep_traces)
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool, sample_rate: float = 1.0, keep_traces: int = 50):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        with self._lock:
+            self._recent = deque(self._recent, maxlen=keep_traces)
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def start_trace(self, name: str):
+        """Begin a trace for this context if sampled; returns a token for ``end_trace``"""
+        if not self.enabled or not self._sampled():
+            return None
+        trace = Trace(name)
+        return trace, self._trace.set(trace)
+
+    def end_trace(self, token) -> Optional[Trace]:
+        if token is None:
+            return None
+        trace, context_token = token
+        self._trace.reset(context_token)
+        with self._lock:
+            self._recent.append(trace)
+        return trace
+
+    def span(self, name: str, **attrs):
+        """Context manager timing a block; use ``.set(...)`` on it to attach attributes"""
+        if not self.enabled:
+            return NOOP_SPAN
+        trace = self._trace.get()
+        if trace is None and not self._sampled():
+            return NOOP_SPAN
+        return _ActiveSpan(self, trace, name, attrs)
+
+    def _finish(self, span: Span, trace: Optional[Trace]):
+        span.duration_ms = (time.perf_counter() - span.start) * 1000
+        self.observe(span.name, span.duration_ms)
+        if trace is not None:
+            trace.add(span)
+
+    def annotate(self, **attrs):
+        """Attach attributes (cache hit/miss, tokens, sizes) to the innermost open span"""
+        if not self.enabled:
+            return
+        span = self._span.get()
+        if span is not None:
+            span.attrs.update(attrs)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """Decorator wrapping a function (sync, async or either kind of generator) in a span"""
+
+        def decorator(fn: Callable) -> Callable:
+            span_name = name or fn.__qualname__
+
+            if inspect.isgeneratorfunction(fn):
+
+                @functools.wraps(fn)
+                def generator_wrapper(*args, **kwargs):
+                    trace = self._trace.get()
+                    if not self.enabled or (trace is None and not self._sampled()):
+                        yield from fn(*args, **kwargs)
+                        return
+                    # Spans the whole iteration. Consumers may resume the
+                    # generator from other threads/contexts, so it isn't made
+                    # the current span (nothing nests under it).
+                    span = Span(span_name, self._span.get())
+                    try:
+                        yield from fn(*args, **kwargs)
+                    except Exception as e:
+                        span.attrs["error"] = type(e).__name__
+                        raise
+                    finally:
+                        self._finish(span, trace)
+
+                return generator_wrapper
+
+            if inspect.isasyncgenfunction(fn):
+
+                @functools.wraps(fn)
+                async def async_generator_wrapper(*args, **kwargs):
+                    trace = self._trace.get()
+                    if not self.enabled or (trace is None and not self._sampled()):
+                        async for item in fn(*args, **kwargs):
+                            yield item
+                        return
+                    span = Span(span_name, self._span.get())
+                    try:
+                        async for item in fn(*args, **kwargs):
+                            yield item
+                    except Exception as e:
+                        span.attrs["error"] = type(e).__name__
+                        raise
+                    finally:
+                        self._finish(span, trace)
+
+                return async_generator_wrapper
+
+            if inspect.iscoroutinefunction(fn):
+
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with self.span(span_name):
+                        return await fn(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self.span(span_name):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def observe(self, name: str, ms: float):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(ms)
+
+    def metrics(self, traces: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            histograms = {name: h.as_dict() for name, h in sorted(self._histograms.items())}
+            recent = [t.as_dict() for t in self._recent] if traces else None
+        result = {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "histograms": histograms,
+        }
+        if traces:
+            result["recent_traces"] = recent
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._recent.clear()
+
+
+# Shared by every module; configured from settings.INSTRUMENTATION at startup
+tracer = Tracer()
+span = tracer.span
+annotate = tracer.annotate
+traced = tracer.traced
+
+
+def record_usage(response: Any):
+    """Annotate the current span with token usage from an OpenAI or Gemini response"""
+    if not tracer.enabled or response is None:
+        return
+    usage = getattr(response, "usage", None)
+    if usage is not None and getattr(usage, "prompt_tokens", None) is not None:
+        annotate(
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=getattr(usage, "completion_tokens", None),
+        )
+        return
+    metadata = getattr(response, "usage_metadata", None)
+    if metadata is not None and getattr(metadata, "prompt_token_count", None) is not None:
+        annotate(
+            prompt_tokens=metadata.prompt_token_count,
+            completion_tokens=getattr(metadata, "candidates_token_count", None),
+        )
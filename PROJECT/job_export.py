@@ -0,0 +1,69 @@
+import csv
+import datetime
+import logging
+import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("off", "jsonl", "parquet", "csv")
+EXTENSIONS = {"jsonl": "jsonl", "parquet": "parquet", "csv": "csv"}
+
+
+class JobExportSink:
+    """
+    Optional export of scraped job frames, written off the request path.
+
+    Every scrape becomes its own file under ``<directory>/date=YYYY-MM-DD/``.
+    Files are written to a temp name and renamed into place, so readers never
+    see partial files and concurrent scrapes never overwrite each other.
+    """
+
+    def __init__(self, fmt: str = "off", directory: str = "job_exports"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown job export format {fmt!r}, expected one of {FORMATS}")
+        self.format = fmt
+        self.directory = str(directory)
+        self._executor = None if fmt == "off" else ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="job-export"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.format != "off"
+
+    def _target(self, search_term: str, location: str) -> str:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        slug = "_".join(f"{search_term} {location}".replace(",", " ").split()).lower()
+        name = f"{now:%H%M%S}-{slug[:60]}-{uuid.uuid4().hex[:8]}.{EXTENSIONS[self.format]}"
+        return os.path.join(self.directory, f"date={now:%Y-%m-%d}", name)
+
+    def _write(self, jobs, path: str):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            if self.format == "jsonl":
+                jobs.to_json(tmp_path, orient="records", lines=True, date_format="iso")
+            elif self.format == "parquet":
+                jobs.to_parquet(tmp_path, index=False)
+            else:
+                jobs.to_csv(tmp_path, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", index=False)
+            os.replace(tmp_path, path)
+            logger.info(f"Exported {len(jobs)} jobs to {path}")
+        except Exception as e:
+            logger.error(f"Job export to {path} failed: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def export(self, jobs, search_term: str, location: str) -> Optional[str]:
+        """Queue a frame for export and return the path it will be written to"""
+        if not self.enabled or len(jobs) == 0:
+            return None
+        path = self._target(search_term, location)
+        self._executor.submit(self._write, jobs.copy(), path)
+        return path
@@ -0,0 +1,220 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Hashed feature space; 2**12 float16 dims is 8KB per posting
+DIMENSIONS = 4096
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our the "
+    "to we will with you your this that who work working role team job n/a".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posting_vectors (
+    id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    vector BLOB NOT NULL
+);
+"""
+
+
+def _tokens(text: str) -> List[str]:
+    words = [w.rstrip(".") for w in TOKEN_RE.findall(text.lower())]
+    return [w for w in words if w and w not in STOPWORDS]
+
+
+def vectorize(fields: List[tuple]) -> np.ndarray:
+    """
+    L2-normalized hashed bag of unigrams and bigrams.
+
+    ``fields`` is a list of ``(text, weight)``; counts are log-scaled so a
+    long description can't drown out the title.
+    """
+    counts: Dict[int, float] = {}
+    for text, weight in fields:
+        words = _tokens(text or "")
+        for gram in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+            index = zlib.crc32(gram.encode()) % DIMENSIONS
+            counts[index] = counts.get(index, 0.0) + weight
+
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    if counts:
+        indexes = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        vector[indexes] = 1.0 + np.log(values)
+        vector /= np.linalg.norm(vector)
+    return vector
+
+
+def profile_document(linkedin_data: Dict[str, Any]) -> Dict[str, str]:
+    """The parts of a profile jobs are matched against, as one compact document"""
+    profile = linkedin_data.get("profile") or {}
+    parts = [profile.get("headline") or "", profile.get("summary") or ""]
+    for item in profile.get("experience") or []:
+        if isinstance(item, dict):
+            # The title twice on purpose: past titles say more about the roles
+            # that fit than the description, as posting titles do (_posting_fields)
+            title = item.get("title") or ""
+            parts.append(f"{title} {title} {item.get('description') or ''}")
+    skills = [s.get("name") for s in profile.get("skills") or [] if isinstance(s, dict) and s.get("name")]
+    # Skills are short; repeat them so they weigh as much as the prose
+    parts.append(" ".join(skills * 3))
+    return {"username": linkedin_data.get("username") or "", "text": "\n".join(p for p in parts if p)}
+
+
+def _posting_id(job: Dict[str, Any]) -> str:
+    return job.get("id") or job.get("job_url") or ""
+
+
+def _posting_fields(job: Dict[str, Any]) -> List[tuple]:
+    return [(job.get("title"), 3.0), (job.get("description"), 1.0)]
+
+
+class JobMatcher:
+    """
+    Score job postings against a profile with hashed n-gram vectors.
+
+    Profile vectors are cached per username (and invalidated when the
+    profile text changes). Posting vectors form an incremental index stored
+    next to the job store, so each posting is vectorized once; matching a
+    listing is then a single matrix-vector product.
+    """
+
+    def __init__(self, path: str, max_profiles: int = 256, max_postings: int = 20000):
+        self.path = str(path)
+        self.max_profiles = max_profiles
+        self.max_postings = max_postings
+        self._profiles: "OrderedDict[str, tuple]" = OrderedDict()
+        self._postings: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.vectorized = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def profile_vector(self, document: Dict[str, str]) -> np.ndarray:
+        digest = hashlib.sha1(document["text"].encode()).hexdigest()
+        key = document["username"] or digest
+        with self._lock:
+            cached = self._profiles.get(key)
+            if cached and cached[0] == digest:
+                self._profiles.move_to_end(key)
+                return cached[1]
+
+        vector = vectorize([(document["text"], 1.0)])
+        with self._lock:
+            self._profiles[key] = (digest, vector)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return vector
+
+    def _posting_vectors(self, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """Vectors for ``jobs`` in order: memory, then the on-disk index, then vectorize"""
+        digests = [
+            hashlib.sha1(f"{job.get('title')}\n{job.get('description')}".encode()).hexdigest()
+            for job in jobs
+        ]
+        ids = [_posting_id(job) or digest for job, digest in zip(jobs, digests)]
+        vectors: List[Any] = [None] * len(jobs)
+
+        with self._lock:
+            for i, (posting_id, digest) in enumerate(zip(ids, digests)):
+                cached = self._postings.get(posting_id)
+                if cached and cached[0] == digest:
+                    vectors[i] = cached[1]
+
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            conn = self._connection()
+            placeholders = ",".join("?" * len(missing))
+            stored = {
+                posting_id: (digest, blob)
+                for posting_id, digest, blob in conn.execute(
+                    f"SELECT id, digest, vector FROM posting_vectors WHERE id IN ({placeholders})",
+                    [ids[i] for i in missing],
+                )
+            }
+            new_rows = []
+            for i in missing:
+                row = stored.get(ids[i])
+                if row and row[0] == digests[i]:
+                    vectors[i] = np.frombuffer(row[1], dtype=np.float16).astype(np.float32)
+                else:
+                    vectors[i] = vectorize(_posting_fields(jobs[i]))
+                    new_rows.append((ids[i], digests[i], vectors[i].astype(np.float16).tobytes()))
+            if new_rows:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO posting_vectors VALUES (?, ?, ?)", new_rows
+                )
+
+            with self._lock:
+                self.vectorized += len(new_rows)
+                for i in missing:
+                    self._postings[ids[i]] = (digests[i], vectors[i])
+                while len(self._postings) > self.max_postings:
+                    self._postings.popitem(last=False)
+
+        return np.vstack(vectors) if vectors else np.zeros((0, DIMENSIONS), dtype=np.float32)
+
+    def score(self, document: Dict[str, str], jobs: List[Dict[str, Any]]) -> List[float]:
+        """Cosine similarity of each posting to the profile, 0-100"""
+        if not jobs:
+            return []
+        scores = self._posting_vectors(jobs) @ self.profile_vector(document)
+        return [round(float(s) * 100, 1) for s in scores]
+
+    def rank(
+        self, document: Dict[str, str], jobs: List[Dict[str, Any]], weight: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Copies of ``jobs`` with a ``match_score``, best first (stable on ties).
+
+        Below a ``weight`` of 1 the order blends the match with each posting's
+        ``rank_score`` (0-1, from jobs.rank_jobs): ``weight`` x the match
+        relative to the best one in the listing + (1 - ``weight``) x
+        ``rank_score``, kept as ``score``.
+        """
+        started = time.perf_counter()
+        scores = self.score(document, jobs)
+        best = max(scores, default=0.0) or 1.0
+        scored = []
+        for job, match in zip(jobs, scores):
+            blended = weight * match / best + (1 - weight) * (job.get("rank_score") or 0.0)
+            scored.append({**job, "match_score": match, "score": round(blended, 4)})
+        scored.sort(key=lambda job: job["score"], reverse=True)
+        logger.info(
+            f"Matched {len(jobs)} jobs for {document['username'] or 'profile'} "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return scored
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "profiles": len(self._profiles),
+                "postings_in_memory": len(self._postings),
+                "vectorized": self.vectorized,
+            }
@@ -0,0 +1,221 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    id TEXT PRIMARY KEY,
+    job_url TEXT UNIQUE,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    description TEXT,
+    date_posted TEXT,
+    record TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5(
+    title, company, location, description, content='postings', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS postings_ai AFTER INSERT ON postings BEGIN
+    INSERT INTO postings_fts (rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS postings_ad AFTER DELETE ON postings BEGIN
+    INSERT INTO postings_fts (postings_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS postings_au AFTER UPDATE ON postings BEGIN
+    INSERT INTO postings_fts (postings_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+    INSERT INTO postings_fts (rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+CREATE TABLE IF NOT EXISTS searches (
+    search_key TEXT PRIMARY KEY,
+    search_term TEXT NOT NULL,
+    location TEXT NOT NULL,
+    last_scraped REAL NOT NULL,
+    posting_ids TEXT NOT NULL
+);
+"""
+
+
+def search_key(search_term: str, location: str) -> str:
+    """Normalize a (term, location) pair so trivial variations share a key"""
+    normalize = lambda value: " ".join((value or "").lower().replace(",", " ").split())
+    return f"{normalize(search_term)}|{normalize(location)}"
+
+
+class JobStore:
+    """
+    Local SQLite store of scraped job postings.
+
+    Postings are deduplicated by id and job_url and indexed with FTS5 (see
+    ``search``). Each normalized (search term, location) remembers when it
+    was last scraped and which postings it returned, so warm searches can be
+    answered locally and cold ones only need to scrape what's new since
+    then. A scrape that found nothing is remembered too (``record_scrape``).
+    """
+
+    # Postings remembered per search (newest first)
+    MAX_POSTINGS_PER_SEARCH = 200
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._local = threading.local()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def last_scraped(self, search_term: str, location: str) -> Optional[float]:
+        row = self._connection().execute(
+            "SELECT last_scraped FROM searches WHERE search_key = ?",
+            (search_key(search_term, location),),
+        ).fetchone()
+        return row[0] if row else None
+
+    def results(self, search_term: str, location: str) -> List[Dict[str, Any]]:
+        """Postings previously returned for this search, newest first"""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT posting_ids FROM searches WHERE search_key = ?",
+            (search_key(search_term, location),),
+        ).fetchone()
+        if not row:
+            return []
+
+        ids = json.loads(row[0])
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        records = {
+            posting_id: json.loads(record)
+            for posting_id, record in conn.execute(
+                f"SELECT id, record FROM postings WHERE id IN ({placeholders})", ids
+            )
+        }
+        return [records[i] for i in ids if i in records]
+
+    def fresh_results(
+        self, search_term: str, location: str, max_age: float
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Stored postings if this search was scraped within ``max_age`` seconds
+        (an empty list if that scrape found nothing), else None.
+        """
+        last = self.last_scraped(search_term, location)
+        if last is None or time.time() - last > max_age:
+            return None
+        return self.results(search_term, location)
+
+    def record_scrape(self, search_term: str, location: str):
+        """Mark the search as scraped now without adding postings (it found none)"""
+        self._connection().execute(
+            "INSERT INTO searches VALUES (?, ?, ?, ?, '[]') "
+            "ON CONFLICT(search_key) DO UPDATE SET last_scraped = excluded.last_scraped",
+            (search_key(search_term, location), search_term, location, time.time()),
+        )
+
+    def store_results(
+        self, search_term: str, location: str, records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Upsert scraped postings and merge them into the search's result list.
+
+        Returns the merged postings (new ones first), deduplicated by id.
+        """
+        now = time.time()
+        key = search_key(search_term, location)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            new_ids = []
+            for record in records:
+                posting_id = record.get("id") or record.get("job_url")
+                if not posting_id or posting_id in new_ids:
+                    continue
+                # Another id may already own this job_url (same job on a different board id)
+                existing = conn.execute(
+                    "SELECT id FROM postings WHERE job_url = ? AND id != ?",
+                    (record.get("job_url"), posting_id),
+                ).fetchone()
+                if existing:
+                    posting_id = existing[0]
+                    if posting_id in new_ids:
+                        continue
+                conn.execute(
+                    "INSERT INTO postings (id, job_url, title, company, location, description, "
+                    "date_posted, record, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET record = excluded.record, "
+                    "title = excluded.title, company = excluded.company, "
+                    "location = excluded.location, description = excluded.description, "
+                    "date_posted = excluded.date_posted, last_seen = excluded.last_seen",
+                    (
+                        posting_id,
+                        record.get("job_url"),
+                        record.get("title"),
+                        record.get("company"),
+                        record.get("location"),
+                        record.get("description"),
+                        record.get("date_posted"),
+                        json.dumps({**record, "id": posting_id}, default=str),
+                        now,
+                        now,
+                    ),
+                )
+                new_ids.append(posting_id)
+
+            row = conn.execute(
+                "SELECT posting_ids FROM searches WHERE search_key = ?", (key,)
+            ).fetchone()
+            previous = json.loads(row[0]) if row else []
+            merged = new_ids + [i for i in previous if i not in new_ids]
+            conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?)",
+                (key, search_term, location, now, json.dumps(merged[: self.MAX_POSTINGS_PER_SEARCH])),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return self.results(search_term, location)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Full-text search over every stored posting"""
+        terms = " ".join(f'"{t}"' for t in query.replace('"', " ").split())
+        if not terms:
+            return []
+        rows = self._connection().execute(
+            "SELECT postings.record FROM postings_fts "
+            "JOIN postings ON postings.rowid = postings_fts.rowid "
+            "WHERE postings_fts MATCH ? ORDER BY rank LIMIT ?",
+            (terms, limit),
+        )
+        return [json.loads(record) for (record,) in rows]
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connection()
+        return {
+            "postings": conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0],
+            "searches": conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0],
+        }
@@ -1,11 +1,189 @@
 from jobspy import scrape_jobs
 import pandas as pd
 import json
-import csv
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from django.conf import settings
+from .concurrency import SingleFlight, submit_in_context
+from .instrumentation import annotate, traced
+from .job_export import JobExportSink
+from .job_store import JobStore
+
+SITES = ["indeed", "linkedin", "naukri"]
+
+# Per-board budgets: seconds to wait for the board and results to ask it for
+# (None means use fetch_jobs' ``results``)
+SITE_BUDGETS = {
+    "indeed": {"timeout": 20, "results": None},
+    "linkedin": {"timeout": 20, "results": None},
+    "naukri": {"timeout": 15, "results": None},
+}
+
+_site_executor = ThreadPoolExecutor(max_workers=3 * len(SITES), thread_name_prefix="jobspy")
+_job_store = None
+_job_export = None
+_grid_executor = None
+# Identical searches running at once (a prefetch and the request after it) scrape once
+_searches = SingleFlight()
+
+
+def get_job_store():
+    """Shared local store of scraped postings (created on first use)"""
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore(settings.JOB_STORE["PATH"])
+    return _job_store
+
+
+def get_job_export():
+    """Export sink configured by settings.JOB_EXPORT (created on first use)"""
+    global _job_export
+    if _job_export is None:
+        try:
+            _job_export = JobExportSink(
+                settings.JOB_EXPORT["FORMAT"], settings.JOB_EXPORT["DIR"]
+            )
+        except ValueError as e:
+            # Built once either way, so a bad format is reported once, not per search
+            print(f"[ERROR] {str(e)}; job export disabled")
+            _job_export = JobExportSink("off")
+    return _job_export
+
+
+def get_grid_executor():
+    """Pool bounding concurrent searches in fetch_job_grid (created on first use)"""
+    global _grid_executor
+    if _grid_executor is None:
+        _grid_executor = ThreadPoolExecutor(
+            max_workers=settings.JOB_SEARCH["CONCURRENCY"], thread_name_prefix="job-grid"
+        )
+    return _grid_executor
+
+
+# Columns returned per job, with the value used when a cell or column is missing
+RECORD_COLUMNS = [
+    ("id", ""),
+    ("title", "N/A"),
+    ("company", "N/A"),
+    ("location", "N/A"),
+    ("salary", "N/A"),
+    ("job_url", "N/A"),
+    ("site", "N/A"),
+    ("date_posted", "N/A"),
+    ("description", "N/A"),
+]
+DESCRIPTION_LIMIT = 500
+
+
+def _text_column(jobs, column, missing, limit=None):
+    """One output column as a list of strings; NaN/None/NaT become ``missing``"""
+    if column not in jobs.columns:
+        return [missing] * len(jobs)
+    # Plain lists beat Series ops here: frames are small and cells are mixed types
+    return [
+        missing if value is None or value != value  # NaN and NaT != themselves
+        else (str(value)[:limit] + "..." if limit else str(value))
+        for value in jobs[column].tolist()
+    ]
+
+
+def _jobs_to_records(jobs):
+    """Format scraped rows for the frontend and the job store, column-wise"""
+    if len(jobs) == 0:
+        return []
+
+    columns = [
+        _text_column(
+            jobs,
+            "min_amount" if key == "salary" else key,
+            missing,
+            DESCRIPTION_LIMIT if key == "description" else None,
+        )
+        for key, missing in RECORD_COLUMNS
+    ]
+    keys = [key for key, _ in RECORD_COLUMNS]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+@traced("jobs.scrape_sites")
+def scrape_sites(search_params, deadline, scraper=None, budgets=None, on_late_result=None):
+    """
+    Scrape each board in ``search_params["site_name"]`` concurrently.
+
+    Results are merged as boards finish. Boards still running when their own
+    timeout or the overall ``deadline`` passes are reported as pending (and
+    handed to ``on_late_result(site, future)`` once they do finish); boards
+    that raise are reported as failed. Returns ``(jobs_dataframe, status)``.
+    """
+    scraper = scraper or scrape_jobs
+    budgets = budgets or SITE_BUDGETS
+    started = time.monotonic()
+
+    def cutoff(site):
+        return min(deadline, budgets.get(site, {}).get("timeout", deadline))
+
+    futures = {}
+    for site in search_params["site_name"]:
+        params = dict(search_params, site_name=[site])
+        params["results_wanted"] = budgets.get(site, {}).get("results") or search_params["results_wanted"]
+        futures[_site_executor.submit(scraper, **params)] = site
+
+    frames = []
+    status = {"finished": [], "pending": [], "failed": {}}
+    not_done = set(futures)
+    while not_done:
+        elapsed = time.monotonic() - started
+        for future in list(not_done):
+            site = futures[future]
+            if elapsed >= cutoff(site):
+                not_done.discard(future)
+                status["pending"].append(site)
+                print(f"[INFO] {site} still running after {cutoff(site)}s, not waiting")
+                if on_late_result:
+                    future.add_done_callback(lambda f, site=site: on_late_result(site, f))
+        if not not_done:
+            break
+
+        timeout = min(cutoff(futures[f]) for f in not_done) - elapsed
+        done, not_done = wait(not_done, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            site = futures[future]
+            try:
+                frame = future.result()
+                frames.append(frame)
+                status["finished"].append(site)
+                print(f"[INFO] {site}: {len(frame)} jobs in {time.monotonic() - started:.1f}s")
+            except Exception as e:
+                status["failed"][site] = str(e)
+                print(f"[ERROR] {site} scrape failed: {str(e)}")
+
+    jobs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return jobs, status
+
+
+def _store_summary(search_term, location, job_list, source):
+    return {
+        "total_jobs_found": len(job_list),
+        "jobs": job_list,
+        "source": source,
+        "summary": f"Found {len(job_list)} jobs for '{search_term}' in '{location}'.",
+    }
+
+
+@traced("jobs.fetch_jobs")
 def fetch_jobs(search_term: str, location: str = "JAIPUR, IN", results: int = 10, 
-               job_type: str = None, is_remote: bool = False, hours_old: int = 72):
+               job_type: str = None, is_remote: bool = False, hours_old: int = 72,
+               use_store: bool = True, deadline: float = 20.0):
     """
-    Scrapes recent job listings from multiple job boards using JobSpy
+    Scrapes recent job listings from multiple job boards using JobSpy.
+
+    Boards are scraped in parallel; whatever finished within ``deadline``
+    seconds is returned and the rest are listed under ``sites["pending"]``.
+
+    With ``use_store`` the local job store answers searches scraped within
+    JOB_STORE["MAX_AGE"] seconds; otherwise only postings newer than the
+    last scrape of the same search are fetched and merged into the store.
     """
     print(f"\n[INFO] AI decided to search for jobs...")
     print(f"[INFO] Search term: {search_term}")
@@ -15,10 +193,27 @@ def fetch_jobs(search_term: str, location: str = "JAIPUR, IN", results: int = 10
     print(f"[INFO] Remote: {is_remote}")
     print(f"[INFO] Hours old: {hours_old}")
     
+    store = get_job_store() if use_store else None
+    if store:
+        cached_jobs = store.fresh_results(search_term, location, settings.JOB_STORE["MAX_AGE"])
+        if cached_jobs is not None:
+            print(f"[INFO] Serving {len(cached_jobs)} stored jobs, skipping scrape")
+            annotate(source="store", jobs=len(cached_jobs))
+            if not cached_jobs:
+                return f"No jobs found for '{search_term}' in '{location}'. Try different keywords or location."
+            return _store_summary(search_term, location, cached_jobs, "store")
+
+        # Incremental scrape: only ask for postings newer than the last run
+        last_scraped = store.last_scraped(search_term, location)
+        if last_scraped:
+            hours_since = math.ceil((time.time() - last_scraped) / 3600)
+            hours_old = max(1, min(hours_old, hours_since))
+            print(f"[INFO] Incremental scrape, hours old: {hours_old}")
+
     try:
         # Configure job search parameters
         search_params = {
-            "site_name": ["indeed", "linkedin", "naukri"],
+            "site_name": SITES,
             "search_term": search_term,
             "location": location,
             "results_wanted": results,
@@ -39,35 +234,55 @@ def fetch_jobs(search_term: str, location: str = "JAIPUR, IN", results: int = 10
         # Add google search term for better results
         search_params["google_search_term"] = f"{search_term} jobs {location}"
         
+        def store_late_result(site, future):
+            # A board that missed the deadline still feeds the store for next time
+            try:
+                frame = future.result()
+                if len(frame):
+                    store.store_results(search_term, location, _jobs_to_records(frame))
+                    print(f"[INFO] Stored {len(frame)} late jobs from {site}")
+            except Exception as e:
+                print(f"[ERROR] Late {site} scrape failed: {str(e)}")
+
         print(f"[INFO] Scraping jobs from job boards...")
-        jobs = scrape_jobs(**search_params)
+        jobs, site_status = scrape_sites(
+            search_params, deadline, on_late_result=store_late_result if store else None
+        )
         
         if len(jobs) == 0:
+            previous_jobs = store.results(search_term, location) if store else []
+            if previous_jobs or site_status["pending"]:
+                result = _store_summary(
+                    search_term, location, previous_jobs, "store" if previous_jobs else "scrape"
+                )
+                result["sites"] = site_status
+                return result
+            if store and not site_status["failed"]:
+                # Every board answered with nothing; don't scrape again until MAX_AGE
+                store.record_scrape(search_term, location)
             return f"No jobs found for '{search_term}' in '{location}'. Try different keywords or location."
         
-        # Save to CSV
-        csv_filename = f"jobs_{search_term.replace(' ', '_')}_{location.replace(' ', '_').replace(',', '')}.csv"
-        jobs.to_csv(csv_filename, quoting=csv.QUOTE_NONNUMERIC, escapechar="\\", index=False)
+        # Export in the background if a sink is configured; an export problem
+        # never costs the caller the jobs that were scraped
+        try:
+            export_path = get_job_export().export(jobs, search_term, location)
+        except Exception as e:
+            print(f"[ERROR] Job export failed: {str(e)}")
+            export_path = None
         
         # Format results for AI response - handle pandas DataFrame properly
-        job_summary = []
-        for idx, job in jobs.head(len(jobs)).iterrows():  # Show more jobs for better matching
-            job_info = {
-                "title": str(job.get('title', 'N/A')),
-                "company": str(job.get('company', 'N/A')),
-                "location": str(job.get('location', 'N/A')),
-                "salary": str(job.get('min_amount', 'N/A')) if pd.notna(job.get('min_amount')) else 'N/A',
-                "job_url": str(job.get('job_url', 'N/A')),
-                "site": str(job.get('site', 'N/A')),
-                "date_posted": str(job.get('date_posted', 'N/A')),
-                "description": str(job.get('description', 'N/A'))[:500] + "..." if pd.notna(job.get('description')) else 'N/A'  # Truncate description
-            }
-            job_summary.append(job_info)
+        job_summary = _jobs_to_records(jobs)
         
+        if store:
+            # Merge with postings from earlier scrapes of the same search
+            job_summary = store.store_results(search_term, location, job_summary)
+        annotate(source="scrape", jobs=len(job_summary))
+
         result = {
             "total_jobs_found": len(jobs),
-            "csv_saved_as": csv_filename,
+            "exported_to": export_path,
             "jobs": job_summary,  # Removed "top_" prefix
+            "sites": site_status,
             "summary": f"Found {len(jobs)} jobs for '{search_term}' in '{location}'. {len(job_summary)} jobs returned for analysis."
         }
         
@@ -79,3 +294,168 @@ def fetch_jobs(search_term: str, location: str = "JAIPUR, IN", results: int = 10
         import traceback
         traceback.print_exc()
         return error_msg
+
+
+def _dedup_key(job):
+    """Same posting across boards/searches: prefer the URL, then title+company+location"""
+    if job.get("job_url") and job["job_url"] != "N/A":
+        return job["job_url"]
+    return "|".join(
+        " ".join(str(job.get(field, "")).lower().split())
+        for field in ("title", "company", "location")
+    )
+
+
+def _recency(date_posted, now=None, half_life_days=7.0):
+    """1.0 for postings from today, halving every ``half_life_days``; 0.25 if unknown"""
+    try:
+        posted = pd.Timestamp(date_posted)
+    except (ValueError, TypeError):
+        return 0.25
+    if pd.isna(posted):
+        return 0.25
+    now = now or pd.Timestamp.now()
+    age_days = max(0.0, (now.tz_localize(None) - posted.tz_localize(None)).total_seconds() / 86400)
+    return 0.5 ** (age_days / half_life_days)
+
+
+def rank_jobs(job_hits, titles, locations, related_domains=None):
+    """
+    Merge per-search results into one deduplicated list, best match first.
+
+    ``job_hits`` is a list of ``(title, location, jobs)``. Each posting scores
+    on the rank of the best search that found it (the recommendations are
+    ordered by fit), how well it matches RELATED_DOMAINS weighted by their
+    ``relevance_score``, and how recently it was posted.
+    """
+    domains = [
+        (str(d.get("domain", "")).lower().split(), (d.get("relevance_score") or 0) / 100)
+        for d in related_domains or []
+        if d.get("domain")
+    ]
+    title_rank = {t: 1.0 - 0.5 * i / max(1, len(titles)) for i, t in enumerate(titles)}
+    location_rank = {l: 1.0 - 0.3 * i / max(1, len(locations)) for i, l in enumerate(locations)}
+    now = pd.Timestamp.now()
+
+    merged = {}
+    for title, location, job_list in job_hits:
+        search_score = title_rank.get(title, 0.5) * location_rank.get(location, 0.7)
+        for job in job_list:
+            key = _dedup_key(job)
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = entry = {"job": job, "search_score": 0.0, "searches": []}
+            entry["search_score"] = max(entry["search_score"], search_score)
+            entry["searches"].append(f"{title} @ {location}")
+
+    ranked = []
+    for entry in merged.values():
+        job = entry["job"]
+        text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+        domain_score = max(
+            (score for words, score in domains if words and all(w in text for w in words)),
+            default=0.0,
+        )
+        recency = _recency(job.get("date_posted"), now)
+        score = 0.5 * entry["search_score"] + 0.3 * domain_score + 0.2 * recency
+        ranked.append({**job, "rank_score": round(score, 4), "matched_searches": entry["searches"]})
+
+    ranked.sort(key=lambda job: job["rank_score"], reverse=True)
+    return ranked
+
+
+def coalesced_fetch_jobs(search_term: str, location: str = "JAIPUR, IN", **kwargs):
+    """fetch_jobs, with concurrent identical searches sharing one scrape"""
+    key = (search_term, location, json.dumps(kwargs, sort_keys=True, default=str))
+    return _searches.do(key, fetch_jobs, search_term, location=location, **kwargs)
+
+
+def search_stats():
+    """Searches run (leaders) and joined while already running (followers)"""
+    return _searches.stats()
+
+
+def _search_grid(titles, locations, max_titles, max_locations):
+    titles = list(dict.fromkeys(t for t in titles if t))[:max_titles]
+    locations = list(dict.fromkeys(locations or [""]))[:max_locations] or [""]
+    return titles, locations, [(title, location) for title in titles for location in locations]
+
+
+def prefetch_job_grid(titles, locations, max_titles=3, max_locations=2, deadline=30.0,
+                      **fetch_kwargs):
+    """
+    Start the searches fetch_job_grid would run for these titles and locations,
+    without waiting for them.
+
+    Results land in the job store. A later fetch_job_grid call with the same
+    arguments joins the searches still running and reads finished ones from
+    the store. Returns the futures.
+    """
+    _, _, grid = _search_grid(titles, locations, max_titles, max_locations)
+    print(f"[INFO] Prefetching {len(grid)} searches")
+    executor = get_grid_executor()
+    return [
+        submit_in_context(executor, coalesced_fetch_jobs, title, location=location, deadline=deadline, **fetch_kwargs)
+        for title, location in grid
+    ]
+
+
+@traced("jobs.fetch_job_grid")
+def fetch_job_grid(titles, locations, related_domains=None, max_titles=3, max_locations=2,
+                   deadline=30.0, fetcher=None, **fetch_kwargs):
+    """
+    Search every recommended title in every recommended location concurrently.
+
+    At most JOB_SEARCH["CONCURRENCY"] searches run at once across all requests
+    (each one already scrapes its boards in parallel). Searches still running after ``deadline`` seconds are
+    listed under ``pending_searches``; they keep running and land in the job
+    store, so the next request picks them up. ``sites`` merges the boards each
+    finished search reported as pending or failed. Returns the ranked,
+    deduplicated jobs across all searches.
+    """
+    fetcher = fetcher or coalesced_fetch_jobs
+    titles, locations, grid = _search_grid(titles, locations, max_titles, max_locations)
+    print(f"[INFO] Fanning out {len(grid)} searches ({len(titles)} titles x {len(locations)} locations)")
+
+    executor = get_grid_executor()
+    started = time.monotonic()
+    futures = {
+        submit_in_context(executor, fetcher, title, location=location, deadline=deadline, **fetch_kwargs): (title, location)
+        for title, location in grid
+    }
+    done, not_done = wait(futures, timeout=deadline)
+
+    job_hits, messages, failed = [], [], {}
+    sites = {"pending": [], "failed": {}}
+    for future in done:
+        title, location = futures[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            failed[f"{title} @ {location}"] = str(e)
+            continue
+        if isinstance(result, str):
+            # fetch_jobs reports "no jobs" and scrape errors as a message string
+            messages.append(result)
+            continue
+        site_status = result.get("sites", {})
+        for site in site_status.get("pending", []):
+            if site not in sites["pending"]:
+                sites["pending"].append(site)
+        sites["failed"].update(site_status.get("failed", {}))
+        job_hits.append((title, location, result.get("jobs", [])))
+
+    pending = [f"{title} @ {location}" for title, location in (futures[f] for f in not_done)]
+    ranked = rank_jobs(job_hits, titles, locations, related_domains)
+    annotate(searches=len(grid), done=len(done), jobs=len(ranked))
+    print(f"[INFO] {len(ranked)} unique jobs from {len(done)}/{len(grid)} searches "
+          f"in {time.monotonic() - started:.1f}s")
+    return {
+        "jobs": ranked,
+        "searches": len(grid),
+        "pending_searches": pending,
+        "failed_searches": failed,
+        "sites": sites,
+        "messages": messages,
+    }
+
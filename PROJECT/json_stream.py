@@ -0,0 +1,77 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JsonFieldStream:
+    """
+    Incremental parser for a streamed JSON object.
+
+    ``feed`` takes text deltas and returns the top-level ``(key, value)``
+    pairs completed by them, so consumers can act on early fields while the
+    rest of the object is still being generated. Each character is scanned
+    once; a value is only decoded (with ``json.loads``) when it is complete.
+    Arrays and objects complete on their closing bracket, scalars on the
+    comma or brace after them.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.key: Optional[str] = None
+        self.key_start: Optional[int] = None
+        self.value_start: Optional[int] = None
+        self.fields = {}
+
+    def _emit(self, end: int, done: List[Tuple[str, Any]]):
+        raw = self.buffer[self.value_start : end].strip()
+        self.value_start = None
+        if self.key is None or not raw:
+            return
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        self.fields[self.key] = value
+        done.append((self.key, value))
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self.buffer += text
+        done: List[Tuple[str, Any]] = []
+        buffer = self.buffer
+        for pos in range(self.pos, len(buffer)):
+            char = buffer[pos]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.key_start is not None:
+                        self.key = json.loads(buffer[self.key_start : pos + 1])
+                        self.key_start = None
+                continue
+
+            if char == '"':
+                self.in_string = True
+                # A string at the top level, not in a value, is a key
+                if self.depth == 1 and self.value_start is None:
+                    self.key_start = pos
+            elif char in "[{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+                if self.depth == 1 and self.value_start is not None:
+                    self._emit(pos + 1, done)
+                elif self.depth == 0 and self.value_start is not None:
+                    self._emit(pos, done)
+            elif self.depth == 1:
+                if char == ":":
+                    self.value_start = pos + 1
+                elif char == "," and self.value_start is not None:
+                    self._emit(pos, done)
+        self.pos = len(buffer)
+        return done
@@ -0,0 +1,215 @@
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cookies linkedin_api needs for an authenticated session
+AUTH_COOKIES = ("li_at", "JSESSIONID")
+
+
+@dataclass(frozen=True)
+class LinkedInAccount:
+    email: str
+    password: str
+
+
+@dataclass
+class PoolMetrics:
+    """Counters describing how well the session pool is doing"""
+
+    hits: int = 0
+    logins: int = 0
+    reauths: int = 0
+    discarded: int = 0
+    acquisitions: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_wait(self, waited: float):
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "logins": self.logins,
+                "reauths": self.reauths,
+                "discarded": self.discarded,
+                "acquisitions": self.acquisitions,
+                "wait_time_total": round(self.wait_time_total, 4),
+                "wait_time_avg": round(
+                    self.wait_time_total / self.acquisitions, 4
+                )
+                if self.acquisitions
+                else 0.0,
+                "wait_time_max": round(self.wait_time_max, 4),
+            }
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    account: LinkedInAccount
+    created_at: float
+
+
+def parse_accounts(
+    accounts: Optional[str], email: Optional[str] = None, password: Optional[str] = None
+) -> List[LinkedInAccount]:
+    """Build the account list from "email:password,email:password" plus the primary login"""
+    result = []
+    if email and password:
+        result.append(LinkedInAccount(email, password))
+
+    for entry in (accounts or "").split(","):
+        entry = entry.strip()
+        if not entry or ":" not in entry:
+            continue
+        acc_email, acc_password = entry.split(":", 1)
+        account = LinkedInAccount(acc_email.strip(), acc_password.strip())
+        if account not in result:
+            result.append(account)
+    return result
+
+
+def fetch_profile_bundle(
+    api: Any, username: str, executor: Optional[Executor] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Fetch profile and contact info, overlapping the two calls when given an executor"""
+    if executor is None:
+        return api.get_profile(username), api.get_profile_contact_info(username)
+
+    contact_future = executor.submit(api.get_profile_contact_info, username)
+    try:
+        profile_data = api.get_profile(username)
+    except Exception:
+        contact_future.cancel()
+        raise
+    return profile_data, contact_future.result()
+
+
+def _default_client_factory(account: LinkedInAccount):
+    from linkedin_api import Linkedin
+
+    return Linkedin(account.email, account.password)
+
+
+class LinkedInSessionPool:
+    """
+    Process-wide pool of authenticated linkedin_api clients.
+
+    Clients are logged in once and reused across requests. A client is
+    re-authenticated when it gets older than ``max_age`` or its auth cookies
+    expire, at most ``max_sessions`` clients are checked out at once, and new
+    logins rotate round-robin across the configured accounts.
+    """
+
+    def __init__(
+        self,
+        accounts: List[LinkedInAccount],
+        max_sessions: int = 2,
+        max_age: float = 6 * 3600,
+        acquire_timeout: float = 30.0,
+        client_factory: Callable[[LinkedInAccount], Any] = _default_client_factory,
+    ):
+        if not accounts:
+            raise ValueError("LinkedInSessionPool needs at least one account")
+        self.accounts = accounts
+        self.max_sessions = max_sessions
+        self.max_age = max_age
+        self.acquire_timeout = acquire_timeout
+        self.client_factory = client_factory
+        self.metrics = PoolMetrics()
+
+        self._idle: List[_PooledClient] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_sessions)
+        self._account_cycle = itertools.cycle(accounts)
+
+    def _is_expired(self, pooled: _PooledClient) -> bool:
+        if time.monotonic() - pooled.created_at > self.max_age:
+            return True
+
+        # linkedin_api keeps a requests.Session on client.client.session
+        session = getattr(getattr(pooled.client, "client", None), "session", None)
+        cookies = getattr(session, "cookies", None)
+        if cookies is None:
+            return False
+
+        now = time.time()
+        for cookie in cookies:
+            if cookie.name in AUTH_COOKIES and cookie.expires and cookie.expires < now:
+                return True
+        return False
+
+    def _login(self) -> _PooledClient:
+        with self._lock:
+            account = next(self._account_cycle)
+        client = self.client_factory(account)
+        self.metrics.incr("logins")
+        logger.info(f"Authenticated new LinkedIn session for {account.email}")
+        return _PooledClient(client, account, time.monotonic())
+
+    def _checkout(self) -> _PooledClient:
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+
+            if pooled is None:
+                return self._login()
+
+            if self._is_expired(pooled):
+                self.metrics.incr("reauths")
+                logger.info(f"LinkedIn session for {pooled.account.email} expired")
+                continue
+
+            self.metrics.incr("hits")
+            return pooled
+
+    def _checkin(self, pooled: _PooledClient):
+        with self._lock:
+            self._idle.append(pooled)
+
+    @contextmanager
+    def session(self):
+        """Check out an authenticated client for the duration of the block"""
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError("Timed out waiting for a LinkedIn session")
+        self.metrics.record_wait(time.monotonic() - started)
+
+        try:
+            pooled = self._checkout()
+            try:
+                yield pooled.client
+            except Exception:
+                # The session may be throttled or logged out, so never reuse it
+                self.metrics.incr("discarded")
+                raise
+            else:
+                self._checkin(pooled)
+        finally:
+            self._slots.release()
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            idle = len(self._idle)
+        return {**self.metrics.as_dict(), "idle": idle, "accounts": len(self.accounts)}
@@ -0,0 +1,194 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .concurrency import run_blocking
+from .instrumentation import annotate
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Bump a prompt's version whenever its template changes so old answers stop matching
+PROMPT_VERSIONS = {
+    "ai_analysis": "2",
+    "job_recommendations": "2",
+    "ats_resume": "2",
+}
+
+
+def _normalize(value: Any) -> Any:
+    """Canonical form of prompt inputs: trimmed strings, collapsed whitespace"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _succeeded(result: Any) -> bool:
+    if result is None:
+        return False
+    if isinstance(result, dict) and result.get("success") is False:
+        return False
+    return True
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for LLM responses.
+
+    Keys are a SHA-256 of (kind, model, prompt version, normalized inputs,
+    temperature), so byte-identical requests share an answer no matter which
+    worker or session asked first. Failed responses are never stored.
+    """
+
+    def __init__(self, store: SharedCache, enabled: bool = True):
+        self.store = store
+        self.enabled = enabled
+        # Store I/O for coroutine functions runs here, off the event loop
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-cache")
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "bypassed": 0, "stored": 0}
+        )
+
+    @staticmethod
+    def make_key(
+        kind: str, model: str, inputs: Any, temperature: Optional[float] = None
+    ) -> str:
+        payload = json.dumps(
+            {
+                "kind": kind,
+                "model": model,
+                "version": PROMPT_VERSIONS.get(kind, "0"),
+                "temperature": temperature,
+                "inputs": _normalize(inputs),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return f"{kind}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    def _count(self, kind: str, name: str):
+        with self._lock:
+            self._counters[kind][name] += 1
+
+    def lookup(self, kind: str, key: str) -> Optional[Any]:
+        value, _ = self.store.get(key)
+        self._count(kind, "hits" if value is not None else "misses")
+        return value
+
+    def save(self, kind: str, key: str, value: Any):
+        if _succeeded(value):
+            self.store.set(key, value)
+            self._count(kind, "stored")
+
+    async def alookup(self, kind: str, key: str) -> Optional[Any]:
+        return await run_blocking(self.executor, self.lookup, kind, key)
+
+    async def asave(self, kind: str, key: str, value: Any):
+        await run_blocking(self.executor, self.save, kind, key, value)
+
+    def cached(
+        self,
+        kind: str,
+        model: str,
+        temperature: Optional[float] = None,
+    ) -> Callable:
+        """
+        Decorate an LLM call (a function or coroutine function returning the
+        answer) so its results are cached.
+
+        The wrapped function accepts ``bypass_cache=True`` to force a fresh
+        call, and exposes ``lookup(*args)`` / ``save(value, *args)`` (and the
+        awaitable ``alookup`` / ``asave``) for callers (like the streaming
+        endpoint) that produce the value themselves.
+        Coroutine functions get an async wrapper; both flavours share keys, so
+        sync and async callers of the same prompt share answers.
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            def key_for(args, kwargs):
+                return self.make_key(
+                    kind, model, {"args": args, "kwargs": kwargs}, temperature
+                )
+
+            @functools.wraps(fn)
+            def wrapper(*args, bypass_cache: bool = False, **kwargs):
+                if not self.enabled or bypass_cache:
+                    self._count(kind, "bypassed")
+                    annotate(cache="bypass")
+                    return fn(*args, **kwargs)
+
+                key = key_for(args, kwargs)
+                value = self.lookup(kind, key)
+                if value is not None:
+                    logger.info(f"LLM cache hit for {kind}")
+                    annotate(cache="hit")
+                    return value
+                annotate(cache="miss")
+
+                value = fn(*args, **kwargs)
+                self.save(kind, key, value)
+                return value
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, bypass_cache: bool = False, **kwargs):
+                if not self.enabled or bypass_cache:
+                    self._count(kind, "bypassed")
+                    annotate(cache="bypass")
+                    return await fn(*args, **kwargs)
+
+                key = key_for(args, kwargs)
+                value = await self.alookup(kind, key)
+                if value is not None:
+                    logger.info(f"LLM cache hit for {kind}")
+                    annotate(cache="hit")
+                    return value
+                annotate(cache="miss")
+
+                value = await fn(*args, **kwargs)
+                await self.asave(kind, key, value)
+                return value
+
+            def lookup(*args, **kwargs):
+                if not self.enabled:
+                    return None
+                return self.lookup(kind, key_for(args, kwargs))
+
+            def save(value, *args, **kwargs):
+                if self.enabled:
+                    self.save(kind, key_for(args, kwargs), value)
+
+            async def alookup(*args, **kwargs):
+                if not self.enabled:
+                    return None
+                return await self.alookup(kind, key_for(args, kwargs))
+
+            async def asave(value, *args, **kwargs):
+                if self.enabled:
+                    await self.asave(kind, key_for(args, kwargs), value)
+
+            if inspect.iscoroutinefunction(fn):
+                wrapper = async_wrapper
+            wrapper.lookup = lookup
+            wrapper.save = save
+            wrapper.alookup = alookup
+            wrapper.asave = asave
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {kind: dict(c) for kind, c in self._counters.items()}
+        return {"enabled": self.enabled, "kinds": counters, **self.store.stats()}
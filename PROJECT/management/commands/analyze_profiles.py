@@ -0,0 +1,81 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from PROJECT.bulk import read_urls
+
+UPSTREAMS = ("linkedin", "openai", "gemini")
+
+
+class Command(BaseCommand):
+    help = (
+        "Analyze LinkedIn profiles in bulk from a CSV or JSONL file of URLs. "
+        "Results are appended to a JSONL file; rerunning with the same output "
+        "resumes where the last run stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="CSV (linkedin_url/url column, or first column) or JSONL file")
+        parser.add_argument("--output", help="results JSONL (default: <input>.results.jsonl)")
+        parser.add_argument(
+            "--workers", type=int, help=f"profiles at once (default {settings.BULK_ANALYSIS['WORKERS']})"
+        )
+        for name in UPSTREAMS:
+            limits = settings.BULK_ANALYSIS["UPSTREAMS"][name]
+            parser.add_argument(
+                f"--{name}-concurrency",
+                type=int,
+                help=f"{name} calls in flight (default {limits['CONCURRENCY']})",
+            )
+            parser.add_argument(
+                f"--{name}-per-minute",
+                type=float,
+                help=f"{name} calls started per minute, 0 = unlimited (default {limits['PER_MINUTE']})",
+            )
+        parser.add_argument("--restart", action="store_true", help="discard earlier results and start over")
+        parser.add_argument("--progress-every", type=int, default=10, help="report every N profiles")
+
+    def handle(self, *args, **options):
+        from PROJECT.views import bulk_analyzer
+
+        if not os.path.exists(options["input"]):
+            raise CommandError(f"No such file: {options['input']}")
+        urls = read_urls(options["input"])
+        if not urls:
+            raise CommandError("No URLs found in the input file")
+
+        output = options["output"] or os.path.splitext(options["input"])[0] + ".results.jsonl"
+        if options["restart"] and os.path.exists(output):
+            os.remove(output)
+
+        upstreams = {}
+        for name in UPSTREAMS:
+            limits = {}
+            if options[f"{name}_concurrency"] is not None:
+                limits["CONCURRENCY"] = options[f"{name}_concurrency"]
+            if options[f"{name}_per_minute"] is not None:
+                limits["PER_MINUTE"] = options[f"{name}_per_minute"]
+            upstreams[name] = limits
+
+        def progress(summary):
+            self.stdout.write(
+                f"{summary['processed']}/{summary['processed'] + summary['remaining']} "
+                f"({summary['failed']} failed) {summary['profiles_per_min']} profiles/min"
+            )
+
+        analyzer = bulk_analyzer(workers=options["workers"], upstreams=upstreams)
+        self.stdout.write(f"Analyzing {len(urls)} profiles into {output}")
+        summary = analyzer.run(urls, output, progress=progress, progress_every=options["progress_every"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done: {summary['ok']} ok, {summary['failed']} failed, "
+                f"{summary['skipped']} already done in {summary['elapsed_s']}s "
+                f"({summary['profiles_per_min']} profiles/min)"
+            )
+        )
+        for name, stats in summary["throttles"].items():
+            self.stdout.write(
+                f"  {name:<9} {stats['calls']:5} calls, {stats['wait_time_total']:.1f}s waiting for limits"
+            )
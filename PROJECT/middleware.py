@@ -0,0 +1,46 @@
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
+
+from .instrumentation import tracer
+
+
+def _finish(request, response, token, span):
+    trace = tracer.end_trace(token)
+    if trace is None:
+        return response
+    match = getattr(request, "resolver_match", None)
+    route = match.url_name if match and match.url_name else request.path
+    tracer.observe(f"request {route}", span.duration_ms)
+    # The "total" span closes last, so it ends the header
+    response["Server-Timing"] = trace.server_timing()
+    return response
+
+
+@sync_and_async_middleware
+def server_timing_middleware(get_response):
+    """
+    Trace sampled requests and report their spans in a ``Server-Timing`` header.
+
+    Keep it first in MIDDLEWARE so session load/save are inside the trace.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            token = tracer.start_trace(request.path)
+            if token is None:
+                return await get_response(request)
+            with tracer.span("total") as span:
+                response = await get_response(request)
+            return _finish(request, response, token, span)
+
+    else:
+
+        def middleware(request):
+            token = tracer.start_trace(request.path)
+            if token is None:
+                return get_response(request)
+            with tracer.span("total") as span:
+                response = get_response(request)
+            return _finish(request, response, token, span)
+
+    return middleware
@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from .concurrency import SingleFlight, submit_in_context
+from .instrumentation import annotate, span, traced
+
+logger = logging.getLogger(__name__)
+
+
+class PDFRenderer:
+    """
+    Render HTML to PDF with WeasyPrint off the request thread.
+
+    The stylesheet and font configuration are parsed once and reused. Rendered
+    PDFs are cached on disk by a hash of the HTML (shared by every worker on
+    the host, capped at ``max_bytes`` with least-recently-used eviction), at
+    most ``workers`` renders run at once, and identical renders in flight are
+    coalesced.
+    """
+
+    def __init__(
+        self,
+        stylesheet: str,
+        cache_dir: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        workers: int = 2,
+        timeout: float = 60.0,
+    ):
+        self.stylesheet = stylesheet
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf")
+        self.renders = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self._css = None
+        self._font_config = None
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def cache_key(html: str) -> str:
+        return hashlib.sha256(html.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _stylesheets(self):
+        with self._lock:
+            if self._css is None:
+                from weasyprint import CSS
+                from weasyprint.text.fonts import FontConfiguration
+
+                self._font_config = FontConfiguration()
+                self._css = CSS(string=self.stylesheet, font_config=self._font_config)
+            return [self._css], self._font_config
+
+    def cached(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                pdf = f.read()
+        except FileNotFoundError:
+            return None
+        # Bump mtime so eviction treats this file as recently used
+        os.utime(path)
+        return pdf
+
+    def _store(self, key: str, pdf: bytes):
+        # Write to a temp file and rename so readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+    @traced("pdf.weasyprint")
+    def _render(self, html: str, key: str) -> bytes:
+        from weasyprint import HTML
+
+        stylesheets, font_config = self._stylesheets()
+        pdf = HTML(string=html).write_pdf(stylesheets=stylesheets, font_config=font_config)
+        self._store(key, pdf)
+        return pdf
+
+    def submit(self, html: str) -> Future:
+        """Start rendering (or fetch from cache) and return a future of the PDF bytes"""
+        key = self.cache_key(html)
+        pdf = self.cached(key)
+        if pdf is not None:
+            with self._lock:
+                self.hits += 1
+            annotate(cache="hit")
+            future = Future()
+            future.set_result(pdf)
+            return future
+
+        with self._lock:
+            self.misses += 1
+        annotate(cache="miss")
+        return submit_in_context(self.executor, self.renders.do, key, self._render, html, key)
+
+    def render(self, html: str) -> bytes:
+        with span("pdf.render") as timing:
+            pdf = self.submit(html).result(timeout=self.timeout)
+            timing.set(bytes=len(pdf))
+            return pdf
+
+    async def arender(self, html: str) -> bytes:
+        """render for async views: waits on the render without holding a thread"""
+        with span("pdf.render") as timing:
+            pdf = await asyncio.wait_for(asyncio.wrap_future(self.submit(html)), self.timeout)
+            timing.set(bytes=len(pdf))
+            return pdf
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, **self.renders.stats()}
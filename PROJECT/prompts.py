@@ -0,0 +1,189 @@
+import json
+import logging
+import math
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fields each prompt actually reads from linkedin_api's get_profile() output
+PROFILE_FIELDS = {
+    "firstName": None,
+    "lastName": None,
+    "headline": None,
+    "summary": None,
+    "locationName": None,
+    "industryName": None,
+    "experience": ["title", "companyName", "locationName", "description", "timePeriod"],
+    "education": ["schoolName", "degreeName", "fieldOfStudy", "timePeriod"],
+    "skills": ["name"],
+    "certifications": ["name", "authority", "timePeriod"],
+    "projects": ["title", "description", "timePeriod"],
+    "languages": ["name"],
+    "honors": ["title", "issuer"],
+    "volunteer": ["role", "companyName", "cause"],
+    "publications": ["name", "publisher"],
+}
+
+CONTACT_FIELDS = ["email_address", "phone_numbers", "websites", "twitter"]
+
+PROMPT_SPECS = {
+    "ai_analysis": {"contact": False, "budget": 3000},
+    "ats_resume": {"contact": True, "budget": 4000},
+}
+
+# Applied in order until the profile fits the budget: least useful first
+TRUNCATION_STEPS: List[Tuple[str, Any]] = [
+    ("text", 800),
+    ("cap", ("publications", 0)),
+    ("cap", ("honors", 0)),
+    ("cap", ("volunteer", 0)),
+    ("cap", ("projects", 2)),
+    ("cap", ("certifications", 3)),
+    ("cap", ("skills", 25)),
+    ("text", 300),
+    ("cap", ("education", 2)),
+    ("cap", ("experience", 5)),
+    ("text", 120),
+    ("cap", ("experience", 3)),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token for English/JSON)"""
+    return math.ceil(len(text) / 4)
+
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _prune(value: Any) -> Any:
+    """Drop nulls and empty containers recursively"""
+    if isinstance(value, dict):
+        pruned = {k: _prune(v) for k, v in value.items()}
+        return {k: v for k, v in pruned.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        pruned = [_prune(v) for v in value]
+        return [v for v in pruned if v not in (None, "", [], {})]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def _short_date(date: Dict[str, Any]) -> str:
+    if date.get("month"):
+        return f"{date.get('year')}-{date['month']:02d}"
+    return str(date.get("year", ""))
+
+
+def _time_period(period: Dict[str, Any]) -> str:
+    start = _short_date(period.get("startDate") or {})
+    end = _short_date(period.get("endDate") or {}) or "present"
+    return f"{start} to {end}" if start else ""
+
+
+def project_profile(linkedin_data: Dict[str, Any], include_contact: bool) -> Dict[str, Any]:
+    """Keep only the profile fields prompts use, in a compact shape"""
+    profile = linkedin_data.get("profile") or {}
+    projected: Dict[str, Any] = {}
+
+    for field, subfields in PROFILE_FIELDS.items():
+        value = profile.get(field)
+        if subfields is None or not isinstance(value, list):
+            projected[field] = value
+            continue
+
+        items = []
+        for item in value:
+            if not isinstance(item, dict):
+                continue
+            entry = {k: item.get(k) for k in subfields}
+            if isinstance(entry.get("timePeriod"), dict):
+                entry["timePeriod"] = _time_period(entry["timePeriod"])
+            items.append(entry)
+        # Skills are just names; a flat list is far cheaper than a list of dicts
+        if field in ("skills", "languages"):
+            items = [i.get("name") for i in items]
+        projected[field] = items
+
+    if include_contact:
+        contact = linkedin_data.get("contact") or {}
+        projected["contact"] = {k: contact.get(k) for k in CONTACT_FIELDS}
+
+    return _prune(projected)
+
+
+def _truncate_text(data: Any, limit: int) -> Any:
+    if isinstance(data, dict):
+        return {k: _truncate_text(v, limit) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_truncate_text(v, limit) for v in data]
+    if isinstance(data, str) and len(data) > limit:
+        return data[:limit].rstrip() + "..."
+    return data
+
+
+def _apply_step(data: Dict[str, Any], step: str, arg: Any) -> Dict[str, Any]:
+    if step == "text":
+        return _truncate_text(data, arg)
+    field, size = arg
+    if field in data:
+        data = dict(data)
+        if size:
+            data[field] = data[field][:size]
+        else:
+            del data[field]
+    return data
+
+
+class PromptStats:
+    """Running totals of prompt input size before and after compaction"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[str, Dict[str, int]] = {}
+
+    def record(self, prompt: str, before: int, after: int):
+        with self._lock:
+            totals = self.totals.setdefault(
+                prompt, {"calls": 0, "tokens_before": 0, "tokens_after": 0}
+            )
+            totals["calls"] += 1
+            totals["tokens_before"] += before
+            totals["tokens_after"] += after
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {k: dict(v) for k, v in self.totals.items()}
+
+
+prompt_stats = PromptStats()
+
+
+def build_profile_context(
+    linkedin_data: Dict[str, Any],
+    prompt: str,
+    tokenizer: Callable[[str], int] = estimate_tokens,
+) -> str:
+    """
+    Serialize the parts of a profile a prompt needs, within its token budget.
+
+    Returns compact JSON. The size before (the old indent=2 dump of the whole
+    session payload) and after is logged and added to ``prompt_stats``.
+    """
+    spec = PROMPT_SPECS[prompt]
+    data = project_profile(linkedin_data, spec["contact"])
+    text = compact_json(data)
+
+    for step, arg in TRUNCATION_STEPS:
+        if tokenizer(text) <= spec["budget"]:
+            break
+        data = _apply_step(data, step, arg)
+        text = compact_json(data)
+
+    before = tokenizer(json.dumps(linkedin_data, indent=2, default=str))
+    after = tokenizer(text)
+    prompt_stats.record(prompt, before, after)
+    logger.info(f"{prompt} profile context: {before} -> {after} tokens")
+    return text
@@ -0,0 +1,192 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+HEADING_RE = re.compile(r"<h([1-4])\b[^>]*>(.*?)</h\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Words in a chat request that point at a kind of section; a section's kind
+# comes from its heading (e.g. "Professional Experience" -> experience)
+SECTION_KEYWORDS = {
+    "summary": ("summary", "profile", "objective", "intro"),
+    "experience": ("experience", "work", "job", "jobs", "employment", "internship"),
+    "skills": ("skill", "skills", "technologies", "tools", "stack", "keywords"),
+    "education": ("education", "degree", "university", "college", "school", "gpa"),
+    "projects": ("project", "projects"),
+    "certifications": ("certification", "certifications", "certificate", "courses", "license"),
+    "header": ("name", "contact", "email", "phone", "address", "headline"),
+}
+
+# Words too common in entry headings to identify one ("Software Engineer, Example Corp")
+ENTRY_STOPWORDS = frozenset(
+    "and at for the of in to with a an engineer developer intern senior junior "
+    "lead manager present".split()
+)
+
+# Past this share of the document, sending sections saves too little to bother
+MAX_TARGET_SHARE = 0.7
+
+
+@dataclass
+class Section:
+    id: str
+    title: str
+    html: str
+    kind: str
+
+
+def _text(html: str) -> str:
+    return " ".join(TAG_RE.sub(" ", html).split())
+
+
+def _words(text: str) -> List[str]:
+    return WORD_RE.findall(text.lower())
+
+
+def _kind(title: str) -> str:
+    words = set(_words(title))
+    for kind, keywords in SECTION_KEYWORDS.items():
+        if kind != "header" and words & set(keywords):
+            return kind
+    slug = "-".join(_words(title)[:3])
+    return slug or "section"
+
+
+def split_sections(html: str) -> List[Section]:
+    """
+    Cut resume HTML into addressable sections without changing a byte.
+
+    The section heading level is the highest one used more than once (``h2``
+    in the resumes Gemini writes); headings one level below it (``h3``) split
+    a section into entries, so each job is its own section. Text before the
+    first section heading is the "header" (name, contact line).
+    ``"".join(s.html for s in sections) == html`` always holds.
+    """
+    headings = [(m.start(), int(m.group(1)), _text(m.group(2))) for m in HEADING_RE.finditer(html)]
+    levels = [level for _, level, _ in headings]
+    repeated = [level for level in set(levels) if levels.count(level) > 1]
+    if not repeated:
+        return [Section("resume", "Resume", html, "resume")]
+
+    section_level = min(repeated)
+    cuts = [(pos, level, title) for pos, level, title in headings if level in (section_level, section_level + 1)]
+    sections: List[Section] = []
+    ids: Dict[str, int] = {}
+
+    def add(base: str, title: str, start: int, end: int, kind: str):
+        if start >= end:
+            return
+        count = ids[base] = ids.get(base, 0) + 1
+        section_id = base if count == 1 else f"{base}-{count}"
+        sections.append(Section(section_id, title, html[start:end], kind))
+
+    add("header", "Header", 0, cuts[0][0], "header")
+    kind, entries = "section", 0
+    for index, (pos, level, title) in enumerate(cuts):
+        end = cuts[index + 1][0] if index + 1 < len(cuts) else len(html)
+        if level == section_level:
+            kind, entries = _kind(title), 0
+            add(kind, title, pos, end, kind)
+        elif sections and sections[-1].kind == kind and kind != "header":
+            entries += 1
+            add(f"{kind}-{entries}", title, pos, end, kind)
+        else:
+            # An entry heading before any section heading belongs to the header
+            add("header", title, pos, end, "header")
+    return sections
+
+
+@dataclass
+class SectionEdit:
+    """A chat edit narrowed to some sections of the resume"""
+
+    sections: List[Section]
+    targets: List[str]
+
+    def outline(self) -> str:
+        """One line per section, so the model knows what surrounds the targets"""
+        return "\n".join(
+            f"- {s.id}: {s.title} ({len(_text(s.html).split())} words)" for s in self.sections
+        )
+
+    def target_html(self) -> str:
+        return "\n".join(
+            f'<section id="{s.id}">\n{s.html.strip()}\n</section>'
+            for s in self.sections
+            if s.id in self.targets
+        )
+
+    def apply(self, patch: List[Dict[str, Any]]) -> str:
+        """
+        The resume with ``patch`` (``[{"id": ..., "html": ...}]``) applied.
+
+        Known ids are replaced (empty html removes the section); new ids are
+        inserted after the last targeted section, in patch order.
+        """
+        replaced = {}
+        added = []
+        known = {s.id for s in self.sections}
+        for item in patch:
+            section_id = str(item.get("id", "")).strip()
+            html = item.get("html") or ""
+            if section_id in known:
+                replaced[section_id] = html
+            elif html.strip():
+                added.append(html)
+
+        anchor = max(i for i, s in enumerate(self.sections) if s.id in self.targets)
+        parts = []
+        for index, section in enumerate(self.sections):
+            html = replaced.get(section.id, section.html)
+            if section.id in replaced and html.strip():
+                # Keep the separator the section originally ended with
+                html = html.strip() + section.html[len(section.html.rstrip()):]
+            parts.append(html)
+            if index == anchor:
+                parts.extend(f"{new.strip()}\n" for new in added)
+        return "".join(parts)
+
+
+def plan_edit(html: str, message: str) -> Optional[SectionEdit]:
+    """
+    Pick the sections a chat request is about, or None to edit the whole document.
+
+    Sections are picked by kind ("experience", "skills"). Entry headings named
+    in the request (a company, a school) narrow their kind down to those
+    entries. Requests that name nothing, or whose targets are most of the
+    resume, return None.
+    """
+    sections = split_sections(html)
+    if len(sections) < 2:
+        return None
+
+    words = set(_words(message))
+    kinds = {kind for kind, keywords in SECTION_KEYWORDS.items() if words & set(keywords)}
+
+    # A word shared by k entry headings counts 1/k, so "Corp" alone doesn't
+    # pick every "... Corp" entry but "Example Corp 3" picks the third one
+    titles = {
+        s.id: set(_words(s.title)) - ENTRY_STOPWORDS - set(_words(s.kind))
+        for s in sections
+        if s.id != s.kind
+    }
+    shared: Dict[str, int] = {}
+    for title in titles.values():
+        for word in title:
+            shared[word] = shared.get(word, 0) + 1
+    entries = [
+        s for s in sections
+        if s.id in titles
+        and (not kinds or s.kind in kinds)
+        and sum(1 / shared[word] for word in titles[s.id] & words) >= 1
+    ]
+    narrowed = {s.kind for s in entries}
+    targets = entries + [s for s in sections if s.kind in kinds - narrowed]
+    targets.sort(key=sections.index)
+    if not targets:
+        return None
+
+    if sum(len(s.html) for s in targets) > MAX_TARGET_SHARE * len(html):
+        return None
+    return SectionEdit(sections, [s.id for s in targets])
@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistry:
+    """
+    Shared clients and heavy modules, built on first use.
+
+    Each factory runs at most once per process (under a lock), so importing
+    the views or running a management command doesn't pay for SDKs and
+    clients it never touches. Services are read as attributes
+    (``services.openai``). Benchmarks and smoke tests can swap one out with
+    ``override``.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._load_times: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Optional[Callable[[], Any]] = None):
+        """Register ``factory`` under ``name``; usable as a decorator"""
+        if factory is None:
+            return lambda fn: self.register(name, fn)
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+        return factory
+
+    def get(self, name: str) -> Any:
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            # Factories may use other services, hence the re-entrant lock
+            if name not in self._instances:
+                started = time.perf_counter()
+                self._instances[name] = self._factories[name]()
+                self._load_times[name] = time.perf_counter() - started
+                logger.info(f"Loaded service {name} in {self._load_times[name] * 1000:.0f}ms")
+            return self._instances[name]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except KeyError:
+            raise AttributeError(f"No service registered as {name!r}") from None
+
+    def override(self, name: str, instance: Any):
+        with self._lock:
+            self._instances[name] = instance
+
+    def reset(self, name: str):
+        with self._lock:
+            self._instances.pop(name, None)
+            self._load_times.pop(name, None)
+
+    def loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "registered": sorted(self._factories),
+                "loaded": sorted(self._instances),
+                "load_ms": {
+                    name: round(seconds * 1000, 1)
+                    for name, seconds in self._load_times.items()
+                },
+            }
@@ -0,0 +1,43 @@
+from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+
+from .instrumentation import annotate, span
+
+
+class SessionStore(DBSessionStore):
+    """Database sessions with session load/save timed and sized for tracing"""
+
+    def _get_session_from_db(self):
+        session = super()._get_session_from_db()
+        annotate(bytes=len(session.session_data) if session else 0)
+        return session
+
+    async def _aget_session_from_db(self):
+        session = await super()._aget_session_from_db()
+        annotate(bytes=len(session.session_data) if session else 0)
+        return session
+
+    def load(self):
+        with span("session.load"):
+            return super().load()
+
+    async def aload(self):
+        with span("session.load"):
+            return await super().aload()
+
+    def create_model_instance(self, data):
+        instance = super().create_model_instance(data)
+        annotate(bytes=len(instance.session_data))
+        return instance
+
+    async def acreate_model_instance(self, data):
+        instance = await super().acreate_model_instance(data)
+        annotate(bytes=len(instance.session_data))
+        return instance
+
+    def save(self, must_create=False):
+        with span("session.save"):
+            return super().save(must_create)
+
+    async def asave(self, must_create=False):
+        with span("session.save"):
+            return await super().asave(must_create)
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from .concurrency import run_blocking
+from .instrumentation import span
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+REF_SUFFIX = "_ref"
+MISSING = object()
+
+
+class SessionPayloadStore:
+    """
+    Keep large session values out of the session row.
+
+    The session only holds a short reference (``<name>_ref``) per payload;
+    the payload itself lives compressed in a shared blob store, addressed by
+    its content hash. LinkedIn profiles are additionally keyed by username,
+    so every session looking at the same profile shares one blob. Setting a
+    value that hasn't changed doesn't touch the session or the store.
+
+    ``aget``/``aset`` are the async view variants: they use the session's
+    async API and run blob store I/O on a small dedicated executor.
+    """
+
+    def __init__(self, store: SharedCache, workers: int = 4):
+        self.store = store
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="session-payloads"
+        )
+
+    @staticmethod
+    def _blob_key(name: str, value: Any) -> str:
+        digest = hashlib.sha256(
+            json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+        ).hexdigest()[:32]
+        if name == "linkedin_data" and isinstance(value, dict) and value.get("username"):
+            return f"profile:{value['username']}:{digest}"
+        return f"{name}:{digest}"
+
+    @staticmethod
+    def _memo(session) -> Dict[str, Any]:
+        # Session objects are per request, so this caches reads for one request
+        memo = getattr(session, "_payload_memo", None)
+        if memo is None:
+            memo = session._payload_memo = {}
+        return memo
+
+    def get(self, session, name: str, default: Any = None) -> Any:
+        ref = session.get(name + REF_SUFFIX)
+        if not ref:
+            return default
+
+        memo = self._memo(session)
+        if ref not in memo:
+            with span("session_payloads.read", payload=name):
+                value, _ = self.store.get(ref)
+            if value is None:
+                logger.warning(f"Session payload {name} ({ref}) is no longer stored")
+            memo[ref] = value
+        value = memo[ref]
+        return default if value is None else value
+
+    def set(self, session, name: str, value: Any):
+        ref = self._blob_key(name, value)
+        if session.get(name + REF_SUFFIX) == ref:
+            return
+
+        with span("session_payloads.write", payload=name):
+            if not self.store.has(ref):
+                self.store.set(ref, value)
+        self._memo(session)[ref] = value
+        session[name + REF_SUFFIX] = ref
+
+    async def aget(self, session, name: str, default: Any = None) -> Any:
+        ref = await session.aget(name + REF_SUFFIX)
+        if not ref:
+            return default
+
+        memo = self._memo(session)
+        if ref not in memo:
+            with span("session_payloads.read", payload=name):
+                value, _ = await run_blocking(self.executor, self.store.get, ref)
+            if value is None:
+                logger.warning(f"Session payload {name} ({ref}) is no longer stored")
+            memo[ref] = value
+        value = memo[ref]
+        return default if value is None else value
+
+    async def aset(self, session, name: str, value: Any):
+        ref = self._blob_key(name, value)
+        if await session.aget(name + REF_SUFFIX) == ref:
+            return
+
+        with span("session_payloads.write", payload=name):
+            if not await run_blocking(self.executor, self.store.has, ref):
+                await run_blocking(self.executor, self.store.set, ref, value)
+        self._memo(session)[ref] = value
+        await session.aset(name + REF_SUFFIX, ref)
+
+    def delete(self, session, name: str):
+        if name + REF_SUFFIX in session:
+            del session[name + REF_SUFFIX]
+
+    def has(self, session, name: str) -> bool:
+        return bool(session.get(name + REF_SUFFIX))
@@ -0,0 +1,170 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    refresh_lease REAL
+);
+CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at);
+"""
+
+
+class SharedCache:
+    """
+    SQLite-backed cache shared by every worker process on the host.
+
+    Values are stored as zlib-compressed JSON. Entries younger than ``ttl``
+    are fresh; entries up to ``stale_ttl`` old are still served but flagged
+    stale so the caller can refresh them in the background. The total stored
+    size is kept under ``max_bytes`` by evicting least recently used entries.
+    """
+
+    # Only rewrite accessed_at this often, so reads rarely take the write lock
+    TOUCH_INTERVAL = 60
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: int = 3600,
+        stale_ttl: int = 7 * 24 * 3600,
+        refresh_lease: int = 120,
+        table: str = "profile_cache",
+    ):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_lease = refresh_lease
+        self.table = table
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.executescript(SCHEMA.format(table=table))
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(",", ":")).encode(), 6)
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        return json.loads(zlib.decompress(blob))
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Return ``(value, is_stale)``; value is None on a miss or when too old"""
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                f"SELECT value, created_at, accessed_at FROM {self.table} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None, False
+
+            blob, created_at, accessed_at = row
+            now = time.time()
+            age = now - created_at
+            if age > self.stale_ttl:
+                return None, False
+
+            if now - accessed_at > self.TOUCH_INTERVAL:
+                conn.execute(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            return self._decode(blob), age > self.ttl
+
+        except sqlite3.Error as e:
+            logger.error(f"{self.table} read failed for {key}: {str(e)}")
+            return None, False
+
+    def set(self, key: str, value: Any):
+        blob = self._encode(value)
+        now = time.time()
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} "
+                    "(key, value, size, created_at, accessed_at, refresh_lease) "
+                    "VALUES (?, ?, ?, ?, ?, NULL)",
+                    (key, blob, len(blob), now, now),
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.error(f"{self.table} write failed for {key}: {str(e)}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        freed = 0
+        victims = []
+        for key, size in conn.execute(
+            f"SELECT key, size FROM {self.table} ORDER BY accessed_at ASC"
+        ):
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((key,))
+            freed += size
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", victims)
+        logger.info(f"Evicted {len(victims)} entries ({freed} bytes) from {self.table}")
+
+    def claim_refresh(self, key: str) -> bool:
+        """Take the background-refresh lease for a key; only one worker wins it"""
+        now = time.time()
+        try:
+            cursor = self._connection().execute(
+                f"UPDATE {self.table} SET refresh_lease = ? "
+                "WHERE key = ? AND (refresh_lease IS NULL OR refresh_lease < ?)",
+                (now + self.refresh_lease, key, now),
+            )
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.error(f"Could not claim refresh lease for {key}: {str(e)}")
+            return False
+
+    def has(self, key: str) -> bool:
+        row = self._connection().execute(
+            f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+        return row is not None
+
+    def delete(self, key: str):
+        self._connection().execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def stats(self) -> Dict[str, Any]:
+        count, total = self._connection().execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+        ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Speculation:
+    future: Future
+    tag: Any
+    expires_at: float
+    cancelled: threading.Event
+
+
+class Speculator:
+    """
+    Work started ahead of the request that will probably want it.
+
+    ``start`` runs ``fn`` on the executor under a key (a session key) and a
+    tag (what the work was computed for, e.g. the profile username). ``take``
+    hands the future to the first request that asks with the same key and
+    tag within ``ttl`` seconds; anything else is a miss and the caller does
+    the work itself. ``fn`` receives a ``cancelled`` event, set by ``cancel``
+    or by a newer ``start`` for the same key, to check between stages.
+    """
+
+    def __init__(self, executor: Executor, ttl: float = 600.0, enabled: bool = True):
+        self.executor = executor
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Speculation] = {}
+        self.started = 0
+        self.hits = 0
+        self.joins = 0
+        self.misses = 0
+        self.expired = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    def _discard(self, entry: _Speculation):
+        entry.cancelled.set()
+        entry.future.cancel()
+
+    def _purge(self, now: float):
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[key]
+                self._discard(entry)
+                self.expired += 1
+
+    def start(self, key: Hashable, tag: Any, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Run ``fn(*args, cancelled=..., **kwargs)`` in the background for ``key``.
+
+        A speculation already running or kept for the same key and tag is left
+        alone (returns False); one for another tag is cancelled and replaced.
+        """
+        if not self.enabled or key is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            previous = self._entries.get(key)
+            if previous is not None and previous.tag == tag and not previous.future.cancelled():
+                return False
+            if previous is not None:
+                del self._entries[key]
+                self._discard(previous)
+                self.cancelled += 1
+            cancelled = threading.Event()
+            # Plain submit: speculative work belongs to no request trace
+            future = self.executor.submit(fn, *args, cancelled=cancelled, **kwargs)
+            self._entries[key] = _Speculation(future, tag, now + self.ttl, cancelled)
+            self.started += 1
+        return True
+
+    def take(self, key: Hashable, tag: Any) -> Optional[Future]:
+        """
+        The speculated future for ``key`` if it was computed for ``tag`` and
+        hasn't expired or failed; None otherwise. Each speculation is taken once.
+        """
+        if not self.enabled or key is None:
+            return None
+        with self._lock:
+            self._purge(time.monotonic())
+            entry = self._entries.pop(key, None)
+            if entry is None or entry.tag != tag:
+                if entry is not None:
+                    self._discard(entry)
+                self.misses += 1
+                return None
+            if entry.future.done() and (entry.future.cancelled() or entry.future.exception()):
+                self.failed += 1
+                return None
+            if entry.future.done():
+                self.hits += 1
+            else:
+                self.joins += 1
+        return entry.future
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the speculation for ``key``, stopping it if it hasn't finished"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._discard(entry)
+            self.cancelled += 1
+        logger.info("Cancelled speculative work")
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.joins + self.misses + self.failed
+            return {
+                "enabled": self.enabled,
+                "started": self.started,
+                "hits": self.hits,
+                "joins": self.joins,
+                "misses": self.misses,
+                "failed": self.failed,
+                "expired": self.expired,
+                "cancelled": self.cancelled,
+                "in_flight": sum(not e.future.done() for e in self._entries.values()),
+                "hit_rate": round((self.hits + self.joins) / lookups, 3) if lookups else None,
+            }
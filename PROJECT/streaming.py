@@ -0,0 +1,50 @@
+import json
+import re
+from typing import Any, Callable, Optional
+
+FENCE = re.compile(r"^\s*(```|~~~)", re.MULTILINE)
+
+
+def sse_event(event: str, data: Any) -> str:
+    """Format one server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class MarkdownBlockStreamer:
+    """
+    Turn a stream of markdown text deltas into HTML in stable chunks.
+
+    Text is buffered until a blank line closes a block outside of a code
+    fence; everything up to that point is rendered and returned, so a chunk
+    is never re-rendered once it has been sent to the browser.
+    """
+
+    def __init__(self, renderer: Callable[[str], str]):
+        self.renderer = renderer
+        self.buffer = ""
+
+    def _stable_boundary(self) -> int:
+        end = self.buffer.rfind("\n\n")
+        while end != -1:
+            # An odd number of fences before the boundary means we're inside one
+            if len(FENCE.findall(self.buffer[:end])) % 2 == 0:
+                return end + 2
+            end = self.buffer.rfind("\n\n", 0, end)
+        return -1
+
+    def feed(self, text: str) -> Optional[str]:
+        self.buffer += text
+        boundary = self._stable_boundary()
+        if boundary == -1:
+            return None
+
+        block, self.buffer = self.buffer[:boundary], self.buffer[boundary:]
+        if not block.strip():
+            return None
+        return self.renderer(block)
+
+    def flush(self) -> Optional[str]:
+        block, self.buffer = self.buffer, ""
+        if not block.strip():
+            return None
+        return self.renderer(block)
@@ -0,0 +1,226 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    owner TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_after REAL NOT NULL,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (kind, status, run_after);
+"""
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class TaskType:
+    fn: Callable[..., Any]
+    workers: int = 2
+    max_attempts: int = 3
+    # Seconds before the first retry; doubles on each further attempt
+    backoff: float = 2.0
+    # A running task whose lease lapses (worker died) is picked up again
+    lease: float = 300.0
+
+
+class TaskQueue:
+    """
+    SQLite-backed task queue with a bounded worker pool per task type.
+
+    Tasks survive restarts and can be claimed by any process sharing the
+    database file. Failures are retried with exponential backoff
+    (``backoff``, then twice that, and so on) up to ``max_attempts``.
+    Finished tasks are deleted ``retention`` seconds after they finish.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.5, retention: float = 24 * 3600,
+                 purge_interval: float = 3600):
+        self.path = str(path)
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._last_purge = 0.0
+        self.types: Dict[str, TaskType] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wakeups: Dict[str, threading.Event] = {}
+        self._workers: Dict[str, List[threading.Thread]] = {}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def register(self, kind: str, fn: Callable[..., Any], **options):
+        self.types[kind] = TaskType(fn, **options)
+
+    def _ensure_workers(self, kind: str):
+        with self._lock:
+            if kind in self._workers:
+                return
+            self._wakeups[kind] = threading.Event()
+            self._workers[kind] = [
+                threading.Thread(
+                    target=self._work, args=(kind,), name=f"task-{kind}-{i}", daemon=True
+                )
+                for i in range(self.types[kind].workers)
+            ]
+            for thread in self._workers[kind]:
+                thread.start()
+
+    def submit(self, kind: str, owner: Optional[str] = None, **payload) -> str:
+        if kind not in self.types:
+            raise ValueError(f"Unknown task type: {kind}")
+
+        task_id = uuid.uuid4().hex
+        now = time.time()
+        self._connection().execute(
+            "INSERT INTO tasks (id, kind, owner, payload, status, run_after, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (task_id, kind, owner, json.dumps(payload, default=str), QUEUED, now, now, now),
+        )
+        self._ensure_workers(kind)
+        self._wakeups[kind].set()
+        logger.info(f"Queued {kind} task {task_id}")
+        self._maybe_purge()
+        return task_id
+
+    def resume(self) -> List[str]:
+        """
+        Start workers for every registered kind with queued or running tasks
+        (left over from before a restart). Returns those kinds.
+        """
+        pending = [
+            kind for (kind,) in self._connection().execute(
+                "SELECT DISTINCT kind FROM tasks WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            )
+            if kind in self.types
+        ]
+        for kind in pending:
+            self._ensure_workers(kind)
+            logger.info(f"Resuming pending {kind} tasks")
+        self._maybe_purge()
+        return pending
+
+    def _claim(self, kind: str) -> Optional[sqlite3.Row]:
+        now = time.time()
+        return self._connection().execute(
+            "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_until = ?, updated_at = ? "
+            "WHERE id = ("
+            "  SELECT id FROM tasks WHERE kind = ? AND ("
+            "    (status = ? AND run_after <= ?) OR (status = ? AND lease_until < ?)"
+            "  ) ORDER BY run_after LIMIT 1"
+            ") RETURNING id, payload, attempts",
+            (RUNNING, now + self.types[kind].lease, now, kind, QUEUED, now, RUNNING, now),
+        ).fetchone()
+
+    def _finish(self, task_id: str, status: str, result: Any = None, error: str = None,
+                run_after: Optional[float] = None):
+        now = time.time()
+        self._connection().execute(
+            "UPDATE tasks SET status = ?, result = ?, error = ?, lease_until = NULL, "
+            "run_after = COALESCE(?, run_after), updated_at = ? WHERE id = ?",
+            (status, json.dumps(result, default=str) if result is not None else None,
+             error, run_after, now, task_id),
+        )
+
+    def _work(self, kind: str):
+        task_type = self.types[kind]
+        wakeup = self._wakeups[kind]
+        while True:
+            try:
+                row = self._claim(kind)
+            except sqlite3.Error as e:
+                logger.error(f"Could not claim {kind} task: {str(e)}")
+                row = None
+
+            if row is None:
+                self._maybe_purge()
+                wakeup.wait(self.poll_interval)
+                wakeup.clear()
+                continue
+
+            task_id, attempts = row["id"], row["attempts"]
+            try:
+                result = task_type.fn(**json.loads(row["payload"]))
+                self._finish(task_id, SUCCEEDED, result=result)
+                logger.info(f"{kind} task {task_id} succeeded")
+            except Exception as e:
+                if attempts < task_type.max_attempts:
+                    delay = task_type.backoff * 2 ** (attempts - 1)
+                    self._finish(task_id, QUEUED, error=str(e), run_after=time.time() + delay)
+                    logger.warning(f"{kind} task {task_id} failed, retrying in {delay}s: {str(e)}")
+                else:
+                    self._finish(task_id, FAILED, error=str(e))
+                    logger.error(f"{kind} task {task_id} failed permanently: {str(e)}")
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT id, kind, owner, status, result, error, attempts, created_at, updated_at "
+            "FROM tasks WHERE id = ?",
+            (task_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        task = dict(row)
+        task["result"] = json.loads(task["result"]) if task["result"] else None
+        return task
+
+    def purge(self, older_than: float = 24 * 3600):
+        """Delete finished tasks older than ``older_than`` seconds"""
+        self._connection().execute(
+            "DELETE FROM tasks WHERE status IN (?, ?) AND updated_at < ?",
+            (SUCCEEDED, FAILED, time.time() - older_than),
+        )
+
+    def _maybe_purge(self):
+        """purge() at most once per ``purge_interval``, whichever thread gets there first"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_purge < self.purge_interval:
+                return
+            self._last_purge = now
+        try:
+            self.purge(self.retention)
+        except sqlite3.Error as e:
+            logger.error(f"Could not purge finished tasks: {str(e)}")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in self._connection().execute(
+            "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"
+        ):
+            counts.setdefault(kind, {})[status] = count
+        return counts
@@ -8,7 +8,22 @@ urlpatterns = [
     path("clear_session/", views.clear_session, name="clear_session"),
     path("ats_resume/", views.ats_resume, name="ats_resume"),
     path("api/get-ai-analysis/", views.api_get_ai_analysis, name="api_get_ai_analysis"),
+    path(
+        "api/stream-ai-analysis/",
+        views.api_stream_ai_analysis,
+        name="api_stream_ai_analysis",
+    ),
     path(
         "api/get-job-listings/", views.api_get_job_listings, name="api_get_job_listings"
     ),
+    path("api/jobs/", views.jobs_api, name="jobs_api"),
+    path("api/tasks/<str:task_id>/", views.task_status_api, name="task_status_api"),
+    path(
+        "api/linkedin-pool-stats/",
+        views.linkedin_pool_stats_api,
+        name="linkedin_pool_stats_api",
+    ),
+    path("api/ats-chat/", views.ats_chat_api, name="ats_chat_api"),
+    path("api/metrics/", views.metrics_api, name="metrics_api"),
+    path("api/bulk-analysis/", views.bulk_analysis_api, name="bulk_analysis_api"),
 ]
@@ -1,23 +1,49 @@
 from django.shortcuts import render, redirect
 from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
-from django.core.cache import cache
-from linkedin_api import Linkedin
-from openai import OpenAI
+from django.urls import reverse
+from django.http import FileResponse, JsonResponse, HttpResponse, StreamingHttpResponse
+from django.conf import settings
+from asgiref.sync import sync_to_async
+import asyncio
+import contextvars
+import functools
 import re
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, List
+import time
+import uuid
+import weakref
+from typing import Dict, Any, Optional, List, AsyncIterator
 from dataclasses import dataclass
-from . import jobs
-from weasyprint import HTML, CSS
-
-# Third-party imports
-import mistune
-from google import genai
-from google.genai import types
+from .chat_history import add_turn
+from .bulk import BulkAnalyzer, parse_urls
+from .concurrency import (
+    SingleFlight,
+    Throttle,
+    aresult_or_default,
+    result_or_default,
+    run_blocking,
+    submit_in_context,
+)
+from .instrumentation import annotate, record_usage, span, traced, tracer
+from .json_stream import JsonFieldStream
+from .llm_cache import LLMResponseCache
+from .pdf_service import PDFRenderer
+from .shared_cache import SharedCache
+from .session_store import SessionPayloadStore
+from .prompts import build_profile_context, estimate_tokens, prompt_stats
+from .resume_sections import SectionEdit, plan_edit
+from .services import ServiceRegistry
+from .speculation import Speculator
+from .streaming import MarkdownBlockStreamer, sse_event
+from .tasks import TaskQueue
+from .linkedin_pool import LinkedInSessionPool, fetch_profile_bundle, parse_accounts
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party imports (the heavy SDKs are loaded on first use, see services below)
 from dotenv import load_dotenv
 from django.utils.safestring import mark_safe
 
@@ -40,10 +66,6 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-markdown_renderer = mistune.create_markdown(
-    escape=False, plugins=["strikethrough", "footnotes", "table"]
-)
-
 
 # Configuration
 @dataclass
@@ -52,23 +74,214 @@ class Config:
     LINKEDIN_PASSWORD: str = os.getenv("LINKEDIN_PASSWORD")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY")
+    # Extra accounts to rotate across, as "email:password,email:password"
+    LINKEDIN_ACCOUNTS: str = os.getenv("LINKEDIN_ACCOUNTS", "")
+    LINKEDIN_POOL_SIZE: int = int(os.getenv("LINKEDIN_POOL_SIZE", "2"))
+    LINKEDIN_SESSION_MAX_AGE: int = int(os.getenv("LINKEDIN_SESSION_MAX_AGE", "21600"))
+    # Per-call budgets (seconds) for the LLM requests behind the analysis page
+    AI_ANALYSIS_TIMEOUT: float = float(os.getenv("AI_ANALYSIS_TIMEOUT", "60"))
+    JOB_RECOMMENDATIONS_TIMEOUT: float = float(
+        os.getenv("JOB_RECOMMENDATIONS_TIMEOUT", "45")
+    )
 
-    def __post_init__(self):
-        if not all([self.LINKEDIN_EMAIL, self.LINKEDIN_PASSWORD, self.OPENAI_API_KEY]):
-            raise ValueError("Missing required environment variables")
+    def require(self, *names: str):
+        """Checked when a client is first built, not at import time"""
+        missing = [name for name in names if not getattr(self, name)]
+        if missing:
+            raise ValueError(
+                f"Missing required environment variables: {', '.join(missing)}"
+            )
 
 
 config = Config()
 
-# Initialize clients
-openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
-gemini_client = genai.Client(api_key=config.GEMINI_API_KEY)
+# Clients, heavy modules and their shared state, built on first use so that
+# importing the views (every worker boot, every management command) stays cheap
+services = ServiceRegistry()
+
+
+@services.register("openai")
+def _openai_client():
+    from openai import OpenAI
+
+    config.require("OPENAI_API_KEY")
+    return OpenAI(api_key=config.OPENAI_API_KEY)
+
+
+@services.register("gemini")
+def _gemini_client():
+    from google import genai
+
+    return genai.Client(api_key=config.GEMINI_API_KEY)
+
+
+@services.register("mistune")
+def _mistune():
+    import mistune
+
+    return mistune
+
+
+@services.register("markdown")
+def _markdown_renderer():
+    return services.mistune.create_markdown(
+        escape=False, plugins=["strikethrough", "footnotes", "table"]
+    )
+
+
+@services.register("jobs")
+def _jobs():
+    # JobSpy and pandas come with it
+    from . import jobs
+
+    return jobs
+
+
+@services.register("linkedin_pool")
+def _linkedin_pool():
+    # Authenticated LinkedIn clients shared by every request in this process
+    config.require("LINKEDIN_EMAIL", "LINKEDIN_PASSWORD")
+    return LinkedInSessionPool(
+        parse_accounts(
+            config.LINKEDIN_ACCOUNTS, config.LINKEDIN_EMAIL, config.LINKEDIN_PASSWORD
+        ),
+        max_sessions=config.LINKEDIN_POOL_SIZE,
+        max_age=config.LINKEDIN_SESSION_MAX_AGE,
+    )
+
+
+@services.register("job_matcher")
+def _job_matcher():
+    # Local similarity of postings to the profile; vectors are indexed next to the job store
+    from .job_matching import JobMatcher
+
+    return JobMatcher(settings.JOB_STORE["PATH"])
+
+
+# Async clients for the async views. Their connection pools belong to the
+# event loop that created them, so keep one set per running loop.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class AsyncClients:
+    openai: Any
+    gemini: Any
+
+
+def async_clients() -> AsyncClients:
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.get(loop)
+    if clients is None:
+        from google import genai
+        from openai import AsyncOpenAI
+
+        config.require("OPENAI_API_KEY")
+        clients = _async_clients[loop] = AsyncClients(
+            openai=AsyncOpenAI(api_key=config.OPENAI_API_KEY),
+            gemini=genai.Client(api_key=config.GEMINI_API_KEY).aio,
+        )
+    return clients
+
+
+# Runs the contact-info call alongside get_profile
+linkedin_executor = ThreadPoolExecutor(
+    max_workers=config.LINKEDIN_POOL_SIZE, thread_name_prefix="linkedin"
+)
+# Concurrent cold requests for the same username share one upstream fetch
+profile_fetches = SingleFlight()
+# Refreshes stale profiles after they have already been served
+refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="profile-refresh")
+
+# Runs the OpenAI and Gemini calls of one request side by side
+llm_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+
+# Blocking work behind the async views (LinkedIn fetches, job scraping), kept
+# off the event loop and bounded separately from the other pools
+profile_executor = ThreadPoolExecutor(
+    max_workers=2 * config.LINKEDIN_POOL_SIZE, thread_name_prefix="profile"
+)
+job_listings_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="job-listings"
+)
+
+# Profile cache shared by every worker on the host, survives restarts
+profile_cache = SharedCache(
+    settings.PROFILE_CACHE["PATH"],
+    max_bytes=settings.PROFILE_CACHE["MAX_BYTES"],
+    ttl=settings.PROFILE_CACHE["TTL"],
+    stale_ttl=settings.PROFILE_CACHE["STALE_TTL"],
+)
+
+# Paid LLM answers, keyed on a hash of model + prompt version + inputs
+llm_cache = LLMResponseCache(
+    SharedCache(
+        settings.LLM_CACHE["PATH"],
+        max_bytes=settings.LLM_CACHE["MAX_BYTES"],
+        ttl=settings.LLM_CACHE["TTL"],
+        stale_ttl=settings.LLM_CACHE["TTL"],
+        table="llm_cache",
+    ),
+    enabled=settings.LLM_CACHE["ENABLED"],
+)
+
+# Large session values (profiles, resumes, chat history) live here; the
+# session row only keeps references to them
+session_payloads = SessionPayloadStore(
+    SharedCache(
+        settings.SESSION_PAYLOADS["PATH"],
+        max_bytes=settings.SESSION_PAYLOADS["MAX_BYTES"],
+        ttl=settings.SESSION_PAYLOADS["TTL"],
+        stale_ttl=settings.SESSION_PAYLOADS["TTL"],
+        table="session_payloads",
+    )
+)
+
+# Ranked job listings per set of recommendations, so later pages don't re-run the search grid
+job_listings_cache = SharedCache(
+    settings.JOB_STORE["PATH"],
+    ttl=settings.JOB_STORE["MAX_AGE"],
+    stale_ttl=settings.JOB_STORE["MAX_AGE"],
+    table="ranked_listings",
+)
+
+
+# Job search prefetching per thread/task; bulk runs turn it off since they
+# never show job listings
+job_prefetch = contextvars.ContextVar("job_prefetch", default=True)
+
+
+class RecommendationsStream(JsonFieldStream):
+    """
+    Job recommendations JSON as Gemini streams it.
+
+    Once JOB_TITLES and LOCATIONS are complete, the job searches start in the
+    background (see prefetch_job_listings) while Gemini writes the rest.
+    """
+
+    def __init__(self, prefetch: bool = True):
+        super().__init__()
+        self.prefetch = prefetch
+
+    def feed(self, text: str):
+        done = super().feed(text)
+        if self.prefetch and {"JOB_TITLES", "LOCATIONS"} <= self.fields.keys():
+            self.prefetch = False
+            annotate(jobs_prefetched_at_char=self.pos)
+            submit_in_context(
+                job_listings_executor,
+                prefetch_job_listings,
+                self.fields["JOB_TITLES"],
+                self.fields["LOCATIONS"],
+            )
+        return done
 
 
 class LinkedInAnalyzerService:
     """Service class to handle LinkedIn profile analysis and AI processing"""
 
     @staticmethod
+    @traced()
     def extract_linkedin_username(url: str) -> Optional[str]:
         """Extract username from LinkedIn URL with improved regex"""
         if not url:
@@ -89,48 +302,79 @@ class LinkedInAnalyzerService:
         return None
 
     @staticmethod
+    @traced()
     def fetch_linkedin_profile(username: str) -> Dict[str, Any]:
         """Fetch LinkedIn profile data with error handling"""
         try:
             # Check cache first
             cache_key = f"linkedin_profile_{username}"
-            cached_data = cache.get(cache_key)
+            cached_data, is_stale = profile_cache.get(cache_key)
             if cached_data:
-                logger.info(f"Retrieved cached data for {username}")
+                annotate(cache="stale" if is_stale else "hit")
+                if is_stale and profile_cache.claim_refresh(cache_key):
+                    # Serve the stale copy now, refresh it off the request path
+                    logger.info(f"Serving stale profile for {username}, refreshing")
+                    refresh_executor.submit(
+                        LinkedInAnalyzerService._refresh_profile, username
+                    )
+                else:
+                    logger.info(f"Retrieved cached data for {username}")
                 return cached_data
 
-            # Fetch from LinkedIn API
-            api = Linkedin(config.LINKEDIN_EMAIL, config.LINKEDIN_PASSWORD)
+            annotate(cache="miss")
+            return profile_fetches.do(
+                username, LinkedInAnalyzerService._fetch_and_cache_profile, username
+            )
 
-            profile_data = api.get_profile(username)
-            contact_info = api.get_profile_contact_info(username)
+        except Exception as e:
+            logger.error(f"Error fetching LinkedIn profile for {username}: {str(e)}")
+            raise Exception(f"Failed to fetch LinkedIn profile: {str(e)}")
 
-            # Combine data
-            result = {
-                "profile": profile_data,
-                "contact": contact_info,
-                "username": username,
-            }
+    @staticmethod
+    @traced()
+    def _fetch_and_cache_profile(username: str) -> Dict[str, Any]:
+        """Fetch a profile from LinkedIn and cache it (runs once per in-flight username)"""
+        cache_key = f"linkedin_profile_{username}"
+
+        # Fetch from LinkedIn API using a pooled, already authenticated client
+        with services.linkedin_pool.session() as api:
+            profile_data, contact_info = fetch_profile_bundle(
+                api, username, linkedin_executor
+            )
 
-            # Cache for 1 hour
-            cache.set(cache_key, result, 3600)
-            logger.info(f"Successfully fetched and cached profile for {username}")
+        # Combine data
+        result = {
+            "profile": profile_data,
+            "contact": contact_info,
+            "username": username,
+        }
 
-            return result
+        # Fresh for PROFILE_CACHE["TTL"], served stale after that
+        profile_cache.set(cache_key, result)
+        logger.info(f"Successfully fetched and cached profile for {username}")
 
-        except Exception as e:
-            logger.error(f"Error fetching LinkedIn profile for {username}: {str(e)}")
-            raise Exception(f"Failed to fetch LinkedIn profile: {str(e)}")
+        return result
 
     @staticmethod
-    def generate_ai_analysis(resume_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate AI analysis using OpenAI with improved prompting"""
+    @traced()
+    def _refresh_profile(username: str):
+        """Background refresh of a stale cached profile"""
         try:
-            # Create a comprehensive prompt
-            analysis_prompt = f"""
+            profile_fetches.do(
+                username, LinkedInAnalyzerService._fetch_and_cache_profile, username
+            )
+        except Exception as e:
+            logger.error(f"Background refresh failed for {username}: {str(e)}")
+
+    @staticmethod
+    @traced()
+    def _analysis_request(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """OpenAI chat completion arguments for the profile analysis prompt"""
+        # Create a comprehensive prompt
+        analysis_prompt = f"""
             As a professional career advisor and LinkedIn expert, analyze this LinkedIn profile data and provide detailed insights:
 
-            Profile Data: {json.dumps(resume_data, indent=2)}
+            Profile Data: {build_profile_context(resume_data, "ai_analysis")}
 
             Please provide analysis in the following areas:
             1. **Profile Strength Assessment** (Score 1-100)
@@ -148,42 +392,86 @@ class LinkedInAnalyzerService:
             Be specific, actionable, and professional in your recommendations.
             """
 
-            response = openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert LinkedIn career advisor with 15+ years of experience helping professionals optimize their profiles and advance their careers.",
-                    },
-                    {"role": "user", "content": analysis_prompt},
-                ],
-                max_tokens=2000,
-                temperature=0.7,
-            )
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert LinkedIn career advisor with 15+ years of experience helping professionals optimize their profiles and advance their careers.",
+                },
+                {"role": "user", "content": analysis_prompt},
+            ],
+            "max_tokens": 2000,
+            "temperature": 0.7,
+            "timeout": config.AI_ANALYSIS_TIMEOUT,
+        }
 
-            return {"analysis": response.choices[0].message.content, "success": True}
+    @staticmethod
+    def _analysis_result(response) -> Dict[str, Any]:
+        record_usage(response)
+        return {"analysis": response.choices[0].message.content, "success": True}
+
+    @staticmethod
+    def _analysis_failed(e: Exception) -> Dict[str, Any]:
+        logger.error(f"Error generating AI analysis: {str(e)}")
+        return {
+            "analysis": f"Error generating analysis: {str(e)}",
+            "success": False,
+        }
+
+    @staticmethod
+    @traced()
+    @llm_cache.cached("ai_analysis", model="gpt-4o-mini", temperature=0.7)
+    def generate_ai_analysis(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate AI analysis using OpenAI with improved prompting"""
+        try:
+            response = services.openai.chat.completions.create(
+                **LinkedInAnalyzerService._analysis_request(resume_data)
+            )
+            return LinkedInAnalyzerService._analysis_result(response)
 
         except Exception as e:
-            logger.error(f"Error generating AI analysis: {str(e)}")
-            return {
-                "analysis": f"Error generating analysis: {str(e)}",
-                "success": False,
-            }
+            return LinkedInAnalyzerService._analysis_failed(e)
 
     @staticmethod
-    def generate_job_recommendations(
-        resume_data: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
-        """Generate job recommendations using Gemini AI with improved schema"""
+    @traced()
+    @llm_cache.cached("ai_analysis", model="gpt-4o-mini", temperature=0.7)
+    async def agenerate_ai_analysis(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of generate_ai_analysis (shares its cache entries)"""
         try:
-            # Extract key information for better analysis
-            profile = resume_data.get("profile", {})
-            experience = profile.get("experience", [])
-            education = profile.get("education", [])
-            skills = profile.get("skills", [])
-
-            # Create focused prompt
-            analysis_text = f"""
+            response = await async_clients().openai.chat.completions.create(
+                **LinkedInAnalyzerService._analysis_request(resume_data)
+            )
+            return LinkedInAnalyzerService._analysis_result(response)
+
+        except Exception as e:
+            return LinkedInAnalyzerService._analysis_failed(e)
+
+    @staticmethod
+    @traced()
+    async def astream_ai_analysis(resume_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """Yield the AI analysis markdown as OpenAI streams it back"""
+        stream = await async_clients().openai.chat.completions.create(
+            **LinkedInAnalyzerService._analysis_request(resume_data), stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    @staticmethod
+    @traced()
+    def _recommendations_request(resume_data: Dict[str, Any]):
+        """Gemini arguments (contents and JSON schema config) for job recommendations"""
+        from google.genai import types
+
+        # Extract key information for better analysis
+        profile = resume_data.get("profile", {})
+        experience = profile.get("experience", [])
+        education = profile.get("education", [])
+        skills = profile.get("skills", [])
+
+        # Create focused prompt
+        analysis_text = f"""
             Analyze this professional profile and recommend suitable job opportunities:
             
             Current Role: {profile.get("headline", "Not specified")}
@@ -197,88 +485,149 @@ class LinkedInAnalyzerService:
             Based on this information, provide job recommendations.
             """
 
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_text(
-                            text=f"{analysis_text}\n\nReturn analysis in the specified JSON format."
-                        ),
-                    ],
-                ),
-            ]
-
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=genai.types.Schema(
-                    type=genai.types.Type.OBJECT,
-                    required=[
-                        "JOB_TITLES",
-                        "LOCATIONS",
-                        "RELATED_DOMAINS",
-                        "RECOMMENDATIONS",
-                        "ATS_SCORE",
-                    ],
-                    properties={
-                        "JOB_TITLES": genai.types.Schema(
-                            type=genai.types.Type.ARRAY,
-                            items=genai.types.Schema(type=genai.types.Type.STRING),
-                        ),
-                        "LOCATIONS": genai.types.Schema(
-                            type=genai.types.Type.ARRAY,
-                            items=genai.types.Schema(type=genai.types.Type.STRING),
-                        ),
-                        "RELATED_DOMAINS": genai.types.Schema(
-                            type=genai.types.Type.ARRAY,
-                            items=genai.types.Schema(
-                                type=genai.types.Type.OBJECT,
-                                required=["domain", "relevance_score"],
-                                properties={
-                                    "domain": genai.types.Schema(
-                                        type=genai.types.Type.STRING
-                                    ),
-                                    "relevance_score": genai.types.Schema(
-                                        type=genai.types.Type.INTEGER
-                                    ),
-                                },
-                            ),
-                        ),
-                        "RECOMMENDATIONS": genai.types.Schema(
-                            type=genai.types.Type.ARRAY,
-                            items=genai.types.Schema(type=genai.types.Type.STRING),
-                        ),
-                        "ATS_SCORE": genai.types.Schema(type=genai.types.Type.INTEGER),
-                        "SKILLS_TO_DEVELOP": genai.types.Schema(
-                            type=genai.types.Type.ARRAY,
-                            items=genai.types.Schema(type=genai.types.Type.STRING),
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(
+                        text=f"{analysis_text}\n\nReturn analysis in the specified JSON format."
+                    ),
+                ],
+            ),
+        ]
+
+        generate_content_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.OBJECT,
+                required=[
+                    "JOB_TITLES",
+                    "LOCATIONS",
+                    "RELATED_DOMAINS",
+                    "RECOMMENDATIONS",
+                    "ATS_SCORE",
+                ],
+                # Titles and locations first, so job searches can start mid-stream
+                property_ordering=[
+                    "JOB_TITLES",
+                    "LOCATIONS",
+                    "RELATED_DOMAINS",
+                    "RECOMMENDATIONS",
+                    "ATS_SCORE",
+                    "SKILLS_TO_DEVELOP",
+                ],
+                properties={
+                    "JOB_TITLES": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(type=types.Type.STRING),
+                    ),
+                    "LOCATIONS": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(type=types.Type.STRING),
+                    ),
+                    "RELATED_DOMAINS": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(
+                            type=types.Type.OBJECT,
+                            required=["domain", "relevance_score"],
+                            properties={
+                                "domain": types.Schema(
+                                    type=types.Type.STRING
+                                ),
+                                "relevance_score": types.Schema(
+                                    type=types.Type.INTEGER
+                                ),
+                            },
                         ),
-                    },
-                ),
-            )
+                    ),
+                    "RECOMMENDATIONS": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(type=types.Type.STRING),
+                    ),
+                    "ATS_SCORE": types.Schema(type=types.Type.INTEGER),
+                    "SKILLS_TO_DEVELOP": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(type=types.Type.STRING),
+                    ),
+                },
+            ),
+        )
 
-            json_string = ""
-            for chunk in gemini_client.models.generate_content_stream(
-                model="gemini-2.0-flash-lite",
-                contents=contents,
-                config=generate_content_config,
+        return {
+            "model": "gemini-2.0-flash-lite",
+            "contents": contents,
+            "config": generate_content_config,
+        }
+
+    @staticmethod
+    def _recommendations_stream() -> RecommendationsStream:
+        return RecommendationsStream(
+            prefetch=settings.JOB_SEARCH["PREFETCH"] and job_prefetch.get()
+        )
+
+    @staticmethod
+    def _recommendations_result(fields: RecommendationsStream, last_chunk) -> Dict[str, Any]:
+        # Gemini reports usage on the last chunk
+        record_usage(last_chunk)
+        return json.loads(fields.buffer)
+
+    @staticmethod
+    def _recommendations_failed(e: Exception) -> None:
+        if isinstance(e, json.JSONDecodeError):
+            logger.error(f"Failed to parse Gemini JSON: {e}")
+        else:
+            logger.error(f"Error generating job recommendations: {str(e)}")
+        return None
+
+    @staticmethod
+    @traced()
+    @llm_cache.cached("job_recommendations", model="gemini-2.0-flash-lite")
+    def generate_job_recommendations(
+        resume_data: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Generate job recommendations using Gemini AI with improved schema"""
+        try:
+            fields = LinkedInAnalyzerService._recommendations_stream()
+            chunk = None
+            for chunk in services.gemini.models.generate_content_stream(
+                **LinkedInAnalyzerService._recommendations_request(resume_data)
             ):
                 if chunk.text:
-                    json_string += chunk.text
+                    fields.feed(chunk.text)
+            return LinkedInAnalyzerService._recommendations_result(fields, chunk)
 
-            return json.loads(json_string)
+        except Exception as e:
+            return LinkedInAnalyzerService._recommendations_failed(e)
+
+    @staticmethod
+    @traced()
+    @llm_cache.cached("job_recommendations", model="gemini-2.0-flash-lite")
+    async def agenerate_job_recommendations(
+        resume_data: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of generate_job_recommendations (shares its cache entries)"""
+        try:
+            fields = LinkedInAnalyzerService._recommendations_stream()
+            chunk = None
+            async for chunk in await async_clients().gemini.models.generate_content_stream(
+                **LinkedInAnalyzerService._recommendations_request(resume_data)
+            ):
+                if chunk.text:
+                    fields.feed(chunk.text)
+            return LinkedInAnalyzerService._recommendations_result(fields, chunk)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Gemini JSON: {e}")
-            return None
         except Exception as e:
-            logger.error(f"Error generating job recommendations: {str(e)}")
-            return None
+            return LinkedInAnalyzerService._recommendations_failed(e)
 
     @staticmethod
+    @traced()
+    @llm_cache.cached("ats_resume", model="gemini-2.0-flash-lite")
     def generate_ats_resume(
         linkedin_data: Dict[str, Any], job_description: str
     ) -> Optional[str]:
         """Generate ATS-optimized resume using Gemini AI"""
+        from google.genai import types
+
         try:
             prompt = f"""
             As an expert resume writer and ATS specialist, create a tailored, ATS-friendly resume in html format based on the LinkedIn profile data and job description provided.
@@ -293,7 +642,7 @@ class LinkedInAnalyzerService:
             - Use standard html formatting (headers with #, ##, ###, bullet points with -, etc.)
 
             **LinkedIn Profile Data:**
-            {json.dumps(linkedin_data, indent=2)}
+            {build_profile_context(linkedin_data, "ats_resume")}
 
             **Target Job Description:**
             {job_description}
@@ -301,7 +650,7 @@ class LinkedInAnalyzerService:
             **Output Format:** Clean html with proper headers and formatting.
             """
 
-            response = gemini_client.models.generate_content(
+            response = services.gemini.models.generate_content(
                 model="gemini-2.0-flash-lite",
                 contents=[
                     types.Content(
@@ -309,6 +658,7 @@ class LinkedInAnalyzerService:
                     )
                 ],
             )
+            record_usage(response)
 
             return response.text if response and response.text else None
 
@@ -317,12 +667,10 @@ class LinkedInAnalyzerService:
             return None
 
     @staticmethod
-    def update_resume_with_chat(
-        current_resume: str, user_message: str
-    ) -> Optional[str]:
-        """Update resume based on user chat message"""
-        try:
-            chat_prompt = f"""
+    @traced()
+    def _chat_prompt(current_resume: str, user_message: str) -> str:
+        """Prompt asking Gemini to apply a chat request to the resume"""
+        return f"""
             You are an expert resume writer. I will provide you with a current resume in markdown format and a user request for modifications.
 
             <h1>Current Resume:</h1>
@@ -348,22 +696,219 @@ class LinkedInAnalyzerService:
             no need to give head and style
             """
 
-            response = gemini_client.models.generate_content(
-                model="gemini-2.0-flash-lite",
-                contents=[
-                    types.Content(
-                        role="user", parts=[types.Part.from_text(text=chat_prompt)]
-                    )
-                ],
+    @staticmethod
+    def _chat_request(current_resume: str, user_message: str) -> Dict[str, Any]:
+        """Gemini arguments for the whole-document rewrite"""
+        from google.genai import types
+
+        chat_prompt = LinkedInAnalyzerService._chat_prompt(current_resume, user_message)
+        tokens = estimate_tokens(chat_prompt)
+        prompt_stats.record("ats_chat", tokens, tokens)
+        return {
+            "model": "gemini-2.0-flash-lite",
+            "contents": [
+                types.Content(role="user", parts=[types.Part.from_text(text=chat_prompt)])
+            ],
+        }
+
+    @staticmethod
+    def _chat_result(response) -> Optional[str]:
+        record_usage(response)
+        return response.text if response and response.text else None
+
+    @staticmethod
+    @traced()
+    def rewrite_resume_with_chat(
+        current_resume: str, user_message: str
+    ) -> Optional[str]:
+        """Update resume based on user chat message (sends and returns the whole document)"""
+        try:
+            response = services.gemini.models.generate_content(
+                **LinkedInAnalyzerService._chat_request(current_resume, user_message)
             )
+            return LinkedInAnalyzerService._chat_result(response)
 
-            return response.text if response and response.text else None
+        except Exception as e:
+            logger.error(f"Error updating resume with chat: {str(e)}")
+            return None
+
+    @staticmethod
+    @traced()
+    async def arewrite_resume_with_chat(
+        current_resume: str, user_message: str
+    ) -> Optional[str]:
+        """Async variant of rewrite_resume_with_chat"""
+        try:
+            response = await async_clients().gemini.models.generate_content(
+                **LinkedInAnalyzerService._chat_request(current_resume, user_message)
+            )
+            return LinkedInAnalyzerService._chat_result(response)
 
         except Exception as e:
             logger.error(f"Error updating resume with chat: {str(e)}")
             return None
 
     @staticmethod
+    @traced()
+    async def astream_resume_rewrite(current_resume: str, user_message: str):
+        """Yield the rewritten resume HTML as Gemini streams it (errors propagate)"""
+        chunk = None
+        async for chunk in await async_clients().gemini.models.generate_content_stream(
+            **LinkedInAnalyzerService._chat_request(current_resume, user_message)
+        ):
+            if chunk.text:
+                yield chunk.text
+        record_usage(chunk)
+
+    @staticmethod
+    @traced()
+    def _section_edit_request(
+        current_resume: str, edit: SectionEdit, user_message: str
+    ):
+        """Gemini arguments (contents and JSON schema config) for a patch of the targeted sections"""
+        from google.genai import types
+
+        prompt = f"""
+            You are an expert resume writer. Apply the user request to the resume sections below.
+
+            Resume outline (section id: heading):
+            {edit.outline()}
+
+            Sections to edit:
+            {edit.target_html()}
+
+            User Request:
+            {user_message}
+
+            Instructions:
+            - Make the requested changes while maintaining ATS-friendly html formatting
+            - Keep the professional tone and each section's heading
+            - Only modify what's specifically requested
+            - Return each section you changed with its id and its complete updated html
+            - Return a new section with a new id; remove a section by returning empty html
+            - Leave unchanged sections out
+            """
+
+        # Tokens the whole-document prompt would have cost vs this one
+        prompt_stats.record(
+            "ats_chat",
+            estimate_tokens(
+                LinkedInAnalyzerService._chat_prompt(current_resume, user_message)
+            ),
+            estimate_tokens(prompt),
+        )
+
+        contents = [
+            types.Content(role="user", parts=[types.Part.from_text(text=prompt)])
+        ]
+        generate_content_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=types.Schema(
+                type=types.Type.OBJECT,
+                required=["SECTIONS"],
+                properties={
+                    "SECTIONS": types.Schema(
+                        type=types.Type.ARRAY,
+                        items=types.Schema(
+                            type=types.Type.OBJECT,
+                            required=["id", "html"],
+                            properties={
+                                "id": types.Schema(type=types.Type.STRING),
+                                "html": types.Schema(type=types.Type.STRING),
+                            },
+                        ),
+                    ),
+                },
+            ),
+        )
+        return {
+            "model": "gemini-2.0-flash-lite",
+            "contents": contents,
+            "config": generate_content_config,
+        }
+
+    @staticmethod
+    def _section_edit_result(edit: SectionEdit, response) -> str:
+        record_usage(response)
+        annotate(sections=",".join(edit.targets))
+        return edit.apply(json.loads(response.text)["SECTIONS"])
+
+    @staticmethod
+    @traced()
+    def apply_section_edit(
+        current_resume: str, edit: SectionEdit, user_message: str
+    ) -> Optional[str]:
+        """Have Gemini patch only the sections in ``edit``; None if that fails"""
+        try:
+            response = services.gemini.models.generate_content(
+                **LinkedInAnalyzerService._section_edit_request(
+                    current_resume, edit, user_message
+                )
+            )
+            return LinkedInAnalyzerService._section_edit_result(edit, response)
+
+        except Exception as e:
+            logger.error(f"Section edit failed: {str(e)}")
+            return None
+
+    @staticmethod
+    @traced()
+    async def aapply_section_edit(
+        current_resume: str, edit: SectionEdit, user_message: str
+    ) -> Optional[str]:
+        """Async variant of apply_section_edit"""
+        try:
+            response = await async_clients().gemini.models.generate_content(
+                **LinkedInAnalyzerService._section_edit_request(
+                    current_resume, edit, user_message
+                )
+            )
+            return LinkedInAnalyzerService._section_edit_result(edit, response)
+
+        except Exception as e:
+            logger.error(f"Section edit failed: {str(e)}")
+            return None
+
+    @staticmethod
+    @traced()
+    def update_resume_with_chat(
+        current_resume: str, user_message: str
+    ) -> Optional[str]:
+        """
+        Update resume based on user chat message.
+
+        Only the sections the request targets (plus an outline) go to Gemini,
+        and its patch is applied here; requests that aren't about particular
+        sections, or whose section edit fails, rewrite the whole document.
+        """
+        edit = plan_edit(clean_html_response(current_resume), user_message)
+        if edit is not None:
+            updated = LinkedInAnalyzerService.apply_section_edit(
+                current_resume, edit, user_message
+            )
+            if updated is not None:
+                return updated
+        return LinkedInAnalyzerService.rewrite_resume_with_chat(current_resume, user_message)
+
+    @staticmethod
+    @traced()
+    async def aupdate_resume_with_chat(
+        current_resume: str, user_message: str
+    ) -> Optional[str]:
+        """Async variant of update_resume_with_chat"""
+        edit = plan_edit(clean_html_response(current_resume), user_message)
+        if edit is not None:
+            updated = await LinkedInAnalyzerService.aapply_section_edit(
+                current_resume, edit, user_message
+            )
+            if updated is not None:
+                return updated
+        return await LinkedInAnalyzerService.arewrite_resume_with_chat(
+            current_resume, user_message
+        )
+
+    @staticmethod
+    @traced()
     def markdown_to_html(markdown_text: str) -> str:
         """Convert markdown to HTML safely"""
         if not markdown_text:
@@ -374,7 +919,7 @@ class LinkedInAnalyzerService:
             cleaned_markdown = markdown_text.strip()
 
             # Convert markdown to HTML
-            html_content = markdown_renderer(cleaned_markdown)
+            html_content = services.markdown(cleaned_markdown)
 
             # Return as safe HTML
             return mark_safe(html_content)
@@ -385,16 +930,337 @@ class LinkedInAnalyzerService:
             return mark_safe(f"<pre>{markdown_text}</pre>")
 
 
+# Basic CSS for professional PDF styling
+PDF_STYLE = """
+    @page { size: letter; margin: 0.75in; }
+    body { font-family: 'Helvetica', 'Arial', sans-serif; font-size: 11pt; line-height: 1.4; color: #333; }
+    h1, h2, h3, h4, h5, h6 { font-family: 'Georgia', serif; color: #111; line-height: 1.2; margin-top: 1.2em; margin-bottom: 0.4em; }
+    h1 { font-size: 22pt; text-align: center; border-bottom: 2px solid #333; padding-bottom: 10px; margin-bottom: 20px;}
+    h2 { font-size: 14pt; border-bottom: 1px solid #ddd; padding-bottom: 3px; margin-top: 25px; }
+    h3 { font-size: 12pt; font-weight: bold; }
+    ul { padding-left: 20px; list-style-type: disc; }
+    li { margin-bottom: 5px; }
+    p { margin-bottom: 8px; }
+    a { color: #007bff; text-decoration: none; }
+"""
+
+
+# Reuses the parsed stylesheet, caches PDFs by HTML hash, caps concurrent renders
+pdf_renderer = PDFRenderer(
+    PDF_STYLE,
+    settings.PDF_RENDERING["CACHE_DIR"],
+    max_bytes=settings.PDF_RENDERING["MAX_BYTES"],
+    workers=settings.PDF_RENDERING["WORKERS"],
+    timeout=settings.PDF_RENDERING["TIMEOUT"],
+)
+
+
+async def arender_ats_pdf(ats_resume_md: str) -> bytes:
+    """Render the ATS resume HTML to PDF bytes"""
+    return await pdf_renderer.arender(clean_html_response(ats_resume_md))
+
+
+def build_ai_analysis_payload(
+    linkedin_data: Dict[str, Any], bypass_cache: bool = False
+) -> Dict[str, Any]:
+    """Run the OpenAI analysis and Gemini recommendations concurrently"""
+    started = time.monotonic()
+    analysis_future = submit_in_context(
+        llm_executor,
+        LinkedInAnalyzerService.generate_ai_analysis,
+        linkedin_data,
+        bypass_cache=bypass_cache,
+    )
+    recommendations_future = submit_in_context(
+        llm_executor,
+        LinkedInAnalyzerService.generate_job_recommendations,
+        linkedin_data,
+        bypass_cache=bypass_cache,
+    )
+
+    # Each call has its own budget, so one failing doesn't sink the other
+    ai_analysis_result = result_or_default(
+        analysis_future,
+        config.AI_ANALYSIS_TIMEOUT,
+        {"analysis": "AI analysis timed out. Please try again.", "success": False},
+        "AI analysis",
+        started,
+    )
+    job_recommendations = result_or_default(
+        recommendations_future,
+        config.JOB_RECOMMENDATIONS_TIMEOUT,
+        None,
+        "Job recommendations",
+        started,
+    )
+
+    return _ai_analysis_payload(ai_analysis_result, job_recommendations)
+
+
+async def abuild_ai_analysis_payload(
+    linkedin_data: Dict[str, Any], bypass_cache: bool = False
+) -> Dict[str, Any]:
+    """Async variant of build_ai_analysis_payload using the async LLM clients"""
+    ai_analysis_result, job_recommendations = await asyncio.gather(
+        aresult_or_default(
+            LinkedInAnalyzerService.agenerate_ai_analysis(
+                linkedin_data, bypass_cache=bypass_cache
+            ),
+            config.AI_ANALYSIS_TIMEOUT,
+            {"analysis": "AI analysis timed out. Please try again.", "success": False},
+            "AI analysis",
+        ),
+        aresult_or_default(
+            LinkedInAnalyzerService.agenerate_job_recommendations(
+                linkedin_data, bypass_cache=bypass_cache
+            ),
+            config.JOB_RECOMMENDATIONS_TIMEOUT,
+            None,
+            "Job recommendations",
+        ),
+    )
+    return _ai_analysis_payload(ai_analysis_result, job_recommendations)
+
+
+def _ai_analysis_payload(
+    ai_analysis_result: Dict[str, Any], job_recommendations: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "analysis_html": services.mistune.html(ai_analysis_result["analysis"]),
+        "analysis_success_message": ai_analysis_result["success"],
+        "job_recommendations": job_recommendations,
+    }
+
+
+def _job_listings_key(job_recommendations: Dict[str, Any]) -> str:
+    search = {
+        name: job_recommendations.get(name) or []
+        for name in ("JOB_TITLES", "LOCATIONS", "RELATED_DOMAINS")
+    }
+    digest = hashlib.sha256(json.dumps(search, sort_keys=True).encode()).hexdigest()
+    # v2: listings carry "sites"; older entries may pin incomplete rankings
+    return f"listings:v2:{digest}"
+
+
+def prefetch_job_listings(titles: List[str], locations: List[str]):
+    """Start the searches build_job_listings_payload will run for these recommendations"""
+    search_settings = settings.JOB_SEARCH
+    services.jobs.prefetch_job_grid(
+        titles,
+        locations or [""],
+        max_titles=search_settings["MAX_TITLES"],
+        max_locations=search_settings["MAX_LOCATIONS"],
+        deadline=search_settings["DEADLINE"],
+    )
+
+
+def build_job_listings_payload(
+    job_recommendations: Dict[str, Any],
+    page: int = 1,
+    page_size: Optional[int] = None,
+    profile: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Search every recommended title x location and return one page of ranked jobs.
+
+    With a ``profile`` (see job_matching.profile_document) the order blends
+    how closely each job matches it with the search ranking.
+    """
+    search_settings = settings.JOB_SEARCH
+    page_size = page_size or search_settings["PAGE_SIZE"]
+    key = _job_listings_key(job_recommendations)
+
+    listings, is_stale = job_listings_cache.get(key)
+    if listings is None or is_stale:
+        listings = services.jobs.fetch_job_grid(
+            job_recommendations["JOB_TITLES"],
+            job_recommendations.get("LOCATIONS") or [""],
+            related_domains=job_recommendations.get("RELATED_DOMAINS"),
+            max_titles=search_settings["MAX_TITLES"],
+            max_locations=search_settings["MAX_LOCATIONS"],
+            deadline=search_settings["DEADLINE"],
+        )
+        # Searches and boards that missed the deadline land in the job store;
+        # don't pin an incomplete ranking so the next request picks them up
+        if not listings["pending_searches"] and not listings["sites"]["pending"]:
+            job_listings_cache.set(key, listings)
+
+    job_list = listings["jobs"]
+    if profile:
+        job_list = services.job_matcher.rank(
+            profile, job_list, weight=search_settings["MATCH_WEIGHT"]
+        )
+    start = (page - 1) * page_size
+    page_jobs = job_list[start : start + page_size]
+    logger.info(
+        f"Serving {len(page_jobs)} of {len(job_list)} jobs from {listings['searches']} searches"
+    )
+    payload = {
+        "jobs": page_jobs,
+        "count": len(job_list),
+        "page": page,
+        "page_size": page_size,
+        "has_more": start + page_size < len(job_list),
+        # Searches and boards that missed the deadline; retrying later picks them up
+        "pending_searches": listings["pending_searches"],
+        "pending_sites": listings["sites"]["pending"],
+    }
+    if not job_list and listings["messages"]:
+        payload["message"] = listings["messages"][0]
+    return payload
+
+
+def build_ats_pdf_payload(ats_resume_md: str) -> Dict[str, Any]:
+    """Render the PDF into the cache; the status endpoint serves it from there"""
+    html_content = clean_html_response(ats_resume_md)
+    pdf_renderer.render(html_content)
+    return {"pdf_key": pdf_renderer.cache_key(html_content)}
+
+
+def speculate_analysis(linkedin_data: Dict[str, Any], cancelled) -> Optional[Dict[str, Any]]:
+    """The AI analysis, recommendations and first job searches for a profile index just loaded"""
+    if cancelled.is_set():
+        return None
+    payload = build_ai_analysis_payload(linkedin_data)
+    recommendations = payload["job_recommendations"]
+    if recommendations and not cancelled.is_set():
+        prefetch_job_listings(recommendations["JOB_TITLES"], recommendations.get("LOCATIONS"))
+    return payload
+
+
+# Opt-in: start the analysis as soon as a profile is stored, while the user
+# is still on the resume page, so api_get_ai_analysis usually finds it done
+speculator = Speculator(
+    ThreadPoolExecutor(
+        max_workers=settings.SPECULATION["WORKERS"], thread_name_prefix="speculation"
+    ),
+    ttl=settings.SPECULATION["TTL"],
+    enabled=settings.SPECULATION["ENABLED"],
+)
+
+
+async def _speculated_analysis(request, linkedin_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The payload speculate_analysis computed for this session and profile, if any"""
+    if not speculator.enabled:
+        return None
+    future = speculator.take(request.session.session_key, linkedin_data.get("username"))
+    if future is None:
+        annotate(speculation="miss")
+        return None
+    annotate(speculation="hit" if future.done() else "join")
+    try:
+        payload = await asyncio.wrap_future(future)
+    except Exception as e:
+        logger.warning(f"Speculative analysis failed: {str(e)}")
+        return None
+    # A timed-out analysis is worth retrying rather than serving
+    return payload if payload and payload["analysis_success_message"] else None
+
+
+def _fresh_profile_cached(username: str) -> bool:
+    value, is_stale = profile_cache.get(f"linkedin_profile_{username}")
+    return value is not None and not is_stale
+
+
+def bulk_analyzer(
+    workers: Optional[int] = None, upstreams: Optional[Dict[str, Dict[str, float]]] = None
+) -> BulkAnalyzer:
+    """
+    A BulkAnalyzer over LinkedInAnalyzerService with the BULK_ANALYSIS limits;
+    ``upstreams`` overrides CONCURRENCY/PER_MINUTE per upstream.
+    """
+    bulk_settings = settings.BULK_ANALYSIS
+    throttles = {}
+    for name, limits in bulk_settings["UPSTREAMS"].items():
+        limits = {**limits, **(upstreams or {}).get(name, {})}
+        throttles[name] = Throttle(int(limits["CONCURRENCY"]), limits["PER_MINUTE"])
+    return BulkAnalyzer(
+        LinkedInAnalyzerService,
+        throttles,
+        workers=workers or bulk_settings["WORKERS"],
+        # Stale entries still go upstream (a background refresh), so they count as misses
+        profile_cached=_fresh_profile_cached,
+        thread_initializer=lambda: job_prefetch.set(False),
+    )
+
+
+def run_bulk_analysis(urls: List[str], output: str) -> Dict[str, Any]:
+    """Task entry point: analyze ``urls`` into BULK_ANALYSIS["DIR"]/``output``"""
+    path = os.path.join(settings.BULK_ANALYSIS["DIR"], output)
+    return {**bulk_analyzer().run(urls, path), "output": output}
+
+
+# Background task queue so slow work doesn't hold request workers
+task_queue = TaskQueue(
+    settings.TASK_QUEUE["PATH"], retention=settings.TASK_QUEUE["RETENTION"]
+)
+TASK_WORKERS = settings.TASK_QUEUE["WORKERS"]
+task_queue.register(
+    "fetch_profile",
+    LinkedInAnalyzerService.fetch_linkedin_profile,
+    workers=TASK_WORKERS["fetch_profile"],
+)
+task_queue.register(
+    "ai_analysis", build_ai_analysis_payload, workers=TASK_WORKERS["ai_analysis"]
+)
+task_queue.register(
+    "job_listings", build_job_listings_payload, workers=TASK_WORKERS["job_listings"]
+)
+task_queue.register(
+    "ats_pdf", build_ats_pdf_payload, workers=TASK_WORKERS["ats_pdf"], max_attempts=1
+)
+# A retried bulk run resumes from its results file, so retries are cheap
+task_queue.register(
+    "bulk_analysis",
+    run_bulk_analysis,
+    workers=TASK_WORKERS["bulk_analysis"],
+    lease=settings.BULK_ANALYSIS["LEASE"],
+)
+
+
+def _wants_task(request) -> bool:
+    """?async=1 (or an "async" form field) queues the work instead of running it inline"""
+    return request.GET.get("async") == "1" or request.POST.get("async") == "1"
+
+
+def _task_owner(request) -> str:
+    if not request.session.session_key:
+        request.session.save()
+    return request.session.session_key
+
+
+def _submit_task(request, kind: str, **payload) -> str:
+    return task_queue.submit(kind, owner=_task_owner(request), **payload)
+
+
+def _task_accepted(task_id: str) -> JsonResponse:
+    return JsonResponse(
+        {
+            "task_id": task_id,
+            "status": "queued",
+            "status_url": reverse("task_status_api", args=[task_id]),
+        },
+        status=202,
+    )
+
+
+def _pdf_response(pdf_file: bytes) -> HttpResponse:
+    response = HttpResponse(pdf_file, content_type="application/pdf")
+    response["Content-Disposition"] = 'attachment; filename="ATS_Resume.pdf"'
+    return response
+
+
 # Views
 @csrf_exempt
-def index(request):
+async def index(request):
     """Main landing page with LinkedIn URL input"""
     if request.method == "POST":
         profile_url = request.POST.get("linkedin_url", "").strip()
 
         if not profile_url:
             messages.error(request, "Please enter a valid LinkedIn URL")
-            return render(request, "index.html")
+            return await sync_to_async(render)(request, "index.html")
 
         username = LinkedInAnalyzerService.extract_linkedin_username(profile_url)
 
@@ -403,15 +1269,33 @@ def index(request):
                 request,
                 "Invalid LinkedIn URL format. Please enter a valid LinkedIn profile URL.",
             )
-            return render(request, "index.html")
+            return await sync_to_async(render)(request, "index.html")
+
+        if _wants_task(request):
+            task_id = await sync_to_async(_submit_task)(
+                request, "fetch_profile", username=username
+            )
+            return _task_accepted(task_id)
 
         try:
-            # Fetch LinkedIn data
-            linkedin_data = LinkedInAnalyzerService.fetch_linkedin_profile(username)
+            # Fetch LinkedIn data (blocking client, so on its own executor)
+            linkedin_data = await run_blocking(
+                profile_executor, LinkedInAnalyzerService.fetch_linkedin_profile, username
+            )
 
             # Store in session with expiry
-            request.session["linkedin_data"] = linkedin_data
-            request.session.set_expiry(3600)  # 1 hour
+            await session_payloads.aset(request.session, "linkedin_data", linkedin_data)
+            await request.session.aset_expiry(3600)  # 1 hour
+            if speculator.enabled:
+                # The speculation is keyed on the session, so it needs its key now
+                if not request.session.session_key:
+                    await request.session.asave()
+                speculator.start(
+                    request.session.session_key,
+                    linkedin_data.get("username"),
+                    speculate_analysis,
+                    linkedin_data,
+                )
 
             messages.success(request, f"Successfully loaded profile for {username}")
             return redirect("resume")
@@ -419,9 +1303,9 @@ def index(request):
         except Exception as e:
             logger.error(f"Error in index view: {str(e)}")
             messages.error(request, f"Error fetching profile: {str(e)}")
-            return render(request, "index.html")
+            return await sync_to_async(render)(request, "index.html")
 
-    return render(request, "index.html")
+    return await sync_to_async(render)(request, "index.html")
 
 
 def resume(request):
@@ -429,7 +1313,7 @@ def resume(request):
     if request.method == "POST":
         return redirect("ai_analysis")
 
-    linkedin_data = request.session.get("linkedin_data")
+    linkedin_data = session_payloads.get(request.session, "linkedin_data")
 
     if not linkedin_data:
         messages.warning(
@@ -451,7 +1335,7 @@ def ai_analysis(request):
     Renders the main AI analysis page structure with loading spinners.
     The actual data will be fetched asynchronously by the frontend.
     """
-    linkedin_data = request.session.get("linkedin_data")
+    linkedin_data = session_payloads.get(request.session, "linkedin_data")
     if not linkedin_data:
         messages.warning(request, "No profile data found. Please start over.")
         return redirect("index")
@@ -462,36 +1346,39 @@ def ai_analysis(request):
     return render(request, "ai_analysis.html", context)
 
 
-def api_get_ai_analysis(request):
+async def api_get_ai_analysis(request):
     """
     API endpoint to generate and return AI analysis and job recommendations.
     This is called via JavaScript from the frontend.
     """
-    linkedin_data = request.session.get("linkedin_data")
+    linkedin_data = await session_payloads.aget(request.session, "linkedin_data")
     if not linkedin_data:
         return JsonResponse({"error": "No profile data in session."}, status=400)
 
-    try:
-        # Generate AI analysis
-        ai_analysis_result = LinkedInAnalyzerService.generate_ai_analysis(linkedin_data)
+    # ?refresh=1 skips the LLM response cache
+    bypass_cache = request.GET.get("refresh") == "1"
 
-        # Generate job recommendations
-        job_recommendations = LinkedInAnalyzerService.generate_job_recommendations(
-            linkedin_data
+    if _wants_task(request):
+        task_id = await sync_to_async(_submit_task)(
+            request,
+            "ai_analysis",
+            linkedin_data=linkedin_data,
+            bypass_cache=bypass_cache,
         )
+        return _task_accepted(task_id)
+
+    try:
+        payload = None if bypass_cache else await _speculated_analysis(request, linkedin_data)
+        if payload is None:
+            payload = await abuild_ai_analysis_payload(linkedin_data, bypass_cache)
 
         # Store recommendations in session to be used by the job listings API
-        if job_recommendations:
-            request.session["job_recommendations"] = job_recommendations
+        if payload["job_recommendations"]:
+            await session_payloads.aset(
+                request.session, "job_recommendations", payload["job_recommendations"]
+            )
 
-        return JsonResponse(
-            {
-                "success": True,
-                "analysis_html": mistune.html(ai_analysis_result["analysis"]),
-                "analysis_success_message": ai_analysis_result["success"],
-                "job_recommendations": job_recommendations,
-            }
-        )
+        return JsonResponse(payload)
 
     except Exception as e:
         logger.error(f"Error in api_get_ai_analysis: {str(e)}")
@@ -500,32 +1387,155 @@ def api_get_ai_analysis(request):
         )
 
 
+async def _replay(text: str) -> AsyncIterator[str]:
+    yield text
+
+
+async def api_stream_ai_analysis(request):
+    """
+    Server-sent events variant of api_get_ai_analysis.
+
+    Streams the analysis as rendered HTML chunks ("analysis" events), pushes
+    the job recommendations as soon as Gemini finishes ("recommendations"),
+    and ends with a "done" event. A speculated analysis for this session is
+    replayed when finished, or awaited while still running.
+    """
+    linkedin_data = await session_payloads.aget(request.session, "linkedin_data")
+    if not linkedin_data:
+        return JsonResponse({"error": "No profile data in session."}, status=400)
+
+    bypass_cache = request.GET.get("refresh") == "1"
+
+    async def recommendations_event(job_recommendations):
+        if job_recommendations:
+            # The session middleware has already run, so persist explicitly
+            await session_payloads.aset(
+                request.session, "job_recommendations", job_recommendations
+            )
+            await request.session.asave()
+        return sse_event("recommendations", {"job_recommendations": job_recommendations})
+
+    async def event_stream():
+        # Flush headers right away so the browser knows the stream is open
+        yield ": stream open\n\n"
+
+        payload = None if bypass_cache else await _speculated_analysis(request, linkedin_data)
+        if payload is not None:
+            yield sse_event("analysis", {"html": payload["analysis_html"]})
+            yield await recommendations_event(payload["job_recommendations"])
+            yield sse_event("done", {"analysis_success": True})
+            return
+
+        recommendations_task = asyncio.ensure_future(
+            aresult_or_default(
+                LinkedInAnalyzerService.agenerate_job_recommendations(
+                    linkedin_data, bypass_cache=bypass_cache
+                ),
+                config.JOB_RECOMMENDATIONS_TIMEOUT,
+                None,
+                "Job recommendations",
+            )
+        )
+        streamer = MarkdownBlockStreamer(services.markdown)
+        recommendations_sent = False
+        analysis_success = False
+        agenerate_ai_analysis = LinkedInAnalyzerService.agenerate_ai_analysis
+        try:
+            try:
+                cached = None if bypass_cache else await agenerate_ai_analysis.alookup(linkedin_data)
+                analysis_parts = []
+                if cached:
+                    deltas = _replay(cached["analysis"])
+                else:
+                    deltas = LinkedInAnalyzerService.astream_ai_analysis(linkedin_data)
+
+                async for delta in deltas:
+                    analysis_parts.append(delta)
+                    html = streamer.feed(delta)
+                    if html:
+                        yield sse_event("analysis", {"html": html})
+                    if not recommendations_sent and recommendations_task.done():
+                        yield await recommendations_event(recommendations_task.result())
+                        recommendations_sent = True
+
+                html = streamer.flush()
+                if html:
+                    yield sse_event("analysis", {"html": html})
+                analysis_success = True
+
+                if not cached:
+                    await agenerate_ai_analysis.asave(
+                        {"analysis": "".join(analysis_parts), "success": True},
+                        linkedin_data,
+                    )
+
+            except Exception as e:
+                logger.error(f"Error streaming AI analysis: {str(e)}")
+                yield sse_event("analysis_error", {"error": f"Error generating analysis: {str(e)}"})
+
+            if not recommendations_sent:
+                yield await recommendations_event(await recommendations_task)
+            yield sse_event("done", {"analysis_success": analysis_success})
+        finally:
+            # Stops the task if the client went away mid-stream; no-op once it's done
+            recommendations_task.cancel()
+
+    response = StreamingHttpResponse(event_stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop reverse proxies from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 # API ENDPOINT 2 (Fetches job listings)
-def api_get_job_listings(request):
+async def api_get_job_listings(request):
     """
     API endpoint to fetch job listings based on recommendations.
     This is called via JavaScript after the AI analysis is complete.
     """
-    job_recommendations = request.session.get("job_recommendations")
+    job_recommendations = await session_payloads.aget(
+        request.session, "job_recommendations"
+    )
     if not job_recommendations or not job_recommendations.get("JOB_TITLES"):
         return JsonResponse(
             {"jobs": [], "count": 0, "message": "No job titles recommended."}
         )
+    linkedin_data = await session_payloads.aget(request.session, "linkedin_data")
+    if linkedin_data:
+        from .job_matching import profile_document
+
+        profile = profile_document(linkedin_data)
+    else:
+        profile = None
 
     try:
-        primary_job_title = job_recommendations["JOB_TITLES"][0]
-        primary_location = (
-            job_recommendations.get("LOCATIONS", [""])[0]
-            if job_recommendations.get("LOCATIONS")
-            else ""
+        page = max(1, int(request.GET.get("page", 1)))
+        page_size = min(100, max(1, int(request.GET.get("page_size", settings.JOB_SEARCH["PAGE_SIZE"]))))
+    except ValueError:
+        return JsonResponse({"error": "page and page_size must be integers"}, status=400)
+
+    if _wants_task(request):
+        task_id = await sync_to_async(_submit_task)(
+            request,
+            "job_listings",
+            job_recommendations=job_recommendations,
+            page=page,
+            page_size=page_size,
+            profile=profile,
         )
+        return _task_accepted(task_id)
 
-        jobs_data = jobs.fetch_jobs(primary_job_title, location=primary_location)
-        job_list = jobs_data.get("jobs", [])
-
-        logger.info(f"Fetched {len(job_list)} jobs for {primary_job_title}")
-
-        return JsonResponse({"jobs": job_list, "count": len(job_list)})
+    try:
+        # Scraping and the job store are blocking, so they run on their own executor
+        payload = await run_blocking(
+            job_listings_executor,
+            build_job_listings_payload,
+            job_recommendations,
+            page=page,
+            page_size=page_size,
+            profile=profile,
+        )
+        return JsonResponse(payload)
 
     except Exception as e:
         logger.error(f"Error in api_get_job_listings: {str(e)}")
@@ -535,19 +1545,35 @@ def api_get_job_listings(request):
 
 
 @csrf_protect
-def ats_resume(request):
-    """Handle ATS resume generation and chat-based modifications"""
-    linkedin_data = request.session.get("linkedin_data")
+async def ats_resume(request):
+    """
+    Handle ATS resume generation and chat-based modifications.
+
+    PDF downloads are awaited here rather than blocking the thread shared by
+    the sync views; everything else is the page view.
+    """
+    if request.method == "GET" and "download_pdf" in request.GET:
+        ats_resume_md = await session_payloads.aget(request.session, "ats_resume_md")
+        if ats_resume_md and await session_payloads.aget(request.session, "linkedin_data"):
+            if _wants_task(request):
+                task_id = await sync_to_async(_submit_task)(
+                    request, "ats_pdf", ats_resume_md=ats_resume_md
+                )
+                return _task_accepted(task_id)
+
+            return _pdf_response(await arender_ats_pdf(ats_resume_md))
+
+    return await sync_to_async(_ats_resume_page)(request)
+
+
+def _ats_resume_page(request):
+    linkedin_data = session_payloads.get(request.session, "linkedin_data")
 
     if not linkedin_data:
         messages.warning(request, "No profile data found. Please start over.")
         return redirect("index")
 
-    # Initialize chat history if not exists
-    if "ats_chat_history" not in request.session:
-        request.session["ats_chat_history"] = []
-
-    ats_resume_md = request.session.get("ats_resume_md")
+    ats_resume_md = session_payloads.get(request.session, "ats_resume_md")
 
     # --- HANDLE POST REQUESTS (No changes here) ---
     if request.method == "POST":
@@ -574,7 +1600,9 @@ def ats_resume(request):
                     linkedin_data, job_desc
                 )
                 if ats_resume_md:
-                    request.session["ats_resume_md"] = ats_resume_md
+                    session_payloads.set(
+                        request.session, "ats_resume_md", ats_resume_md
+                    )
                     request.session["job_description"] = job_desc
                     messages.success(request, "ATS resume generated successfully!")
                 else:
@@ -598,7 +1626,19 @@ def ats_resume(request):
                     ats_resume_md, chat_message
                 )
                 if updated_resume:
-                    request.session["ats_resume_md"] = updated_resume
+                    session_payloads.set(
+                        request.session, "ats_resume_md", updated_resume
+                    )
+                    session_payloads.set(
+                        request.session,
+                        "ats_chat_history",
+                        add_turn(
+                            session_payloads.get(request.session, "ats_chat_history", []),
+                            chat_message,
+                            "Resume updated successfully!",
+                            settings.ATS_CHAT["MAX_TURNS"],
+                        ),
+                    )
                     ats_resume_md = updated_resume
                     messages.success(request, "Resume updated successfully!")
                 else:
@@ -610,39 +1650,14 @@ def ats_resume(request):
                 logger.error(f"Error updating ATS resume: {str(e)}")
                 messages.error(request, f"Error updating resume: {str(e)}")
 
-    # --- HANDLE GET REQUESTS FOR DOWNLOADS ---
-
-    # --- NEW: PDF DOWNLOAD LOGIC ---
-    if request.method == "GET" and "download_pdf" in request.GET and ats_resume_md:
-        html_content = clean_html_response(ats_resume_md)
-
-        # Basic CSS for professional PDF styling
-        pdf_style = """
-            @page { size: letter; margin: 0.75in; }
-            body { font-family: 'Helvetica', 'Arial', sans-serif; font-size: 11pt; line-height: 1.4; color: #333; }
-            h1, h2, h3, h4, h5, h6 { font-family: 'Georgia', serif; color: #111; line-height: 1.2; margin-top: 1.2em; margin-bottom: 0.4em; }
-            h1 { font-size: 22pt; text-align: center; border-bottom: 2px solid #333; padding-bottom: 10px; margin-bottom: 20px;}
-            h2 { font-size: 14pt; border-bottom: 1px solid #ddd; padding-bottom: 3px; margin-top: 25px; }
-            h3 { font-size: 12pt; font-weight: bold; }
-            ul { padding-left: 20px; list-style-type: disc; }
-            li { margin-bottom: 5px; }
-            p { margin-bottom: 8px; }
-            a { color: #007bff; text-decoration: none; }
-        """
-
-        pdf_file = HTML(string=html_content).write_pdf(
-            stylesheets=[CSS(string=pdf_style)]
-        )
-
-        response = HttpResponse(pdf_file, content_type="application/pdf")
-        response["Content-Disposition"] = 'attachment; filename="ATS_Resume.pdf"'
-        return response
     show_job_form = not ats_resume_md
 
     context = {
         "ats_resume_md": clean_html_response(ats_resume_md) if ats_resume_md else "",
         "show_job_form": show_job_form,
-        "chat_history": request.session.get("ats_chat_history", []),
+        "chat_history": session_payloads.get(
+            request.session, "ats_chat_history", []
+        ),
         "job_description": request.session.get("job_description", ""),
         "profile_data": linkedin_data.get("profile", {}),
     }
@@ -653,6 +1668,7 @@ def ats_resume(request):
 
 def clear_session(request):
     """Clear session data and redirect to index"""
+    speculator.cancel(request.session.session_key)
     request.session.flush()
     messages.info(request, "Session cleared. You can analyze a new profile.")
     return redirect("index")
@@ -660,11 +1676,10 @@ def clear_session(request):
 
 def clear_ats_session(request):
     """Clear only ATS-related session data"""
-    session_keys_to_clear = ["ats_resume_md", "ats_chat_history", "job_description"]
-
-    for key in session_keys_to_clear:
-        if key in request.session:
-            del request.session[key]
+    for name in ["ats_resume_md", "ats_chat_history"]:
+        session_payloads.delete(request.session, name)
+    if "job_description" in request.session:
+        del request.session["job_description"]
 
     messages.info(request, "ATS resume session cleared. You can generate a new resume.")
     return redirect("ats_resume")
@@ -673,19 +1688,31 @@ def clear_ats_session(request):
 # API endpoints for AJAX requests
 def profile_status_api(request):
     """API endpoint to check if profile data exists in session"""
-    has_data = bool(request.session.get("linkedin_data"))
+    linkedin_data = session_payloads.get(request.session, "linkedin_data")
     return JsonResponse(
         {
-            "has_profile_data": has_data,
-            "username": request.session.get("linkedin_data", {}).get("username", "")
-            if has_data
-            else "",
+            "has_profile_data": bool(linkedin_data),
+            "username": linkedin_data.get("username", "") if linkedin_data else "",
         }
     )
 
 
 def jobs_api(request):
-    """API endpoint to get cached job data"""
+    """
+    API endpoint to get cached job data.
+
+    With ``?q=`` it full-text searches every posting in the job store
+    instead (``&limit=``, default 20, at most 100).
+    """
+    query = request.GET.get("q", "").strip()
+    if query:
+        try:
+            limit = min(100, max(1, int(request.GET.get("limit", 20))))
+        except ValueError:
+            return JsonResponse({"error": "limit must be a number"}, status=400)
+        jobs = services.jobs.get_job_store().search(query, limit)
+        return JsonResponse({"jobs": jobs, "count": len(jobs), "query": query})
+
     jobs_data = request.session.get("jobs", [])
     logger.info(f"jobs_api: type={type(jobs_data)}, count={len(jobs_data)}")
 
@@ -697,58 +1724,262 @@ def jobs_api(request):
     return JsonResponse({"jobs": jobs_data, "count": len(jobs_data)})
 
 
-def ats_chat_api(request):
-    """API endpoint for ATS resume chat (for future AJAX implementation)"""
+# Tasks whose result a session has taken in, newest last
+COLLECTED_TASKS = 20
+
+
+def _first_collection(request, task_id: str) -> bool:
+    """
+    True the first time this session collects ``task_id``, so a finished
+    task's session writes happen once and later polls only read.
+    """
+    collected = request.session.get("collected_tasks", [])
+    if task_id in collected:
+        return False
+    request.session["collected_tasks"] = (collected + [task_id])[-COLLECTED_TASKS:]
+    return True
+
+
+def task_status_api(request, task_id):
+    """API endpoint to poll a queued task and collect its result"""
+    task = task_queue.get(task_id)
+    if not task or task["owner"] != request.session.session_key:
+        return JsonResponse({"error": "Task not found"}, status=404)
+
+    response = {
+        "task_id": task_id,
+        "kind": task["kind"],
+        "status": task["status"],
+        "attempts": task["attempts"],
+        "error": task["error"],
+        "result": None,
+    }
+    if task["status"] != "succeeded":
+        return JsonResponse(response)
+
+    result = task["result"]
+    if task["kind"] == "fetch_profile":
+        if _first_collection(request, task_id):
+            session_payloads.set(request.session, "linkedin_data", result)
+            request.session.set_expiry(3600)  # 1 hour
+            speculator.start(
+                request.session.session_key, result.get("username"), speculate_analysis, result
+            )
+        response["result"] = {"redirect": reverse("resume")}
+    elif task["kind"] == "ats_pdf":
+        if request.GET.get("download") == "1":
+            pdf_file = pdf_renderer.cached(result["pdf_key"])
+            if pdf_file is None:
+                return JsonResponse({"error": "PDF has expired"}, status=410)
+            return _pdf_response(pdf_file)
+        response["result"] = {
+            "download_url": reverse("task_status_api", args=[task_id]) + "?download=1"
+        }
+    elif task["kind"] == "bulk_analysis":
+        if request.GET.get("download") == "1":
+            path = os.path.join(settings.BULK_ANALYSIS["DIR"], os.path.basename(result["output"]))
+            if not os.path.exists(path):
+                return JsonResponse({"error": "Results have expired"}, status=410)
+            return FileResponse(
+                open(path, "rb"),
+                as_attachment=True,
+                filename="bulk_analysis.jsonl",
+                content_type="application/x-ndjson",
+            )
+        response["result"] = {
+            **result,
+            "download_url": reverse("task_status_api", args=[task_id]) + "?download=1",
+        }
+    else:
+        if (
+            task["kind"] == "ai_analysis"
+            and result.get("job_recommendations")
+            and _first_collection(request, task_id)
+        ):
+            session_payloads.set(
+                request.session, "job_recommendations", result["job_recommendations"]
+            )
+        response["result"] = result
+
+    return JsonResponse(response)
+
+
+def bulk_analysis_api(request):
+    """
+    Queue a bulk analysis of many LinkedIn URLs.
+
+    Takes a JSON body ``{"urls": [...]}`` or an uploaded CSV/JSONL ``file``
+    (see bulk.parse_urls). Returns 202 with the task to poll; the finished
+    task links to the JSONL results.
+
+    Every URL costs LinkedIn, OpenAI and Gemini calls, so the endpoint is off
+    unless BULK_ANALYSIS_API=1 and then only open to staff users.
+    """
+    if not settings.BULK_ANALYSIS["API_ENABLED"]:
+        return JsonResponse({"error": "Not found"}, status=404)
+    if not request.user.is_staff:
+        return JsonResponse({"error": "Staff login required"}, status=403)
     if request.method != "POST":
         return JsonResponse({"error": "Only POST requests allowed"}, status=405)
 
     try:
-        data = json.loads(request.body)
-        chat_message = data.get("message", "").strip()
+        if request.content_type == "application/json":
+            urls = json.loads(request.body).get("urls") or []
+        elif "file" in request.FILES:
+            upload = request.FILES["file"]
+            fmt = "jsonl" if upload.name.lower().endswith((".jsonl", ".json")) else "csv"
+            urls = parse_urls(upload.read().decode("utf-8-sig"), fmt)
+        else:
+            urls = []
+    except (ValueError, AttributeError):
+        return JsonResponse({"error": "Expected a CSV/JSONL file or {\"urls\": [...]}"}, status=400)
+
+    urls = list(dict.fromkeys(str(url).strip() for url in urls if str(url).strip()))
+    if not urls:
+        return JsonResponse({"error": "No URLs given"}, status=400)
+    max_urls = settings.BULK_ANALYSIS["MAX_URLS"]
+    if len(urls) > max_urls:
+        return JsonResponse({"error": f"At most {max_urls} URLs per batch"}, status=400)
+
+    task_id = _submit_task(
+        request, "bulk_analysis", urls=urls, output=f"{uuid.uuid4().hex}.jsonl"
+    )
+    return _task_accepted(task_id)
 
-        if not chat_message:
-            return JsonResponse({"error": "Message is required"}, status=400)
 
-        ats_resume_md = request.session.get("ats_resume_md")
-        if not ats_resume_md:
-            return JsonResponse({"error": "No resume found in session"}, status=404)
+def internal_only(view):
+    """404 for anyone but staff users and clients in settings.INTERNAL_IPS"""
 
-        # Update resume based on chat message
-        updated_resume = LinkedInAnalyzerService.update_resume_with_chat(
-            ats_resume_md, chat_message
-        )
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not (
+            request.META.get("REMOTE_ADDR") in settings.INTERNAL_IPS
+            or request.user.is_staff
+        ):
+            return JsonResponse({"error": "Not found"}, status=404)
+        return view(request, *args, **kwargs)
 
-        if updated_resume:
-            request.session["ats_resume_md"] = updated_resume
-            chat_history = request.session.get("ats_chat_history", [])
-            chat_history.extend(
-                [
-                    {"type": "user", "message": chat_message},
-                    {"type": "ai", "message": "Resume updated successfully!"},
-                ]
-            )
-            request.session["ats_chat_history"] = chat_history
+    return wrapper
+
+
+@internal_only
+def linkedin_pool_stats_api(request):
+    """
+    API endpoint exposing LinkedIn session pool metrics.
+
+    Services that haven't been loaded yet (the pool, the job modules) are
+    left out rather than built just to report on them.
+    """
+    stats = {}
+    if services.loaded("linkedin_pool"):
+        stats.update(services.linkedin_pool.stats())
+    stats.update(
+        {
+            "coalescing": profile_fetches.stats(),
+            "profile_cache": profile_cache.stats(),
+            "llm_cache": llm_cache.stats(),
+            "prompt_tokens": prompt_stats.as_dict(),
+            "tasks": task_queue.stats(),
+            "pdf": pdf_renderer.stats(),
+            "speculation": speculator.stats(),
+            "services": services.stats(),
+        }
+    )
+    if services.loaded("jobs"):
+        stats["job_store"] = services.jobs.get_job_store().stats()
+        stats["job_searches"] = services.jobs.search_stats()
+    if services.loaded("job_matcher"):
+        stats["job_matching"] = services.job_matcher.stats()
+    return JsonResponse(stats)
 
-            # Convert to HTML for frontend
-            updated_resume_html = LinkedInAnalyzerService.markdown_to_html(
-                updated_resume
+
+@internal_only
+def metrics_api(request):
+    """Latency histograms per span (p50/p95/p99); ``?traces=1`` adds recent request traces"""
+    return JsonResponse(tracer.metrics(traces=request.GET.get("traces") == "1"))
+
+
+async def ats_chat_api(request):
+    """
+    Apply a chat request to the ATS resume, streamed as server-sent events.
+
+    Sends a "status" event naming the edit mode once it is settled (the
+    patched sections, or the whole document, with ``fallback`` set when a
+    section edit failed), "delta" events with resume HTML as a whole-document
+    rewrite streams in, then "done" with the updated resume HTML and chat
+    history (or "error").
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Only POST requests allowed"}, status=405)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON data"}, status=400)
+
+    chat_message = str(data.get("message", "")).strip()
+    if not chat_message:
+        return JsonResponse({"error": "Message is required"}, status=400)
+
+    ats_resume_md = await session_payloads.aget(request.session, "ats_resume_md")
+    if not ats_resume_md:
+        return JsonResponse({"error": "No resume found in session"}, status=404)
+
+    async def event_stream():
+        # Flush headers right away so the browser knows the stream is open
+        yield ": stream open\n\n"
+
+        try:
+            # Planned once; the status names the path actually taken
+            edit = plan_edit(clean_html_response(ats_resume_md), chat_message)
+            updated_resume = None
+            if edit is not None:
+                updated_resume = await LinkedInAnalyzerService.aapply_section_edit(
+                    ats_resume_md, edit, chat_message
+                )
+            if updated_resume is not None:
+                yield sse_event("status", {"mode": "sections", "sections": edit.targets})
+            else:
+                yield sse_event("status", {"mode": "document", "fallback": edit is not None})
+                parts = []
+                async for delta in LinkedInAnalyzerService.astream_resume_rewrite(
+                    ats_resume_md, chat_message
+                ):
+                    parts.append(delta)
+                    yield sse_event("delta", {"html": delta})
+                updated_resume = "".join(parts)
+
+            if not updated_resume:
+                yield sse_event("error", {"error": "Failed to update resume"})
+                return
+
+            await session_payloads.aset(request.session, "ats_resume_md", updated_resume)
+            chat_history = add_turn(
+                await session_payloads.aget(request.session, "ats_chat_history", []),
+                chat_message,
+                "Resume updated successfully!",
+                settings.ATS_CHAT["MAX_TURNS"],
             )
+            await session_payloads.aset(request.session, "ats_chat_history", chat_history)
+            # The session middleware has already run, so persist explicitly
+            await request.session.asave()
 
-            return JsonResponse(
+            # The resume is already HTML; the page shows it as-is, so does this
+            yield sse_event(
+                "done",
                 {
                     "success": True,
-                    "updated_resume_html": mistune.html(updated_resume_html),
-                    "updated_resume_raw": updated_resume,
+                    "updated_resume_html": clean_html_response(updated_resume),
                     "chat_history": chat_history,
-                }
-            )
-        else:
-            return JsonResponse(
-                {"success": False, "error": "Failed to update resume"}, status=500
+                },
             )
 
-    except json.JSONDecodeError:
-        return JsonResponse({"error": "Invalid JSON data"}, status=400)
-    except Exception as e:
-        logger.error(f"Error in ats_chat_api: {str(e)}")
-        return JsonResponse({"error": "Internal server error"}, status=500)
+        except Exception as e:
+            logger.error(f"Error in ats_chat_api: {str(e)}")
+            yield sse_event("error", {"error": "Internal server error"})
+
+    response = StreamingHttpResponse(event_stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop reverse proxies from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,169 @@
+"""
+Load-test one ASGI worker: sync vs async analysis views.
+
+Drives Django's ASGI handler in a single event loop (what one uvicorn
+worker does) with N concurrent requests to the AI analysis endpoint. The
+"sync" route is the previous synchronous view, which Django runs on
+sync_to_async threads that sit blocked for the whole upstream call (and
+behind llm_executor); the "async" route is the current api_get_ai_analysis.
+OpenAI and Gemini are fakes with injected latency and the LLM cache is
+bypassed, so every request pays for both calls.
+
+    python -m benchmarks.async_views --latency 0.5 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+def setup(workdir):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "LINKEDIN.settings")
+    for name in ("LINKEDIN_EMAIL", "LINKEDIN_PASSWORD", "OPENAI_API_KEY", "GEMINI_API_KEY"):
+        os.environ.setdefault(name, "benchmark")
+
+    import django
+    from django.conf import settings
+
+    # Keep every store in the temp dir, never next to the real ones
+    settings.DATABASES["default"]["NAME"] = os.path.join(workdir, "db.sqlite3")
+    for name in ("PROFILE_CACHE", "LLM_CACHE", "TASK_QUEUE", "SESSION_PAYLOADS", "JOB_STORE"):
+        settings_dict = getattr(settings, name)
+        settings_dict["PATH"] = os.path.join(workdir, f"{name.lower()}.sqlite3")
+    settings.PDF_RENDERING["CACHE_DIR"] = os.path.join(workdir, "pdf_cache")
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def sync_ai_analysis(request):
+    """The synchronous api_get_ai_analysis this benchmark compares against"""
+    from django.http import JsonResponse
+
+    from PROJECT import views
+
+    linkedin_data = views.session_payloads.get(request.session, "linkedin_data")
+    payload = views.build_ai_analysis_payload(linkedin_data, bypass_cache=True)
+    if payload["job_recommendations"]:
+        views.session_payloads.set(
+            request.session, "job_recommendations", payload["job_recommendations"]
+        )
+    return JsonResponse(payload)
+
+
+async def call(app, path, session_key):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"refresh=1",
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"cookie", f"sessionid={session_key}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    body_sent = False
+    disconnect = asyncio.Event()
+    status = None
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    disconnect.set()
+    return status
+
+
+async def run(app, path, session_key, concurrency, rounds):
+    latencies = []
+
+    async def user():
+        for _ in range(rounds):
+            started = time.perf_counter()
+            status = await call(app, path, session_key)
+            assert status == 200, f"{path} returned {status}"
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per LLM call")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        setup(workdir)
+
+        from django.contrib.sessions.backends.db import SessionStore
+        from django.core.asgi import get_asgi_application
+        from django.urls import clear_url_caches, path
+
+        from LINKEDIN import urls
+        from PROJECT import fakes, views
+
+        urls.urlpatterns.append(path("bench/sync-ai-analysis/", sync_ai_analysis))
+        clear_url_caches()
+
+        views.services.override("openai", fakes.FakeOpenAI(args.latency))
+        views.services.override("gemini", fakes.FakeGemini(args.latency))
+        views.async_clients = lambda: views.AsyncClients(
+            openai=fakes.FakeAsyncOpenAI(args.latency),
+            gemini=fakes.FakeAsyncGemini(args.latency),
+        )
+
+        api = fakes.FakeLinkedin()
+        session = SessionStore()
+        views.session_payloads.set(
+            session,
+            "linkedin_data",
+            {
+                "profile": api.get_profile("jane-doe"),
+                "contact": api.get_profile_contact_info("jane-doe"),
+                "username": "jane-doe",
+            },
+        )
+        session.save()
+
+        app = get_asgi_application()
+        routes = {"sync": "/bench/sync-ai-analysis/", "async": "/api/get-ai-analysis/"}
+        for concurrency in args.concurrency:
+            for mode, route in routes.items():
+                req_s, p50, p95 = asyncio.run(
+                    run(app, route, session.session_key, concurrency, args.rounds)
+                )
+                print(
+                    f"concurrency={concurrency:<3} {mode:<5} {req_s:7.2f} req/s  "
+                    f"p50={p50 * 1000:7.0f}ms  p95={p95 * 1000:7.0f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Report what importing the views costs a worker, and what each lazy service adds.
+
+Runs fresh interpreters so nothing is already imported:
+
+- ``python -X importtime`` over ``django.setup()`` + ``import PROJECT.views``,
+  listing the slowest packages by cumulative import time;
+- peak RSS after importing the views, then after loading each registered
+  service on its own (the cost a request pays the first time it needs it).
+
+Write the numbers with ``--output`` and compare a later run with
+``--baseline`` to catch regressions in worker boot time and memory.
+
+    python -m benchmarks.import_cost --output import_cost.json
+    python -m benchmarks.import_cost --baseline import_cost.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PRELUDE = """
+import os, resource, sys, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "LINKEDIN.settings")
+import django
+django.setup()
+started = time.perf_counter()
+import PROJECT.views as views
+views_s = time.perf_counter() - started
+"""
+
+MEASURE = PRELUDE + """
+import json
+name = sys.argv[1]
+started = time.perf_counter()
+if name:
+    views.services.get(name)
+print(json.dumps({
+    "views_import_ms": views_s * 1000,
+    "service_ms": (time.perf_counter() - started) * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "services": sorted(views.services.stats()["registered"]),
+}))
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    # Config is only validated when a client is built; give it something to build with
+    for name in ("LINKEDIN_EMAIL", "LINKEDIN_PASSWORD", "OPENAI_API_KEY", "GEMINI_API_KEY"):
+        env.setdefault(name, "import-cost")
+    return env
+
+
+def measure(service=""):
+    out = subprocess.run(
+        [sys.executable, "-c", MEASURE, service],
+        cwd=ROOT, env=_env(), capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def import_times(top):
+    """Slowest top-level packages from ``-X importtime`` (cumulative, ms)"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PRELUDE],
+        cwd=ROOT, env=_env(), capture_output=True, text=True, check=True,
+    ).stderr
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue
+        # Only top-level packages (no leading nesting), summed across submodule loads
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(cumulative) / 1000
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", help="write the report as JSON")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    args = parser.parse_args()
+
+    base = measure()
+    report = {
+        "views_import_ms": round(base["views_import_ms"], 1),
+        "rss_mb": round(base["rss_mb"], 1),
+        "import_time_ms": {name: round(ms, 1) for name, ms in import_times(args.top)},
+        "services": {},
+    }
+    for service in base["services"]:
+        loaded = measure(service)
+        report["services"][service] = {
+            "load_ms": round(loaded["service_ms"], 1),
+            "rss_mb": round(loaded["rss_mb"] - base["rss_mb"], 1),
+        }
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    def delta(value, previous):
+        return f" ({value - previous:+.1f})" if previous is not None else ""
+
+    print(
+        f"import PROJECT.views: {report['views_import_ms']:.1f}ms"
+        f"{delta(report['views_import_ms'], baseline.get('views_import_ms'))}, "
+        f"peak RSS {report['rss_mb']:.1f}MB{delta(report['rss_mb'], baseline.get('rss_mb'))}"
+    )
+    print("\nslowest packages at boot (cumulative import time):")
+    for name, ms in report["import_time_ms"].items():
+        print(f"  {name:<24} {ms:8.1f}ms")
+    print("\nfirst use of each lazy service:")
+    for name, cost in report["services"].items():
+        previous = baseline.get("services", {}).get(name, {})
+        print(
+            f"  {name:<14} {cost['load_ms']:8.1f}ms{delta(cost['load_ms'], previous.get('load_ms'))}"
+            f"  {cost['rss_mb']:+.1f}MB RSS{delta(cost['rss_mb'], previous.get('rss_mb'))}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
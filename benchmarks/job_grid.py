@@ -0,0 +1,86 @@
+"""
+Benchmark the title x location job search fan-out against FakeJobBoards.
+
+Compares searching every recommended (title, location) pair one after
+another with jobs.fetch_job_grid, which runs a bounded number of searches
+at once and merges them into one deduplicated, ranked list.
+
+    python -m benchmarks.job_grid --titles 3 --locations 2 --concurrency 3
+"""
+
+import argparse
+import time
+
+from django.conf import settings
+
+from PROJECT import jobs
+from PROJECT.fakes import FakeJobBoards
+
+TITLES = ["Software Engineer", "Backend Developer", "Python Developer", "Data Engineer"]
+LOCATIONS = ["Jaipur, IN", "Bengaluru, IN", "Remote"]
+DOMAINS = [
+    {"domain": "Software", "relevance_score": 90},
+    {"domain": "Data", "relevance_score": 60},
+]
+
+
+def make_fetcher(boards, deadline):
+    """fetch_jobs without the job store: scrape every board, return records"""
+
+    def fetch(search_term, location="", deadline=deadline, **kwargs):
+        search = {
+            "site_name": jobs.SITES,
+            "search_term": search_term,
+            "location": location,
+            "results_wanted": 10,
+        }
+        frame, _ = jobs.scrape_sites(search, deadline, scraper=boards)
+        return {"jobs": jobs._jobs_to_records(frame)}
+
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--titles", type=int, default=3)
+    parser.add_argument("--locations", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--deadline", type=float, default=5.0)
+    args = parser.parse_args()
+
+    settings.configure(JOB_SEARCH={"CONCURRENCY": args.concurrency})
+    boards = FakeJobBoards({"indeed": 0.3, "linkedin": 0.5, "naukri": 0.4})
+    fetch = make_fetcher(boards, args.deadline)
+    titles, locations = TITLES[: args.titles], LOCATIONS[: args.locations]
+
+    started = time.perf_counter()
+    sequential = [
+        job
+        for title in titles
+        for location in locations
+        for job in fetch(title, location=location)["jobs"]
+    ]
+    sequential_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    grid = jobs.fetch_job_grid(
+        titles,
+        locations,
+        related_domains=DOMAINS,
+        max_titles=args.titles,
+        max_locations=args.locations,
+        deadline=args.deadline,
+        fetcher=fetch,
+    )
+    grid_s = time.perf_counter() - started
+
+    searches = len(titles) * len(locations)
+    print(
+        f"{searches} searches | sequential: {sequential_s:5.2f}s {len(sequential):4d} jobs | "
+        f"fan-out: {grid_s:5.2f}s {len(grid['jobs']):4d} unique jobs "
+        f"pending={len(grid['pending_searches'])}"
+    )
+
+
+if __name__ == "__main__":
+    main()
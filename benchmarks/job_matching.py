@@ -0,0 +1,64 @@
+"""
+Benchmark matching scraped jobs against a profile with JobMatcher.
+
+Builds listings by repeating the checked-in Jaipur CSV (with unique ids) and
+times ranking them against a FakeLinkedin profile: cold (every posting
+vectorized), warm from the on-disk index (fresh process), and warm in memory.
+
+    python -m benchmarks.job_matching --sizes 50 200 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from PROJECT import jobs
+from PROJECT.fakes import JOBS_CSV, FakeLinkedin
+from PROJECT.job_matching import JobMatcher, profile_document
+
+
+def listings(size):
+    frame = pd.read_csv(JOBS_CSV)
+    frame = pd.concat([frame] * (size // len(frame) + 1), ignore_index=True).head(size)
+    frame["id"] = [f"job-{i}" for i in range(size)]
+    frame["job_url"] = [f"https://example.com/jobs/{i}" for i in range(size)]
+    return jobs._jobs_to_records(frame)
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 1000])
+    args = parser.parse_args()
+
+    api = FakeLinkedin()
+    document = profile_document(
+        {"username": "jane-doe", "profile": api.get_profile("jane-doe")}
+    )
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            path = os.path.join(workdir, f"vectors_{size}.sqlite3")
+            job_list = listings(size)
+            ranked, cold_ms = timed(lambda: JobMatcher(path).rank(document, job_list))
+            _, disk_ms = timed(lambda: JobMatcher(path).rank(document, job_list))
+            matcher = JobMatcher(path)
+            matcher.rank(document, job_list)
+            _, memory_ms = timed(lambda: matcher.rank(document, job_list))
+            print(
+                f"{size:6d} jobs: cold {cold_ms:8.1f}ms | indexed {disk_ms:7.1f}ms | "
+                f"in memory {memory_ms:6.1f}ms | top: {ranked[0]['title'][:40]} "
+                f"({ranked[0]['match_score']})"
+            )
+
+
+if __name__ == "__main__":
+    main()
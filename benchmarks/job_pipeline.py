@@ -0,0 +1,76 @@
+"""
+Time from asking Gemini for job recommendations to having the job listings.
+
+Sequential: the recommendations JSON streams in completely, then
+build_job_listings_payload runs the title x location searches. Pipelined
+(JOB_SEARCH["PREFETCH"]): the searches start as soon as JOB_TITLES and
+LOCATIONS have streamed in, and build_job_listings_payload joins them.
+Gemini is FakeGemini (``--llm-latency`` spread over the stream) and the
+boards are FakeJobBoards; each run uses fresh titles so the job store is
+cold.
+
+    python -m benchmarks.job_pipeline --llm-latency 2 --board-latency 1.5
+"""
+
+import argparse
+import copy
+import tempfile
+import time
+
+from .async_views import setup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--llm-latency", type=float, default=2.0, help="seconds to stream the JSON")
+    parser.add_argument("--board-latency", type=float, default=1.5, help="seconds per job board scrape")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        setup(workdir)
+
+        from django.conf import settings
+
+        from PROJECT import fakes, views
+
+        gemini = fakes.FakeGemini(args.llm_latency)
+        recorded = gemini.recommendations
+        views.services.override("gemini", gemini)
+        board_latency = {site: args.board_latency for site in views.services.jobs.SITES}
+        views.services.jobs.scrape_jobs = fakes.FakeJobBoards(board_latency)
+        views.llm_cache.enabled = False
+
+        totals = {}
+        for run in range(args.runs):
+            for mode, prefetch in (("sequential", False), ("pipelined", True)):
+                recommendations = copy.deepcopy(recorded)
+                recommendations["JOB_TITLES"] = [
+                    f"{title} {mode} {run}" for title in recorded["JOB_TITLES"]
+                ]
+                gemini.recommendations = recommendations
+                settings.JOB_SEARCH["PREFETCH"] = prefetch
+
+                started = time.perf_counter()
+                result = views.LinkedInAnalyzerService.generate_job_recommendations(
+                    {"name": "Jane Doe"}
+                )
+                streamed = time.perf_counter() - started
+                listings = views.build_job_listings_payload(result)
+                elapsed = time.perf_counter() - started
+                totals.setdefault(mode, []).append(elapsed)
+                print(
+                    f"run {run} {mode:<10} json: {streamed:5.2f}s  listings: {elapsed:5.2f}s "
+                    f"({listings['count']} jobs)"
+                )
+
+        sequential = sum(totals["sequential"]) / args.runs
+        pipelined = sum(totals["pipelined"]) / args.runs
+        print(
+            f"\nmean time to listings: sequential {sequential:5.2f}s, "
+            f"pipelined {pipelined:5.2f}s ({1 - pipelined / sequential:.0%} less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
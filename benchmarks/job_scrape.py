@@ -0,0 +1,60 @@
+"""
+Benchmark per-board parallel scraping with a deadline against FakeJobBoards.
+
+Compares one scrape_jobs call over every board (latency of the slowest
+board, one failure sinks the call) with jobs.scrape_sites, which returns
+whatever boards finished within the deadline.
+
+    python -m benchmarks.job_scrape --deadline 2 --slow 5
+"""
+
+import argparse
+import time
+
+from PROJECT import jobs
+from PROJECT.fakes import FakeJobBoards
+
+SEARCH = {
+    "site_name": jobs.SITES,
+    "search_term": "software engineer",
+    "location": "Jaipur, IN",
+    "results_wanted": 10,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--deadline", type=float, default=2.0)
+    parser.add_argument("--slow", type=float, default=5.0, help="latency of the slowest board")
+    args = parser.parse_args()
+
+    scenarios = {
+        "all fast": FakeJobBoards({"indeed": 0.3, "linkedin": 0.5, "naukri": 0.4}),
+        "one slow": FakeJobBoards({"indeed": 0.3, "linkedin": 0.5, "naukri": args.slow}),
+        "one failing": FakeJobBoards(
+            {"indeed": 0.3, "linkedin": 0.5, "naukri": 0.4}, failing=("indeed",)
+        ),
+    }
+    budgets = {site: {"timeout": args.deadline} for site in jobs.SITES}
+
+    for name, boards in scenarios.items():
+        started = time.perf_counter()
+        try:
+            single = len(boards(**SEARCH))
+        except Exception:
+            single = 0
+        single_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        frame, status = jobs.scrape_sites(SEARCH, args.deadline, scraper=boards, budgets=budgets)
+        parallel_s = time.perf_counter() - started
+
+        print(
+            f"{name:<12} single call: {single_s:5.2f}s {single:3d} jobs | "
+            f"per board: {parallel_s:5.2f}s {len(frame):3d} jobs "
+            f"pending={status['pending']} failed={list(status['failed'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark turning scraped job frames into API records.
+
+Compares the old per-row iterrows() loop with the column-wise
+jobs._jobs_to_records over the checked-in Jaipur CSV and larger synthetic
+frames built by repeating it.
+
+    python -m benchmarks.jobs_to_records --sizes 1000 10000 100000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from PROJECT import jobs
+from PROJECT.fakes import JOBS_CSV
+
+
+def iterrows_records(frame):
+    """The conversion fetch_jobs used before, kept here as the baseline"""
+    job_summary = []
+    for idx, job in frame.head(len(frame)).iterrows():
+        job_info = {
+            "id": str(job.get('id', '')) if pd.notna(job.get('id')) else '',
+            "title": str(job.get('title', 'N/A')),
+            "company": str(job.get('company', 'N/A')),
+            "location": str(job.get('location', 'N/A')),
+            "salary": str(job.get('min_amount', 'N/A')) if pd.notna(job.get('min_amount')) else 'N/A',
+            "job_url": str(job.get('job_url', 'N/A')),
+            "site": str(job.get('site', 'N/A')),
+            "date_posted": str(job.get('date_posted', 'N/A')),
+            "description": str(job.get('description', 'N/A'))[:500] + "..." if pd.notna(job.get('description')) else 'N/A'
+        }
+        job_summary.append(job_info)
+    return job_summary
+
+
+def timed(fn, frame, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(frame)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    base = pd.read_csv(JOBS_CSV)
+    frames = [("jaipur csv", base)]
+    for size in args.sizes:
+        repeats = -(-size // len(base))
+        frames.append((f"{size} rows", pd.concat([base] * repeats, ignore_index=True).head(size)))
+
+    for name, frame in frames:
+        old = timed(iterrows_records, frame, args.repeat)
+        new = timed(jobs._jobs_to_records, frame, args.repeat)
+        print(
+            f"{name:<12} iterrows={old * 1000:9.1f}ms  column-wise={new * 1000:8.1f}ms  "
+            f"speedup={old / new:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Offline load test of the whole user flow against one ASGI worker.
+
+Every upstream is a deterministic stand-in from PROJECT.fakes: FakeLinkedin
+behind the session pool, FakeOpenAI/FakeGemini (sync and async) answering
+with the recorded recommendations fixture, and FakeJobBoards serving the
+checked-in Jaipur CSV. Each has its own injected latency, so numbers are
+reproducible without network access or API keys.
+
+N virtual users each walk the flow with their own session:
+
+    GET / -> POST / -> GET /resume/ -> GET /api/get-ai-analysis/
+    -> GET /api/stream-ai-analysis/ -> GET /api/get-job-listings/
+    -> POST /ats_resume/ -> GET /ats_resume/?download_pdf=1
+
+and the report lists requests/sec and p50/p95/p99 per step. A step counts
+as an error unless it gets the response the flow expects (the redirect to
+/resume/, a successful analysis, a finished stream, a PDF, ...), so a
+200 re-render of a failed form is not a success. The stream step times
+the whole SSE response. Users look up
+``--profiles`` distinct LinkedIn profiles, so lowering it measures the warm
+caches; ``--no-llm-cache`` makes every LLM call pay its latency.
+
+    python -m benchmarks.load_flow --users 1 8 32 --llm-latency 0.5
+    python -m benchmarks.load_flow --users 16 --flows 3 --output flow.json
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode
+
+from .async_views import setup
+
+def redirects_to(location):
+    return lambda status, headers, body: status == 302 and headers.get(b"location") == location.encode()
+
+
+def ok(check=None):
+    return lambda status, headers, body: status == 200 and (check is None or check(body))
+
+
+def analysis_succeeded(body):
+    payload = json.loads(body)
+    return payload["analysis_success_message"] and bool(payload["job_recommendations"])
+
+
+def stream_finished(body):
+    return b"event: done" in body and b"event: analysis_error" not in body
+
+
+# (name, method, path, form, expected response); a response the check
+# rejects counts as an error even when its status is below 400, e.g. the
+# index form re-rendered with an error message instead of redirecting
+STEPS = [
+    ("index", "GET", "/", None, ok()),
+    (
+        "index_submit",
+        "POST",
+        "/",
+        lambda user: {"linkedin_url": f"https://www.linkedin.com/in/{user}/"},
+        redirects_to("/resume/"),
+    ),
+    ("resume", "GET", "/resume/", None, ok()),
+    ("api_get_ai_analysis", "GET", "/api/get-ai-analysis/", None, ok(analysis_succeeded)),
+    ("api_stream_ai_analysis", "GET", "/api/stream-ai-analysis/", None, ok(stream_finished)),
+    (
+        "api_get_job_listings",
+        "GET",
+        "/api/get-job-listings/",
+        None,
+        ok(lambda body: json.loads(body)["count"] > 0),
+    ),
+    (
+        "ats_resume",
+        "POST",
+        "/ats_resume/",
+        lambda user: {"ats_job_desc": "Python developer, Django, REST APIs"},
+        ok(lambda body: b"No resume generated yet." not in body),
+    ),
+    ("ats_resume_pdf", "GET", "/ats_resume/?download_pdf=1", None, ok(lambda body: body.startswith(b"%PDF"))),
+]
+
+
+class Session:
+    """Cookie jar for one virtual user"""
+
+    def __init__(self):
+        self.cookies = {}
+
+    def header(self) -> bytes:
+        return "; ".join(f"{k}={v}" for k, v in self.cookies.items()).encode()
+
+    def update(self, headers):
+        for name, value in headers:
+            if name.lower() == b"set-cookie":
+                cookie = SimpleCookie(value.decode())
+                for key, morsel in cookie.items():
+                    self.cookies[key] = morsel.value
+
+
+async def request(app, session, method, path, form=None):
+    """One request through the ASGI app; returns (status, headers, body bytes)"""
+    path, _, query = path.partition("?")
+    body = urlencode(form).encode() if form else b""
+    headers = [(b"host", b"localhost"), (b"cookie", session.header())]
+    if method == "POST":
+        headers += [
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-csrftoken", session.cookies.get("csrftoken", "").encode()),
+        ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    body_sent = False
+    disconnect = asyncio.Event()
+    status = None
+    response_headers = {}
+    chunks = []
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((name.lower(), value) for name, value in message.get("headers", []))
+            session.update(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    disconnect.set()
+    return status, response_headers, b"".join(chunks)
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def run(app, users, flows, profiles, steps, prefix=""):
+    latencies = {name: [] for name, *_ in steps}
+    errors = {name: 0 for name, *_ in steps}
+
+    async def user(index):
+        for flow in range(flows):
+            session = Session()
+            username = f"{prefix}user{(index * flows + flow) % profiles}-doe"
+            for name, method, path, form, expected in steps:
+                started = time.perf_counter()
+                status, headers, body = await request(
+                    app, session, method, path, form(username) if form else None
+                )
+                latencies[name].append(time.perf_counter() - started)
+                try:
+                    succeeded = expected(status, headers, body)
+                except ValueError:
+                    # Not the JSON the step expects
+                    succeeded = False
+                if not succeeded:
+                    errors[name] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(i) for i in range(users)))
+    elapsed = time.perf_counter() - started
+
+    report = {"users": users, "elapsed_s": round(elapsed, 2), "flows_per_s": round(users * flows / elapsed, 2), "steps": {}}
+    for name, values in latencies.items():
+        values.sort()
+        report["steps"][name] = {
+            "requests": len(values),
+            "errors": errors[name],
+            "req_s": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 1),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--flows", type=int, default=1, help="flows per user, each with a new session")
+    parser.add_argument("--profiles", type=int, default=0, help="distinct profiles (default: one per flow)")
+    parser.add_argument("--linkedin-latency", type=float, default=0.2, help="seconds per LinkedIn call")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="seconds per LLM call")
+    parser.add_argument("--board-latency", type=float, default=0.3, help="seconds per job board scrape")
+    parser.add_argument("--no-llm-cache", action="store_true")
+    parser.add_argument("--no-pdf", action="store_true", help="skip the PDF step (e.g. no WeasyPrint libs)")
+    parser.add_argument("--spans", action="store_true", help="also report p95 per instrumented span")
+    parser.add_argument("--output", help="write the reports as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        setup(workdir)
+
+        from django.core.asgi import get_asgi_application
+
+        from PROJECT import fakes, views
+        from PROJECT.instrumentation import tracer
+
+        views.services.linkedin_pool.client_factory = lambda account: fakes.FakeLinkedin(
+            account.email, account.password, call_latency=args.linkedin_latency
+        )
+        views.services.override("openai", fakes.FakeOpenAI(args.llm_latency))
+        views.services.override("gemini", fakes.FakeGemini(args.llm_latency))
+        views.async_clients = lambda: views.AsyncClients(
+            openai=fakes.FakeAsyncOpenAI(args.llm_latency),
+            gemini=fakes.FakeAsyncGemini(args.llm_latency),
+        )
+        board_latency = {site: args.board_latency for site in views.services.jobs.SITES}
+        views.services.jobs.scrape_jobs = fakes.FakeJobBoards(board_latency)
+        if args.no_llm_cache:
+            views.llm_cache.enabled = False
+        if args.spans:
+            tracer.configure(True, sample_rate=1.0)
+
+        steps = [step for step in STEPS if not (args.no_pdf and step[0] == "ats_resume_pdf")]
+        app = get_asgi_application()
+        reports = []
+        for users in args.users:
+            profiles = args.profiles or users * args.flows
+            tracer.reset()
+            # Profile names are per round, so no round reuses another's cached profiles
+            report = asyncio.run(run(app, users, args.flows, profiles, steps, prefix=f"r{users}"))
+            reports.append(report)
+
+            print(f"\nusers={users} flows/s={report['flows_per_s']} elapsed={report['elapsed_s']}s")
+            print(f"  {'step':<22} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}")
+            for name, step in report["steps"].items():
+                print(
+                    f"  {name:<22} {step['req_s']:7.2f} {step['p50_ms']:7.0f}ms "
+                    f"{step['p95_ms']:7.0f}ms {step['p99_ms']:7.0f}ms {step['errors']:7}"
+                )
+            if args.spans:
+                report["spans"] = tracer.metrics()["histograms"]
+                print(f"  {'span':<56} {'count':>6} {'p95':>8}")
+                for name, histogram in report["spans"].items():
+                    if not name.startswith("request "):
+                        print(f"  {name:<56} {histogram['count']:6} {histogram['p95_ms']:7.0f}ms")
+
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark LinkedIn profile fetching against the offline FakeLinkedin client.
+
+Compares the old flow (sequential get_profile + get_profile_contact_info, one
+upstream fetch per request) with overlapped calls and single-flight
+coalescing when many users submit the same profile at once.
+
+    python -m benchmarks.profile_fetch --users 20 --latency 0.2
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PROJECT.concurrency import SingleFlight
+from PROJECT.fakes import FakeLinkedin
+from PROJECT.linkedin_pool import fetch_profile_bundle
+
+
+def run(users: int, latency: float, overlap: bool, coalesce: bool):
+    FakeLinkedin.reset()
+    api = FakeLinkedin(call_latency=latency)
+    executor = ThreadPoolExecutor(max_workers=users) if overlap else None
+    flights = SingleFlight()
+    latencies = []
+    lock = threading.Lock()
+
+    def fetch():
+        return fetch_profile_bundle(api, "john-doe", executor)
+
+    def request():
+        started = time.perf_counter()
+        if coalesce:
+            flights.do("john-doe", fetch)
+        else:
+            fetch()
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=request) for _ in range(users)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if executor:
+        executor.shutdown()
+
+    latencies.sort()
+    return {
+        "mean_ms": 1000 * sum(latencies) / len(latencies),
+        "max_ms": 1000 * latencies[-1],
+        "upstream_calls": FakeLinkedin.call_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{args.users} concurrent requests, {args.latency * 1000:.0f}ms per upstream call")
+    for label, overlap, coalesce in [
+        ("sequential", False, False),
+        ("overlapped", True, False),
+        ("overlapped+coalesced", True, True),
+    ]:
+        r = run(args.users, args.latency, overlap, coalesce)
+        print(
+            f"{label:<22} mean={r['mean_ms']:7.1f}ms max={r['max_ms']:7.1f}ms "
+            f"upstream_calls={r['upstream_calls']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Tokens and latency per ATS chat edit: whole-document rewrite vs section patch.
+
+Builds a resume with ``--entries`` experience entries and applies a series of
+chat requests to it twice: with ``rewrite_resume_with_chat`` (the whole
+resume goes to Gemini and comes back) and with ``update_resume_with_chat``
+(only the targeted sections plus an outline go out, a JSON patch comes
+back). Gemini is FakeGemini, whose latency grows with the tokens it returns
+(``--token-latency``), so output size shows up as time.
+
+    python -m benchmarks.resume_edits --entries 6 --token-latency 0.004
+"""
+
+import argparse
+import tempfile
+import time
+
+from .async_views import setup
+
+REQUESTS = [
+    "Rewrite my summary to target backend roles",
+    "Add Kubernetes and Terraform to my skills",
+    "Shorten the Example Corp 3 entry to two bullets",
+    "Mention my GPA in education",
+    "Make the whole resume more concise",
+    "Quantify the impact in my Example Corp 1 experience",
+]
+
+
+def build_resume(entries: int) -> str:
+    parts = [
+        "<h1>Jane Doe</h1>\n<p>jane-doe@example.com | Jaipur, IN</p>\n",
+        "<h2>Summary</h2>\n<p>Backend engineer building Python and Django services, "
+        "data pipelines and internal tooling for product teams.</p>\n",
+        "<h2>Experience</h2>\n",
+    ]
+    for i in range(1, entries + 1):
+        bullets = "".join(
+            f"<li>Delivered project {i}.{b}: built and operated Django REST APIs, "
+            f"PostgreSQL schemas and Celery jobs used by {b * 3} teams</li>"
+            for b in range(1, 5)
+        )
+        parts.append(
+            f"<h3>Software Engineer, Example Corp {i}</h3>\n"
+            f"<p>20{10 + i} - 20{11 + i}</p>\n<ul>{bullets}</ul>\n"
+        )
+    parts += [
+        "<h2>Skills</h2>\n<p>Python, Django, SQL, Docker, pandas, Redis, AWS</p>\n",
+        "<h2>Education</h2>\n<p>B.Tech Computer Science, Rajasthan Technical University</p>\n",
+    ]
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=6, help="experience entries in the resume")
+    parser.add_argument("--latency", type=float, default=0.2, help="fixed seconds per Gemini call")
+    parser.add_argument(
+        "--token-latency", type=float, default=0.004, help="extra seconds per output token"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        setup(workdir)
+
+        from PROJECT import fakes, views
+
+        class RecordingGemini(fakes.FakeGemini):
+            def generate_content(self, **kwargs):
+                response = super().generate_content(**kwargs)
+                self.usage.append(response.usage_metadata)
+                return response
+
+        resume = build_resume(args.entries)
+        gemini = RecordingGemini(
+            args.latency, resume_html=resume, token_latency=args.token_latency
+        )
+        gemini.usage = []
+        views.services.override("gemini", gemini)
+        service = views.LinkedInAnalyzerService
+        modes = {
+            "document": service.rewrite_resume_with_chat,
+            "sections": service.update_resume_with_chat,
+        }
+
+        print(f"resume: {len(resume)} chars, {args.entries} experience entries\n")
+        print(f"{'request':<52} {'mode':<9} {'in':>6} {'out':>6} {'time':>8}  targets")
+        totals = {mode: [0, 0, 0.0] for mode in modes}
+        for message in REQUESTS:
+            edit = views.plan_edit(resume, message)
+            for mode, update in modes.items():
+                gemini.usage.clear()
+                started = time.perf_counter()
+                updated = update(resume, message)
+                elapsed = time.perf_counter() - started
+                assert updated, f"{mode} edit failed for {message!r}"
+                tokens_in = sum(u.prompt_token_count for u in gemini.usage)
+                tokens_out = sum(u.candidates_token_count for u in gemini.usage)
+                totals[mode][0] += tokens_in
+                totals[mode][1] += tokens_out
+                totals[mode][2] += elapsed
+                targets = ",".join(edit.targets) if edit and mode == "sections" else "-"
+                print(
+                    f"{message[:52]:<52} {mode:<9} {tokens_in:6} {tokens_out:6} "
+                    f"{elapsed * 1000:6.0f}ms  {targets}"
+                )
+
+        print()
+        for mode, (tokens_in, tokens_out, elapsed) in totals.items():
+            print(
+                f"{mode:<9} per edit: {tokens_in / len(REQUESTS):7.0f} in, "
+                f"{tokens_out / len(REQUESTS):7.0f} out, {elapsed / len(REQUESTS) * 1000:6.0f}ms"
+            )
+        document, sections = totals["document"], totals["sections"]
+        print(
+            f"\nsection edits use {sections[0] / document[0]:.0%} of the input tokens, "
+            f"{sections[1] / document[1]:.0%} of the output tokens and "
+            f"{sections[2] / document[2]:.0%} of the time"
+        )
+
+
+if __name__ == "__main__":
+    main()
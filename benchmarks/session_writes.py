@@ -0,0 +1,189 @@
+"""
+Load-test session storage: full payloads in the session row vs references.
+
+Replays the index -> resume -> ai_analysis -> ats_resume -> chat flow for N
+concurrent users against a SQLite session table shaped like Django's
+``django_session`` (signed, base64 JSON in one row per session). In "inline"
+mode the profile, resume and chat history live in the row, as before; in
+"refs" mode they go through SessionPayloadStore and the row only keeps
+references.
+
+    python -m benchmarks.session_writes --users 16 --profiles 4
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from PROJECT.fakes import FakeLinkedin
+from PROJECT.shared_cache import SharedCache
+from PROJECT.session_store import SessionPayloadStore
+
+SECRET = b"benchmark"
+
+
+class Session(dict):
+    """Just enough of Django's SessionBase to track modifications"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.modified = False
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.modified = True
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.modified = True
+
+
+class SessionTable:
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.conn().execute(
+            "CREATE TABLE IF NOT EXISTS django_session (session_key TEXT PRIMARY KEY, session_data TEXT)"
+        )
+
+    def conn(self):
+        if not hasattr(self.local, "conn"):
+            self.local.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        return self.local.conn
+
+    def load(self, key) -> Session:
+        row = self.conn().execute(
+            "SELECT session_data FROM django_session WHERE session_key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return Session()
+        with self.lock:
+            self.bytes_read += len(row[0])
+        payload, signature = row[0].rsplit(":", 1)
+        expected = hmac.new(SECRET, payload.encode(), hashlib.sha256).hexdigest()
+        assert hmac.compare_digest(signature, expected)
+        return Session(json.loads(base64.b64decode(payload)))
+
+    def save(self, key, session: Session):
+        if not session.modified:
+            return
+        payload = base64.b64encode(json.dumps(session).encode()).decode()
+        signature = hmac.new(SECRET, payload.encode(), hashlib.sha256).hexdigest()
+        data = f"{payload}:{signature}"
+        self.conn().execute(
+            "INSERT OR REPLACE INTO django_session VALUES (?, ?)", (key, data)
+        )
+        with self.lock:
+            self.writes += 1
+            self.bytes_written += len(data)
+
+
+def make_profile(username):
+    api = FakeLinkedin()
+    profile = api.get_profile(username)
+    # Pad to a realistic linkedin_api payload size (~60KB)
+    profile["experience"] = profile["experience"] * 60
+    return {
+        "profile": profile,
+        "contact": api.get_profile_contact_info(username),
+        "username": username,
+    }
+
+
+def run(mode, users, profiles, chat_turns, workdir):
+    table = SessionTable(os.path.join(workdir, f"{mode}_sessions.sqlite3"))
+    payloads = SessionPayloadStore(
+        SharedCache(
+            os.path.join(workdir, f"{mode}_payloads.sqlite3"), table="session_payloads"
+        )
+    )
+    profile_data = [make_profile(f"user-{i}") for i in range(profiles)]
+    latencies = []
+    lock = threading.Lock()
+
+    def get(session, name, default=None):
+        if mode == "inline":
+            return session.get(name, default)
+        return payloads.get(session, name, default)
+
+    def put(session, name, value):
+        if mode == "inline":
+            session[name] = value
+        else:
+            payloads.set(session, name, value)
+
+    def request(key, handler):
+        started = time.perf_counter()
+        session = table.load(key)
+        handler(session)
+        table.save(key, session)
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    def user(n):
+        key = f"session-{n}"
+        linkedin_data = profile_data[n % profiles]
+        request(key, lambda s: put(s, "linkedin_data", linkedin_data))
+        request(key, lambda s: get(s, "linkedin_data"))
+        request(key, lambda s: get(s, "linkedin_data"))
+        request(key, lambda s: put(s, "job_recommendations", {"JOB_TITLES": ["Engineer"]}))
+        request(key, lambda s: put(s, "ats_resume_md", "<h1>Resume</h1>" * 400))
+        for turn in range(chat_turns):
+            def chat(s, turn=turn):
+                get(s, "linkedin_data")
+                put(s, "ats_resume_md", f"<h1>Resume v{turn}</h1>" * 400)
+                history = list(get(s, "ats_chat_history", []))
+                history.append({"type": "user", "message": f"edit {turn}"})
+                put(s, "ats_chat_history", history)
+            request(key, chat)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=user, args=(n,)) for n in range(users)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "elapsed_s": elapsed,
+        "req_per_s": len(latencies) / elapsed,
+        "p95_ms": 1000 * latencies[int(len(latencies) * 0.95)],
+        "session_writes": table.writes,
+        "session_kb_written": table.bytes_written / 1024,
+        "session_kb_read": table.bytes_read / 1024,
+        "payload_store_kb": payloads.store.stats()["bytes"] / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--profiles", type=int, default=4)
+    parser.add_argument("--chat-turns", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in ("inline", "refs"):
+            r = run(mode, args.users, args.profiles, args.chat_turns, workdir)
+            print(
+                f"{mode:<7} {r['req_per_s']:8.1f} req/s  p95={r['p95_ms']:7.2f}ms  "
+                f"writes={r['session_writes']}  session written={r['session_kb_written']:9.1f}KB  "
+                f"read={r['session_kb_read']:9.1f}KB  payload store={r['payload_store_kb']:7.1f}KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
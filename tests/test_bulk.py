@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+
+from PROJECT.bulk import completed_urls, parse_urls, read_urls
+
+JANE = "https://www.linkedin.com/in/jane-doe/"
+JOHN = "https://www.linkedin.com/in/john-doe/"
+
+
+class ParseUrlsTests(unittest.TestCase):
+    def test_csv_with_a_known_header(self):
+        text = f"name,linkedin_url\nJane,{JANE}\nJohn, {JOHN} \nNobody,\n"
+        self.assertEqual(parse_urls(text), [JANE, JOHN])
+
+    def test_csv_header_names_are_case_insensitive(self):
+        self.assertEqual(parse_urls(f"Name,URL\nJane,{JANE}\n"), [JANE])
+
+    def test_csv_without_a_known_header_uses_the_first_column(self):
+        self.assertEqual(parse_urls(f"profile,notes\n{JANE},x\n{JOHN}\n"), [JANE, JOHN])
+        # No header row at all
+        self.assertEqual(parse_urls(f"{JANE},x\n\n{JOHN}\n"), [JANE, JOHN])
+
+    def test_empty_input(self):
+        self.assertEqual(parse_urls(""), [])
+        self.assertEqual(parse_urls("", "jsonl"), [])
+
+    def test_jsonl_objects_and_strings(self):
+        text = "\n".join(
+            [
+                json.dumps({"profile_url": JANE, "name": "Jane"}),
+                "",
+                json.dumps(JOHN),
+                json.dumps({"name": "no url"}),
+            ]
+        )
+        self.assertEqual(parse_urls(text, "jsonl"), [JANE, JOHN])
+
+    def test_malformed_jsonl_raises(self):
+        with self.assertRaises(ValueError):
+            parse_urls('{"url": ', "jsonl")
+
+
+class FileTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = directory.name
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_read_urls_picks_the_format_from_the_extension(self):
+        self.assertEqual(read_urls(self.write("urls.jsonl", json.dumps({"url": JANE}))), [JANE])
+        # Spreadsheet exports often start with a byte order mark
+        self.assertEqual(read_urls(self.write("urls.csv", f"\ufeffurl\n{JOHN}\n")), [JOHN])
+
+    def test_completed_urls_skips_failures_and_torn_lines(self):
+        records = [
+            {"url": JANE, "status": "ok"},
+            {"url": JOHN, "status": "error"},
+            {"url": "not a url", "status": "invalid"},
+        ]
+        path = self.write(
+            "results.jsonl",
+            "".join(json.dumps(r) + "\n" for r in records) + '{"url": "https://www.linkedin.com/in/x',
+        )
+        self.assertEqual(completed_urls(path), {JANE, "not a url"})
+        self.assertEqual(completed_urls(os.path.join(self.dir, "missing.jsonl")), set())
@@ -0,0 +1,51 @@
+import unittest
+
+from PROJECT.chat_history import SUMMARY_REQUESTS, add_turn
+
+
+def chat(requests, max_turns):
+    history = []
+    for request in requests:
+        history = add_turn(history, request, "Resume updated successfully!", max_turns)
+    return history
+
+
+class AddTurnTests(unittest.TestCase):
+    def test_appends_turns_until_the_cap(self):
+        history = chat(["first", "second"], max_turns=3)
+        self.assertEqual(
+            history,
+            [
+                {"type": "user", "message": "first"},
+                {"type": "ai", "message": "Resume updated successfully!"},
+                {"type": "user", "message": "second"},
+                {"type": "ai", "message": "Resume updated successfully!"},
+            ],
+        )
+
+    def test_older_turns_fold_into_one_summary(self):
+        history = chat(["first", "second", "third", "fourth"], max_turns=2)
+        self.assertEqual(len(history), 1 + 2 * 2)
+        summary = history[0]
+        self.assertEqual(summary["type"], "summary")
+        self.assertEqual(summary["turns"], 2)
+        self.assertEqual(summary["message"], "2 earlier edits, most recently: first; second")
+        self.assertEqual([e["message"] for e in history[1::2]], ["third", "fourth"])
+
+    def test_summary_keeps_the_most_recent_requests(self):
+        requests = [f"request {n}" for n in range(SUMMARY_REQUESTS + 4)]
+        summary = chat(requests, max_turns=1)[0]
+        self.assertEqual(summary["turns"], SUMMARY_REQUESTS + 3)
+        self.assertEqual(summary["requests"], requests[3:-1])
+
+    def test_long_requests_are_shortened(self):
+        summary = chat(["x " * 100, "short"], max_turns=1)[0]
+        self.assertEqual(summary["message"], "1 earlier edit, most recently: " + summary["requests"][0])
+        self.assertLessEqual(len(summary["requests"][0]), 80)
+        self.assertTrue(summary["requests"][0].endswith("..."))
+
+    def test_does_not_modify_the_history_passed_in(self):
+        history = chat(["first", "second"], max_turns=1)
+        before = [dict(entry) for entry in history]
+        add_turn(history, "third", "ok", 1)
+        self.assertEqual(history, before)
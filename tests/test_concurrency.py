@@ -0,0 +1,155 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from PROJECT.concurrency import RateLimiter, SingleFlight, Throttle
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_calls_share_one_run(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        runs = []
+        results = []
+
+        def fetch():
+            runs.append(1)
+            release.wait(5)
+            return "profile"
+
+        def caller():
+            results.append(flight.do("jane-doe", fetch))
+
+        threads = [threading.Thread(target=caller) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flight.stats()["followers"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(results, ["profile"] * 5)
+        self.assertEqual(flight.stats(), {"leaders": 1, "followers": 4, "in_flight": 0})
+
+    def test_followers_get_the_leaders_exception(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            release.wait(5)
+            raise ValueError("rate limited")
+
+        def caller():
+            try:
+                flight.do("jane-doe", fetch)
+            except ValueError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flight.stats()["followers"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, ["rate limited"] * 3)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_keys_do_not_coalesce_and_later_calls_run_again(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("a", lambda: 1), 1)
+        self.assertEqual(flight.do("b", lambda: 2), 2)
+        self.assertEqual(flight.do("a", lambda: 3), 3)
+        self.assertEqual(flight.stats()["leaders"], 3)
+        self.assertEqual(flight.stats()["followers"], 0)
+
+
+class FakeClock:
+    """time.monotonic/time.sleep stand-in: sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ("monotonic", "sleep"):
+            patcher = mock.patch(f"PROJECT.concurrency.time.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_spaces_acquisitions_after_the_burst(self):
+        limiter = RateLimiter(per_minute=60, burst=2)
+        self.assertEqual([limiter.acquire() for _ in range(4)], [0.0, 0.0, 1.0, 1.0])
+        self.assertEqual(self.clock.slept, [1.0, 1.0])
+
+    def test_idle_time_refills_up_to_the_burst(self):
+        limiter = RateLimiter(per_minute=60, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now += 10
+        self.assertEqual([limiter.acquire() for _ in range(3)], [0.0, 0.0, 1.0])
+
+    def test_zero_is_unlimited(self):
+        limiter = RateLimiter(per_minute=0)
+        self.assertEqual(sum(limiter.acquire() for _ in range(100)), 0.0)
+        self.assertEqual(self.clock.slept, [])
+
+
+class ThrottleTests(unittest.TestCase):
+    def test_caps_calls_in_flight(self):
+        throttle = Throttle(concurrency=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def call():
+            with throttle:
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                release.wait(5)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while len(peak) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.assertEqual(len(peak), 2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(throttle.stats()["calls"], 5)
+
+    def test_releases_its_slot_when_the_call_fails(self):
+        throttle = Throttle(concurrency=1)
+        with self.assertRaises(RuntimeError):
+            with throttle:
+                raise RuntimeError("upstream down")
+        with throttle:
+            pass
+        self.assertEqual(throttle.stats()["calls"], 2)
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from PROJECT.job_matching import JobMatcher
+
+PROFILE = {"username": "jane-doe", "text": "Python Django backend engineer building REST APIs"}
+JOBS = [
+    # Best search ranking, weaker profile match
+    {"id": "frontend", "title": "Frontend Developer", "description": "React and CSS", "rank_score": 0.9},
+    {"id": "backend", "title": "Python Backend Engineer", "description": "Django REST APIs", "rank_score": 0.2},
+    {"id": "data", "title": "Data Engineer", "description": "Python pipelines", "rank_score": 0.5},
+]
+
+
+class JobMatcherRankTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.matcher = JobMatcher(os.path.join(directory.name, "vectors.sqlite3"))
+
+    def ids(self, jobs):
+        return [job["id"] for job in jobs]
+
+    def test_full_weight_orders_by_match(self):
+        ranked = self.matcher.rank(PROFILE, JOBS)
+        self.assertEqual(ranked[0]["id"], "backend")
+        self.assertEqual(ranked, sorted(ranked, key=lambda job: job["match_score"], reverse=True))
+
+    def test_zero_weight_keeps_the_search_ranking(self):
+        self.assertEqual(self.ids(self.matcher.rank(PROFILE, JOBS, weight=0.0)), ["frontend", "data", "backend"])
+
+    def test_blend_is_a_weighted_sum(self):
+        ranked = self.matcher.rank(PROFILE, JOBS, weight=0.6)
+        best = max(job["match_score"] for job in ranked)
+        for job in ranked:
+            expected = 0.6 * job["match_score"] / best + 0.4 * job["rank_score"]
+            self.assertAlmostEqual(job["score"], expected, places=3)
+        self.assertEqual(ranked, sorted(ranked, key=lambda job: job["score"], reverse=True))
+
+    def test_does_not_modify_the_jobs_passed_in(self):
+        self.matcher.rank(PROFILE, JOBS, weight=0.5)
+        self.assertNotIn("score", JOBS[0])
@@ -0,0 +1,48 @@
+import unittest
+
+from PROJECT.json_stream import JsonFieldStream
+
+DOCUMENT = (
+    '{"JOB_TITLES": ["Dev \\"ops\\" Engineer", "a]b"], "NOTE": "x, {y}", '
+    '"ATS_SCORE": 70, "NESTED": {"a": [1, {"b": 2}]}, "LAST": true}'
+)
+FIELDS = [
+    ("JOB_TITLES", ['Dev "ops" Engineer', "a]b"]),
+    ("NOTE", "x, {y}"),
+    ("ATS_SCORE", 70),
+    ("NESTED", {"a": [1, {"b": 2}]}),
+    ("LAST", True),
+]
+
+
+class JsonFieldStreamTests(unittest.TestCase):
+    def test_whole_document_at_once(self):
+        stream = JsonFieldStream()
+        self.assertEqual(stream.feed(DOCUMENT), FIELDS)
+        self.assertEqual(stream.fields, dict(FIELDS))
+
+    def test_one_character_at_a_time(self):
+        # Splits land inside escapes, strings holding brackets and nested values
+        stream = JsonFieldStream()
+        done = []
+        for char in DOCUMENT:
+            done += stream.feed(char)
+        self.assertEqual(done, FIELDS)
+
+    def test_fields_complete_as_soon_as_their_value_ends(self):
+        stream = JsonFieldStream()
+        self.assertEqual(stream.feed('{"JOB_TITLES": ["Dev", "Q'), [])
+        self.assertEqual(stream.feed('A"], "ATS_SCORE": 7'), [("JOB_TITLES", ["Dev", "QA"])])
+        # A scalar isn't complete until the comma or brace after it
+        self.assertEqual(stream.feed("0"), [])
+        self.assertEqual(stream.feed("}"), [("ATS_SCORE", 70)])
+
+    def test_truncated_stream_keeps_only_completed_fields(self):
+        truncated = DOCUMENT[: DOCUMENT.index('"ATS_SCORE": 70') + len('"ATS_SCORE": 70')]
+        stream = JsonFieldStream()
+        stream.feed(truncated)
+        self.assertEqual(list(stream.fields), ["JOB_TITLES", "NOTE"])
+        self.assertEqual(stream.buffer, truncated)
+
+    def test_escaped_keys(self):
+        self.assertEqual(JsonFieldStream().feed('{"k\\"ey": "v\\\\"}'), [('k"ey', "v\\")])
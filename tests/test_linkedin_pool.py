@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from PROJECT.fakes import FakeLinkedin
+from PROJECT.linkedin_pool import LinkedInAccount, LinkedInSessionPool, parse_accounts
+
+ALICE = LinkedInAccount("alice@example.com", "a")
+BOB = LinkedInAccount("bob@example.com", "b")
+
+
+def expire_cookies(client, expires):
+    """Give a FakeLinkedin the requests session linkedin_api keeps its cookies on"""
+    cookies = [SimpleNamespace(name="li_at", expires=expires), SimpleNamespace(name="lang", expires=None)]
+    client.client = SimpleNamespace(session=SimpleNamespace(cookies=cookies))
+
+
+class LinkedInSessionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.logins = []
+
+        def factory(account):
+            self.logins.append(account)
+            return FakeLinkedin(account.email, account.password)
+
+        self.factory = factory
+
+    def pool(self, accounts=(ALICE,), **kwargs):
+        return LinkedInSessionPool(list(accounts), client_factory=self.factory, **kwargs)
+
+    def test_reuses_a_logged_in_client(self):
+        pool = self.pool()
+        with pool.session() as first:
+            first.get_profile("jane-doe")
+        with pool.session() as second:
+            pass
+        self.assertIs(first, second)
+        stats = pool.stats()
+        self.assertEqual((stats["logins"], stats["hits"], stats["acquisitions"]), (1, 1, 2))
+        self.assertEqual(stats["idle"], 1)
+
+    def test_new_logins_rotate_across_accounts(self):
+        pool = self.pool([ALICE, BOB], max_sessions=3)
+        with pool.session(), pool.session(), pool.session():
+            pass
+        self.assertEqual(self.logins, [ALICE, BOB, ALICE])
+        self.assertEqual(pool.stats()["idle"], 3)
+
+    def test_reauthenticates_when_auth_cookies_expire(self):
+        pool = self.pool()
+        with pool.session() as client:
+            expire_cookies(client, time.time() - 60)
+        with pool.session() as fresh:
+            pass
+        self.assertIsNot(fresh, client)
+        stats = pool.stats()
+        self.assertEqual((stats["logins"], stats["reauths"], stats["hits"]), (2, 1, 0))
+
+    def test_keeps_clients_whose_cookies_are_still_valid(self):
+        pool = self.pool()
+        with pool.session() as client:
+            expire_cookies(client, time.time() + 3600)
+        with pool.session() as again:
+            pass
+        self.assertIs(again, client)
+        self.assertEqual(pool.stats()["reauths"], 0)
+
+    def test_reauthenticates_after_max_age(self):
+        pool = self.pool(max_age=60)
+        with mock.patch("PROJECT.linkedin_pool.time.monotonic", return_value=1000.0):
+            with pool.session() as client:
+                pass
+        with mock.patch("PROJECT.linkedin_pool.time.monotonic", return_value=1061.0):
+            with pool.session() as fresh:
+                pass
+        self.assertIsNot(fresh, client)
+        self.assertEqual(pool.stats()["reauths"], 1)
+
+    def test_discards_a_client_after_an_error(self):
+        pool = self.pool()
+        with self.assertRaises(Exception):
+            with pool.session() as client:
+                client.fail_on.add("jane-doe")
+                client.get_profile("jane-doe")
+        stats = pool.stats()
+        self.assertEqual((stats["discarded"], stats["idle"]), (1, 0))
+        with pool.session() as fresh:
+            pass
+        self.assertIsNot(fresh, client)
+        self.assertEqual(pool.stats()["logins"], 2)
+
+    def test_caps_sessions_and_records_the_wait(self):
+        pool = self.pool(max_sessions=1, acquire_timeout=5)
+        release = threading.Event()
+        checked_out = threading.Event()
+
+        def holder():
+            with pool.session():
+                checked_out.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        checked_out.wait(5)
+        threading.Timer(0.2, release.set).start()
+        with pool.session():
+            pass
+        thread.join(5)
+
+        stats = pool.stats()
+        self.assertEqual(stats["acquisitions"], 2)
+        self.assertGreaterEqual(stats["wait_time_max"], 0.15)
+        self.assertEqual(stats["logins"], 1)
+
+    def test_times_out_when_every_session_is_busy(self):
+        pool = self.pool(max_sessions=1, acquire_timeout=0.05)
+        with pool.session():
+            with self.assertRaises(TimeoutError):
+                with pool.session():
+                    pass
+
+    def test_needs_an_account(self):
+        with self.assertRaises(ValueError):
+            LinkedInSessionPool([])
+
+
+class ParseAccountsTests(unittest.TestCase):
+    def test_primary_login_first_and_duplicates_dropped(self):
+        accounts = parse_accounts(
+            " bob@example.com:b:with:colons , alice@example.com:a,broken,", "alice@example.com", "a"
+        )
+        self.assertEqual(
+            accounts, [ALICE, LinkedInAccount("bob@example.com", "b:with:colons")]
+        )
@@ -0,0 +1,103 @@
+import unittest
+
+from PROJECT.resume_sections import SectionEdit, plan_edit, split_sections
+
+RESUME = """<h1>Jane Doe</h1>
+<p>jane@example.com</p>
+<h2>Summary</h2>
+<p>Backend engineer with eight years of experience building APIs and data pipelines for fintech products.</p>
+<h2>Professional Experience</h2>
+<h3>Senior Engineer, Example Corp</h3>
+<ul><li>Built payment APIs</li><li>Led a team of four</li></ul>
+<h3>Engineer, Acme Labs</h3>
+<ul><li>Maintained the data pipeline</li></ul>
+<h2>Skills</h2>
+<p>Python, Django, PostgreSQL</p>
+<h2>Education</h2>
+<p>B.Tech, Example University</p>
+"""
+
+
+class SplitSectionsTests(unittest.TestCase):
+    def test_sections_and_entries(self):
+        sections = split_sections(RESUME)
+        self.assertEqual(
+            [(s.id, s.kind) for s in sections],
+            [
+                ("header", "header"),
+                ("summary", "summary"),
+                ("experience", "experience"),
+                ("experience-1", "experience"),
+                ("experience-2", "experience"),
+                ("skills", "skills"),
+                ("education", "education"),
+            ],
+        )
+        self.assertEqual(sections[3].title, "Senior Engineer, Example Corp")
+
+    def test_round_trips_byte_for_byte(self):
+        self.assertEqual("".join(s.html for s in split_sections(RESUME)), RESUME)
+
+    def test_without_repeated_headings_is_one_section(self):
+        html = "<h1>Jane Doe</h1><p>Engineer</p>"
+        sections = split_sections(html)
+        self.assertEqual([s.id for s in sections], ["resume"])
+        self.assertEqual(sections[0].html, html)
+
+    def test_duplicate_headings_get_numbered_ids(self):
+        html = "<h2>Skills</h2><p>a</p><h2>Skills</h2><p>b</p>"
+        self.assertEqual([s.id for s in split_sections(html)], ["skills", "skills-2"])
+
+
+class PlanEditTests(unittest.TestCase):
+    def test_targets_section_kind(self):
+        self.assertEqual(plan_edit(RESUME, "Add Kubernetes to my skills").targets, ["skills"])
+        self.assertEqual(plan_edit(RESUME, "update my degree").targets, ["education"])
+
+    def test_named_entry_narrows_to_that_entry(self):
+        self.assertEqual(plan_edit(RESUME, "Example Corp: add metrics").targets, ["experience-1"])
+
+    def test_requests_naming_no_section_edit_the_whole_document(self):
+        self.assertIsNone(plan_edit(RESUME, "make it concise"))
+
+    def test_targets_covering_most_of_the_resume_edit_the_whole_document(self):
+        self.assertIsNone(plan_edit(RESUME, "tighten the summary, experience and skills"))
+
+    def test_single_section_resume_is_never_split(self):
+        self.assertIsNone(plan_edit("<h1>Jane Doe</h1><p>Skills: Python</p>", "add skills"))
+
+
+class SectionEditTests(unittest.TestCase):
+    def setUp(self):
+        self.edit = SectionEdit(split_sections(RESUME), ["skills"])
+
+    def test_outline_and_target_html(self):
+        self.assertIn("- experience-1: Senior Engineer, Example Corp (12 words)", self.edit.outline())
+        self.assertEqual(
+            self.edit.target_html(),
+            '<section id="skills">\n<h2>Skills</h2>\n<p>Python, Django, PostgreSQL</p>\n</section>',
+        )
+
+    def test_apply_replaces_keeping_the_separator(self):
+        patched = self.edit.apply([{"id": "skills", "html": "<h2>Skills</h2>\n<p>Python, Kubernetes</p>  "}])
+        self.assertEqual(
+            patched,
+            RESUME.replace("<p>Python, Django, PostgreSQL</p>", "<p>Python, Kubernetes</p>"),
+        )
+
+    def test_apply_inserts_new_sections_after_the_last_target(self):
+        patched = self.edit.apply([{"id": "languages", "html": "<h2>Languages</h2><p>English</p>"}])
+        self.assertEqual(
+            patched,
+            RESUME.replace(
+                "<h2>Education</h2>", "<h2>Languages</h2><p>English</p>\n<h2>Education</h2>"
+            ),
+        )
+
+    def test_apply_removes_sections_with_empty_html(self):
+        patched = self.edit.apply([{"id": "education", "html": ""}])
+        self.assertNotIn("Education", patched)
+        self.assertTrue(patched.endswith("<p>Python, Django, PostgreSQL</p>\n"))
+
+    def test_apply_ignores_empty_unknown_sections(self):
+        self.assertEqual(self.edit.apply([{"id": "hobbies", "html": "  "}]), RESUME)
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from PROJECT.shared_cache import SharedCache
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def payload(n):
+    """A value that zlib can't shrink much, so entry sizes are predictable"""
+    return {"n": n, "blob": os.urandom(512).hex()}
+
+
+class SharedCacheTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache", "shared.sqlite3")
+        self.clock = Clock()
+        patcher = mock.patch("PROJECT.shared_cache.time.time", self.clock.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def cache(self, **kwargs):
+        return SharedCache(self.path, **kwargs)
+
+    def test_round_trip_and_miss(self):
+        cache = self.cache()
+        cache.set("profile:jane", {"name": "Jane", "skills": ["Python"]})
+        self.assertEqual(cache.get("profile:jane"), ({"name": "Jane", "skills": ["Python"]}, False))
+        self.assertEqual(cache.get("profile:john"), (None, False))
+        self.assertTrue(cache.has("profile:jane"))
+        cache.delete("profile:jane")
+        self.assertFalse(cache.has("profile:jane"))
+
+    def test_shared_between_instances_on_the_same_file(self):
+        self.cache().set("k", [1, 2, 3])
+        self.assertEqual(self.cache().get("k"), ([1, 2, 3], False))
+
+    def test_serves_stale_entries_until_stale_ttl(self):
+        cache = self.cache(ttl=60, stale_ttl=600)
+        cache.set("k", "v")
+        self.clock.advance(61)
+        self.assertEqual(cache.get("k"), ("v", True))
+        self.clock.advance(540)
+        self.assertEqual(cache.get("k"), (None, False))
+
+    def test_only_one_caller_wins_the_refresh_lease(self):
+        cache = self.cache(ttl=60, refresh_lease=120)
+        cache.set("k", "v")
+        self.clock.advance(61)
+
+        wins = []
+        barrier = threading.Barrier(4)
+
+        def claim():
+            barrier.wait()
+            wins.append(self.cache(ttl=60, refresh_lease=120).claim_refresh("k"))
+
+        threads = [threading.Thread(target=claim) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(sorted(wins), [False, False, False, True])
+
+    def test_refresh_lease_expires_and_is_cleared_by_set(self):
+        cache = self.cache(refresh_lease=120)
+        self.assertFalse(cache.claim_refresh("missing"))
+
+        cache.set("k", "v")
+        self.assertTrue(cache.claim_refresh("k"))
+        self.assertFalse(cache.claim_refresh("k"))
+        # The worker that took the lease died; another may take it once it lapses
+        self.clock.advance(121)
+        self.assertTrue(cache.claim_refresh("k"))
+        # A completed refresh writes the entry and releases the lease
+        cache.set("k", "v2")
+        self.assertTrue(cache.claim_refresh("k"))
+
+    def test_evicts_least_recently_used_entries_over_max_bytes(self):
+        values = {key: payload(i) for i, key in enumerate("abcd")}
+        size = len(SharedCache._encode(values["a"]))
+        cache = self.cache(max_bytes=size * 3 + size // 2)
+
+        for key in "abc":
+            cache.set(key, values[key])
+            self.clock.advance(SharedCache.TOUCH_INTERVAL + 1)
+        # Reading "a" makes "b" the least recently used
+        self.assertEqual(cache.get("a")[0], values["a"])
+        self.clock.advance(SharedCache.TOUCH_INTERVAL + 1)
+        cache.set("d", values["d"])
+
+        self.assertEqual([key for key in "abcd" if cache.has(key)], ["a", "c", "d"])
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 3)
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+
+    def test_reads_within_touch_interval_do_not_refresh_recency(self):
+        values = {key: payload(i) for i, key in enumerate("abc")}
+        size = len(SharedCache._encode(values["a"]))
+        cache = self.cache(max_bytes=size * 2 + size // 2)
+
+        cache.set("a", values["a"])
+        self.clock.advance(1)
+        cache.set("b", values["b"])
+        self.clock.advance(1)
+        cache.get("a")
+        cache.set("c", values["c"])
+
+        self.assertFalse(cache.has("a"))
+        self.assertTrue(cache.has("b"))
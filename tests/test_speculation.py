@@ -0,0 +1,104 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from PROJECT.speculation import Speculator
+
+
+def analysis(username, cancelled):
+    return f"analysis for {username}"
+
+
+class SpeculatorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown, wait=True)
+        self.speculator = Speculator(self.executor, ttl=60)
+
+    def test_take_returns_the_finished_result_once(self):
+        self.speculator.start("session", "jane", analysis, "jane")
+        future = self.speculator.take("session", "jane")
+        self.assertEqual(future.result(5), "analysis for jane")
+        self.assertIsNone(self.speculator.take("session", "jane"))
+        stats = self.speculator.stats()
+        self.assertEqual(stats["hits"] + stats["joins"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_take_joins_work_still_running(self):
+        release = threading.Event()
+        self.speculator.start("session", "jane", lambda cancelled: release.wait(5) and "done")
+        future = self.speculator.take("session", "jane")
+        self.assertFalse(future.done())
+        release.set()
+        self.assertEqual(future.result(5), "done")
+        self.assertEqual(self.speculator.stats()["joins"], 1)
+
+    def test_take_for_another_tag_is_a_miss_and_cancels(self):
+        started, release = threading.Event(), threading.Event()
+        seen = {}
+
+        def work(cancelled):
+            started.set()
+            release.wait(5)
+            seen["cancelled"] = cancelled.is_set()
+
+        self.speculator.start("session", "jane", work)
+        started.wait(5)
+        self.assertIsNone(self.speculator.take("session", "john"))
+        release.set()
+        self.executor.shutdown(wait=True)
+        self.assertTrue(seen["cancelled"])
+        self.assertEqual(self.speculator.stats()["misses"], 1)
+
+    def test_expired_speculations_are_dropped(self):
+        with mock.patch("PROJECT.speculation.time.monotonic", return_value=1000.0):
+            self.speculator.start("session", "jane", analysis, "jane")
+        with mock.patch("PROJECT.speculation.time.monotonic", return_value=1059.0):
+            self.assertIsNotNone(self.speculator.take("session", "jane"))
+
+        with mock.patch("PROJECT.speculation.time.monotonic", return_value=2000.0):
+            self.speculator.start("session", "jane", analysis, "jane")
+        with mock.patch("PROJECT.speculation.time.monotonic", return_value=2060.0):
+            self.assertIsNone(self.speculator.take("session", "jane"))
+        self.assertEqual(self.speculator.stats()["expired"], 1)
+
+    def test_failed_speculations_are_not_served(self):
+        def fail(cancelled):
+            raise RuntimeError("upstream down")
+
+        self.speculator.start("session", "jane", fail)
+        self.executor.shutdown(wait=True)
+        self.assertIsNone(self.speculator.take("session", "jane"))
+        self.assertEqual(self.speculator.stats()["failed"], 1)
+
+    def test_start_keeps_a_running_speculation_for_the_same_tag(self):
+        release = threading.Event()
+        self.assertTrue(self.speculator.start("session", "jane", lambda cancelled: release.wait(5)))
+        self.assertFalse(self.speculator.start("session", "jane", analysis, "jane"))
+        self.assertTrue(self.speculator.start("session", "john", analysis, "john"))
+        release.set()
+        self.assertEqual(self.speculator.stats()["cancelled"], 1)
+
+    def test_cancel_sets_the_event(self):
+        started, release = threading.Event(), threading.Event()
+        events = []
+
+        def work(cancelled):
+            events.append(cancelled)
+            started.set()
+            release.wait(5)
+
+        self.speculator.start("session", "jane", work)
+        started.wait(5)
+        self.assertTrue(self.speculator.cancel("session"))
+        self.assertFalse(self.speculator.cancel("session"))
+        release.set()
+        self.executor.shutdown(wait=True)
+        self.assertTrue(events[0].is_set())
+
+    def test_disabled_does_nothing(self):
+        speculator = Speculator(self.executor, enabled=False)
+        self.assertFalse(speculator.start("session", "jane", analysis, "jane"))
+        self.assertIsNone(speculator.take("session", "jane"))
+        self.assertEqual(speculator.stats()["started"], 0)
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from PROJECT.tasks import FAILED, QUEUED, RUNNING, SUCCEEDED, TaskQueue
+
+
+class TaskQueueTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tasks.sqlite3")
+
+    def queue(self, **kwargs):
+        kwargs.setdefault("poll_interval", 0.01)
+        queue = TaskQueue(self.path, **kwargs)
+        # Workers are daemon threads with no stop(); park them before the
+        # temp directory goes away so they don't poll a deleted database
+        self.addCleanup(time.sleep, 0.05)
+        self.addCleanup(setattr, queue, "poll_interval", 3600)
+        return queue
+
+    def wait_for(self, queue, task_id, statuses=(SUCCEEDED, FAILED), timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            task = queue.get(task_id)
+            if task["status"] in statuses:
+                return task
+            time.sleep(0.01)
+        self.fail(f"task {task_id} still {queue.get(task_id)['status']}")
+
+    def insert(self, queue, task_id, kind, status, lease_until=None, updated_at=None):
+        """Write a row the way a process that has since died would have left it"""
+        now = time.time()
+        queue._connection().execute(
+            "INSERT INTO tasks (id, kind, payload, status, run_after, lease_until, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (task_id, kind, '{"n": 2}', status, now, lease_until, now,
+             now if updated_at is None else updated_at),
+        )
+
+    def test_runs_a_task_and_stores_its_result(self):
+        queue = self.queue()
+        queue.register("double", lambda n: {"value": n * 2})
+        task_id = queue.submit("double", owner="session-1", n=21)
+
+        task = self.wait_for(queue, task_id)
+        self.assertEqual(task["status"], SUCCEEDED)
+        self.assertEqual(task["result"], {"value": 42})
+        self.assertEqual((task["owner"], task["attempts"]), ("session-1", 1))
+        self.assertEqual(queue.stats(), {"double": {SUCCEEDED: 1}})
+
+    def test_rejects_unknown_kinds(self):
+        with self.assertRaises(ValueError):
+            self.queue().submit("missing")
+
+    def test_retries_with_exponential_backoff(self):
+        runs = []
+
+        def flaky(n):
+            runs.append(time.monotonic())
+            if len(runs) < 3:
+                raise RuntimeError(f"attempt {len(runs)} failed")
+            return n
+
+        queue = self.queue()
+        queue.register("flaky", flaky, workers=1, max_attempts=3, backoff=0.1)
+        task = self.wait_for(queue, queue.submit("flaky", n=7))
+
+        self.assertEqual((task["status"], task["result"], task["attempts"]), (SUCCEEDED, 7, 3))
+        # Waits backoff, then twice that, before the second and third attempts
+        self.assertGreaterEqual(runs[1] - runs[0], 0.1)
+        self.assertGreaterEqual(runs[2] - runs[1], 0.2)
+
+    def test_gives_up_after_max_attempts(self):
+        def broken(n):
+            raise RuntimeError("still broken")
+
+        queue = self.queue()
+        queue.register("broken", broken, workers=1, max_attempts=2, backoff=0.01)
+        task = self.wait_for(queue, queue.submit("broken", n=1))
+
+        self.assertEqual((task["status"], task["attempts"]), (FAILED, 2))
+        self.assertEqual(task["error"], "still broken")
+
+    def test_reclaims_a_running_task_whose_lease_lapsed(self):
+        queue = self.queue()
+        queue.register("double", lambda n: n * 2)
+        self.insert(queue, "orphaned", "double", RUNNING, lease_until=time.time() - 1)
+        self.insert(queue, "leased", "double", RUNNING, lease_until=time.time() + 60)
+
+        self.assertEqual(queue.resume(), ["double"])
+        task = self.wait_for(queue, "orphaned")
+        self.assertEqual((task["status"], task["result"]), (SUCCEEDED, 4))
+        # Another worker still holds this lease, so it is left alone
+        self.assertEqual(queue.get("leased")["status"], RUNNING)
+
+    def test_resume_picks_up_tasks_queued_before_a_restart(self):
+        before = self.queue()
+        self.insert(before, "queued-1", "double", QUEUED)
+        self.insert(before, "queued-2", "double", QUEUED)
+        self.insert(before, "other", "unregistered", QUEUED)
+
+        after = self.queue()
+        after.register("double", lambda n: n * 2)
+        self.assertEqual(after.resume(), ["double"])
+        for task_id in ("queued-1", "queued-2"):
+            self.assertEqual(self.wait_for(after, task_id)["result"], 4)
+        self.assertEqual(after.get("other")["status"], QUEUED)
+
+    def test_purge_deletes_only_old_finished_tasks(self):
+        queue = self.queue()
+        old = time.time() - 7200
+        self.insert(queue, "old-done", "double", SUCCEEDED, updated_at=old)
+        self.insert(queue, "old-failed", "double", FAILED, updated_at=old)
+        self.insert(queue, "old-queued", "double", QUEUED, updated_at=old)
+        self.insert(queue, "new-done", "double", SUCCEEDED)
+
+        queue.purge(older_than=3600)
+        self.assertIsNone(queue.get("old-done"))
+        self.assertIsNone(queue.get("old-failed"))
+        self.assertIsNotNone(queue.get("old-queued"))
+        self.assertIsNotNone(queue.get("new-done"))
+
+    def test_purges_on_submit_at_most_once_per_interval(self):
+        queue = self.queue(retention=60, purge_interval=3600)
+        queue.register("double", lambda n: n * 2)
+        self.insert(queue, "expired", "double", SUCCEEDED, updated_at=time.time() - 120)
+
+        self.wait_for(queue, queue.submit("double", n=1))
+        self.assertIsNone(queue.get("expired"))
+
+        self.insert(queue, "expired-later", "double", SUCCEEDED, updated_at=time.time() - 120)
+        self.wait_for(queue, queue.submit("double", n=1))
+        self.assertIsNotNone(queue.get("expired-later"))
+
+    def test_limits_concurrency_to_the_worker_count(self):
+        running, peak = 0, 0
+        lock = threading.Lock()
+
+        def slow(n):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return n
+
+        queue = self.queue()
+        queue.register("slow", slow, workers=2)
+        task_ids = [queue.submit("slow", n=i) for i in range(6)]
+        for task_id in task_ids:
+            self.wait_for(queue, task_id)
+        self.assertEqual(peak, 2)